@@ -0,0 +1,245 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Accumulator.py
+# Date: 10/18/2026
+
+# Description: Counts how many times each margin value appears for every variable of one vendor and margin,
+# the mean, standard deviation, median, IQR, histograms and box plots are found from the counts instead of
+# keeping and sorting every sample
+
+# Assumption:
+#   1. Margins are integers, so a count per value is exact and needs memory for the range of values only
+#   2. When the range is wider than ACCUMULATOR_MAX_BINS, neighbouring values are counted together in bins of
+#      2, 4, 8, ... values (sketch), quantiles are then accurate to one bin while mean and SD stay exact
+# ----------------------------------------------
+
+import numpy as np
+
+
+ACCUMULATOR_MAX_BINS = 4096
+
+# largest number of values added to the counts at once
+ACCUMULATOR_CHUNK_SIZE = 1024 * 1024
+
+
+def makeAccumulator(varCount, maxBins=ACCUMULATOR_MAX_BINS):
+    """
+    makeAccumulator starts an accumulator with no rows
+
+    Args:
+        varCount (int): number of variables
+        maxBins (int): largest number of bins per variable before values are counted together
+
+    Returns:
+        dict: contains the first value of the first bin ("low"), number of values per bin ("binWidth", 1 if exact),
+              count of each bin of each variable ("counts", one row per variable), largest number of bins ("maxBins")
+              and the running mean/variance of each variable ("welford", see updateWelford)
+
+    """
+    return {"low": 0, "binWidth": 1, "counts": np.zeros((varCount, 0), dtype=np.int64), "maxBins": maxBins, "welford": None}
+
+
+def addToAccumulator(accumulator, values):
+    """
+    addToAccumulator counts the rows of a margin store, a chunk of rows at a time
+
+    Args:
+        accumulator (dict): accumulator from makeAccumulator
+        values (array): contains data, one row per variable
+
+    Returns:
+        dict: the same accumulator with the rows added
+
+    """
+    varCount = len(accumulator["counts"])
+    chunkSize = max(1, ACCUMULATOR_CHUNK_SIZE // max(1, varCount))
+    for start in range(0, values.shape[1], chunkSize):
+        chunk = values[:, start:start + chunkSize]
+        resizeAccumulator(accumulator, int(chunk.min()), int(chunk.max()))
+
+        # every variable gets its own block of bins
+        binCount = accumulator["counts"].shape[1]
+        bins = (chunk.astype(np.int64) - accumulator["low"]) // accumulator["binWidth"] + (np.arange(varCount) * binCount)[:, None]
+        accumulator["counts"] += np.bincount(bins.ravel(), minlength=varCount * binCount).reshape(varCount, binCount)
+        accumulator["welford"] = updateWelford(accumulator["welford"], chunk)
+    return accumulator
+
+
+def resizeAccumulator(accumulator, low, high):
+    """
+    resizeAccumulator adds bins so that values from low to high can be counted, bins are merged in pairs
+    until there are no more than maxBins
+
+    Args:
+        accumulator (dict): accumulator from makeAccumulator
+        low (int): smallest value to count
+        high (int): largest value to count
+
+    """
+    oldCounts, oldLow, oldWidth = accumulator["counts"], accumulator["low"], accumulator["binWidth"]
+    if oldCounts.shape[1] > 0:
+        if low >= oldLow and high < oldLow + oldCounts.shape[1] * oldWidth:
+            return
+        low = min(low, oldLow)
+        high = max(high, oldLow + oldCounts.shape[1] * oldWidth - 1)
+
+    # bins start at multiples of the bin width, so each old bin falls into one new bin
+    binWidth = oldWidth
+    while high // binWidth - low // binWidth + 1 > accumulator["maxBins"]:
+        binWidth = binWidth * 2
+    newLow = (low // binWidth) * binWidth
+
+    counts = np.zeros((len(oldCounts), high // binWidth - newLow // binWidth + 1), dtype=np.int64)
+    if oldCounts.shape[1] > 0:
+        newBins = (oldLow + np.arange(oldCounts.shape[1]) * oldWidth - newLow) // binWidth
+        np.add.at(counts, (slice(None), newBins), oldCounts)
+
+    accumulator["counts"], accumulator["low"], accumulator["binWidth"] = counts, newLow, binWidth
+
+
+def updateWelford(welford, values):
+    """
+    updateWelford adds a block of rows to the running count, mean and sum of squared differences of every variable,
+    the block is combined with the earlier rows the way Welford's method adds one row
+
+    Args:
+        welford (dict): running statistics from updateWelford, None if there are none yet
+        values (array): contains new data, one row per variable
+
+    Returns:
+        dict: contains the number of rows ("count"), mean ("mean") and sum of squared differences from the mean ("m2")
+              of each variable
+
+    """
+    newCount = values.shape[1]
+    newMean = values.mean(axis=1)
+    newM2 = ((values - newMean[:, None]) ** 2).sum(axis=1)
+    if welford is None or welford["count"] == 0:
+        return {"count": newCount, "mean": newMean, "m2": newM2}
+
+    count = welford["count"] + newCount
+    delta = newMean - welford["mean"]
+    mean = welford["mean"] + delta * newCount / count
+    m2 = welford["m2"] + newM2 + delta ** 2 * welford["count"] * newCount / count
+    return {"count": count, "mean": mean, "m2": m2}
+
+
+def getLevels(accumulator):
+    """
+    getLevels gives the value each bin stands for, the middle of the bin when values are counted together
+
+    Args:
+        accumulator (dict): accumulator from addToAccumulator
+
+    Returns:
+        array: contains value of each bin
+
+    """
+    binWidth = accumulator["binWidth"]
+    levels = accumulator["low"] + np.arange(accumulator["counts"].shape[1]) * binWidth
+    if binWidth == 1:
+        return levels
+    return levels + (binWidth - 1) / 2
+
+
+def getPercentiles(accumulator, percentiles):
+    """
+    getPercentiles finds percentiles of every variable from the counts, with the same linear interpolation
+    between the two nearest rows as np.percentile
+
+    Args:
+        accumulator (dict): accumulator from addToAccumulator
+        percentiles (list): contains percentiles between 0 and 100
+
+    Returns:
+        array: contains one row per percentile and one column per variable
+
+    """
+    levels = getLevels(accumulator)
+    cumulative = accumulator["counts"].cumsum(axis=1)
+    rowCount = accumulator["welford"]["count"]
+
+    results = np.empty((len(percentiles), len(cumulative)))
+    for p in range(0, len(percentiles)):
+        rank = percentiles[p] / 100 * (rowCount - 1)
+        lowRow, highRow = int(np.floor(rank)), int(np.ceil(rank))
+
+        # the value of row k (counting from 0) is in the first bin with more than k rows up to it
+        lowValue = levels[(cumulative <= lowRow).sum(axis=1)]
+        highValue = levels[(cumulative <= highRow).sum(axis=1)]
+        results[p] = lowValue + (highValue - lowValue) * (rank - lowRow)
+    return results
+
+
+def getAccumulatorStats(accumulator):
+    """
+    getAccumulatorStats finds the statistics of every variable from an accumulator
+
+    Args:
+        accumulator (dict): accumulator from addToAccumulator
+
+    Returns:
+        array: contains mean of each variable
+        array: contains median of each variable
+        array: contains standard deviation of each variable
+        array: contains interquartile range of each variable
+
+    """
+    welford = accumulator["welford"]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stdev = np.sqrt(welford["m2"] / (welford["count"] - 1))
+    q75, q50, q25 = getPercentiles(accumulator, [75, 50, 25])
+    return welford["mean"], q50, stdev, q75 - q25
+
+
+def getHistogram(accumulator, var):
+    """
+    getHistogram gives the bins of one variable from its first to its last value
+
+    Args:
+        accumulator (dict): accumulator from addToAccumulator
+        var (int): position of variable
+
+    Returns:
+        array: contains value of each bin
+        array: contains count of each bin
+        array: contains edges of the bins, one more than the bins
+
+    """
+    counts = accumulator["counts"][var]
+    used = np.nonzero(counts)[0]
+    first, last = used[0], used[-1]
+
+    edges = accumulator["low"] + np.arange(first, last + 2) * accumulator["binWidth"]
+    return getLevels(accumulator)[first:last + 1], counts[first:last + 1], edges
+
+
+def getBoxStats(accumulator, var, label, whis=1.5):
+    """
+    getBoxStats finds the box plot of one variable the way matplotlib's boxplot does, for axes.bxp
+
+    Args:
+        accumulator (dict): accumulator from addToAccumulator
+        var (int): position of variable
+        label (str): label of the box
+        whis (float): whiskers reach the furthest value within whis times the IQR of the box
+
+    Returns:
+        dict: contains the box plot statistics used by axes.bxp
+
+    """
+    levels = getLevels(accumulator)
+    counts = accumulator["counts"][var]
+    rowCount = accumulator["welford"]["count"]
+    q3, med, q1 = getPercentiles(accumulator, [75, 50, 25])[:, var]
+    iqr = q3 - q1
+
+    present = counts > 0
+    inHigh = levels[present & (levels <= q3 + whis * iqr)]
+    inLow = levels[present & (levels >= q1 - whis * iqr)]
+    whishi = q3 if len(inHigh) == 0 or inHigh.max() < q3 else inHigh.max()
+    whislo = q1 if len(inLow) == 0 or inLow.min() > q1 else inLow.min()
+
+    outside = present & ((levels < whislo) | (levels > whishi))
+    return {"label": label, "mean": accumulator["welford"]["mean"][var], "iqr": iqr, "med": med, "q1": q1, "q3": q3,
+            "cilo": med - 1.57 * iqr / np.sqrt(rowCount), "cihi": med + 1.57 * iqr / np.sqrt(rowCount),
+            "whislo": whislo, "whishi": whishi, "fliers": np.repeat(levels[outside], counts[outside])}
@@ -0,0 +1,577 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Benchmark.py
+# Date: 10/18/2026
+
+# Description: Measures the speed of DDR5_RMT_Processing.py on a folder of RMT logs, the speed of reading
+# large serial console captures, how long the GUI and the command line take to import before they can start,
+# the time of each phase of a full run on synthetic logs of several sizes (suite), and reading a folder with
+# and without prefetching when each file is slowed down like on a network share
+
+# Usage:
+#   python DDR5_RMT_Benchmark.py <folder with log files>
+#   python DDR5_RMT_Benchmark.py capture <log file> [size in MB, default 500]
+#   python DDR5_RMT_Benchmark.py charts <folder> <folder> ...
+#   python DDR5_RMT_Benchmark.py imports
+#   python DDR5_RMT_Benchmark.py prefetch <folder> [latency in s, default 0.05] [depth, default PREFETCH_DEPTH]
+#   python DDR5_RMT_Benchmark.py suite <results.json> [--scales small medium] [--compare <old results.json>]
+# ----------------------------------------------
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+
+from DDR5_RMT_Processing import (parseLogFile, openLogFile, readLogLines, finishCPUState, processData, getVendorName, readData,
+                                 openCSVExport, closeCSVExport, calculateStats, makeLaneGroups, makeGraphs, runRenderJobs, getSockets,
+                                 getMarginTypes, getMarginList)
+from DDR5_RMT_Synthetic import writeSyntheticLogs
+from DDR5_RMT_Figures import peakMemoryMB
+from DDR5_RMT_Prefetch import PREFETCH_DEPTH, makeLatencyReader
+from DDR5_RMT_Report import openRunReport
+
+
+# sizes of the synthetic logs of the suite, the options of writeSyntheticLogs
+SUITE_SCALES = {"small": {"vendors": 3, "files": 5, "channels": 2, "lanes": 10, "caLanes": 7},
+                "medium": {"vendors": 3, "files": 25, "channels": 4, "lanes": 20, "caLanes": 14},
+                "large": {"vendors": 3, "files": 100, "channels": 8, "lanes": 40, "caLanes": 14}}
+
+SUITE_PHASES = ["parse", "export", "stats", "render"]
+
+# phases slower than the old results by more than this share are reported as regressions
+REGRESSION_LIMIT = 0.1
+
+
+def legacyParseFile(filePath):
+    """
+    legacyParseFile parses a log file the way readData did before parseLogFile, by building one string
+    per CPU and slicing it, used as the reference for parseLogFile
+
+    Args:
+        filePath (str): path of log file
+
+    Returns:
+        dict: CPU number (str) to a dict containing the rows of each margin type and the variable lists
+
+    """
+    file = open(filePath, "r")
+    text = file.readlines()
+    dataCPU0 = ""
+    dataCPU1 = ""
+    recordCPU0Data = False
+    recordCPU1Data = False
+
+    for line in text:
+        if line.find("START_RMT_N0") != -1:
+            recordCPU0Data = True
+        if line.find("STOP_RMT_N0") != -1:
+            recordCPU0Data = False
+        if recordCPU0Data:
+            dataCPU0 = dataCPU0 + line
+        if line.find("START_RMT_N1") != -1:
+            recordCPU1Data = True
+        if line.find("STOP_RMT_N1") != -1:
+            recordCPU1Data = False
+        if recordCPU1Data:
+            dataCPU1 = dataCPU1 + line
+    file.close()
+
+    cpuData = {}
+    for cpuNum, data in (("0", dataCPU0), ("1", dataCPU1)):
+        if data == "":
+            continue
+        rankMargin = data[data.find("Rank Margin"):data.find("Lane Margin")]
+        laneMargin = data[data.find("Lane Margin"):data.find("CA Lane Margin")]
+        caLaneMargin = data[data.find("CA Lane Margin"):]
+
+        rankVarList = rankMargin[rankMargin.find("RxDqs-"):rankMargin.find("\nN" + cpuNum)]
+        caLaneVarList = caLaneMargin[caLaneMargin.find("Ca-"):caLaneMargin.find("\nN" + cpuNum)]
+
+        cpuData[cpuNum] = {"RankMargin": legacySeparateMarginData(rankMargin, cpuNum),
+                           "LaneMargin": legacySeparateMarginData(laneMargin, cpuNum),
+                           "CALaneMargin": legacySeparateMarginData(caLaneMargin, cpuNum),
+                           "RankVarList": list(filter(None, rankVarList.split(" "))),
+                           "CALaneVarList": list(filter(None, caLaneVarList.split(" ")))}
+    return cpuData
+
+
+def legacySeparateMarginData(data, cpuNum):
+    """
+    legacySeparateMarginData separates line of data for each margin the way separateMarginData did
+
+    Args:
+        data (str): all data for one type of margin (e.g. rank, lane)
+        cpuNum (str): CPU number
+
+    Returns:
+        list: contains all lines of data for margin type
+
+    """
+    data = data[data.find("N" + cpuNum):data.rfind("\nIoLevel")]
+    data = data.splitlines()
+    for i in range(0, len(data)):
+        data[i] = list(filter(None, data[i].split(" ")))
+    return data
+
+
+def timeParser(parser, filePaths, repeat):
+    """
+    timeParser runs a parser over all files and keeps the fastest run
+
+    Args:
+        parser (function): parseLogFile or legacyParseFile
+        filePaths (list): contains all file paths
+        repeat (int): number of runs
+
+    Returns:
+        float: fastest run in seconds
+        list: contains the parsed data of each file
+
+    """
+    bestTime = None
+    for run in range(0, repeat):
+        start = time.perf_counter()
+        results = [parser(filePath) for filePath in filePaths]
+        runTime = time.perf_counter() - start
+        if bestTime is None or runTime < bestTime:
+            bestTime = runTime
+    return bestTime, results
+
+
+def benchmarkParser(folderPath, repeat=3):
+    """
+    benchmarkParser compares the throughput (MB/s) of parseLogFile and legacyParseFile on all files in a folder
+    and checks that both give the same output
+
+    Args:
+        folderPath (str): path of folder
+        repeat (int): number of runs of each parser, the fastest is reported
+
+    Returns:
+        dict: contains the size, run time and throughput of each parser
+
+    """
+    filePaths = [os.path.join(folderPath, fileName) for fileName in os.listdir(folderPath)]
+    sizeMB = sum(os.path.getsize(filePath) for filePath in filePaths) / (1024 * 1024)
+
+    legacyTime, legacyResults = timeParser(legacyParseFile, filePaths, repeat)
+    streamTime, streamResults = timeParser(parseLogFile, filePaths, repeat)
+
+    for i in range(0, len(filePaths)):
+        legacyCPUs = {cpuNum: legacyResults[i][cpuNum] for cpuNum in legacyResults[i] if cpuNum in ("0", "1")}
+        streamCPUs = {cpuNum: streamResults[i][cpuNum] for cpuNum in streamResults[i] if cpuNum in ("0", "1")}
+        if legacyCPUs != streamCPUs:
+            raise ValueError("parseLogFile output differs from legacy parser for " + filePaths[i])
+
+    result = {"files": len(filePaths), "sizeMB": round(sizeMB, 3),
+              "legacySeconds": round(legacyTime, 4), "legacyMBps": round(sizeMB / legacyTime, 2),
+              "streamSeconds": round(streamTime, 4), "streamMBps": round(sizeMB / streamTime, 2),
+              "speedup": round(legacyTime / streamTime, 2)}
+
+    print("Parsed", result["files"], "files,", result["sizeMB"], "MB")
+    print("Legacy parser:   ", result["legacyMBps"], "MB/s")
+    print("Streaming parser:", result["streamMBps"], "MB/s")
+    print("Speedup:", result["speedup"], "x")
+    return result
+
+
+def streamParseFile(filePath):
+    """
+    streamParseFile parses a log file line by line without memory mapping it, the way parseLogFile reads
+    files it can not map, used as the reference for parseLogFile
+
+    Args:
+        filePath (str): path of log file
+
+    Returns:
+        dict: CPU number (str) to a dict containing the rows of each margin type and the variable lists
+
+    """
+    logState = {"cpuStates": {}, "recording": []}
+    with openLogFile(filePath) as file:
+        readLogLines(logState, file)
+    return {cpuNum: finishCPUState(logState["cpuStates"][cpuNum]) for cpuNum in logState["cpuStates"]}
+
+
+def makeCapture(capturePath, logPath, sizeMB):
+    """
+    makeCapture writes a serial console capture of about sizeMB, with the RMT log in the middle of 
+    boot messages that are not part of the RMT log
+
+    Args:
+        capturePath (str): path of capture to write
+        logPath (str): path of RMT log file
+        sizeMB (float): size of capture in MB
+
+    """
+    with open(logPath, "r") as file:
+        rmtLog = file.read()
+
+    noise = "".join("[%10.6f] pci 0000:%02x:00.0: BAR %d: assigned [mem 0x%08x-0x%08x 64bit pref]\n" % (line * 0.000137, line % 256, line % 6, line * 4096, line * 4096 + 4095)
+                    for line in range(0, 10000))
+    noiseBlocks = int(sizeMB * 1024 * 1024 / len(noise)) + 1
+
+    with open(capturePath, "w") as file:
+        for block in range(0, noiseBlocks):
+            if block == noiseBlocks // 2:
+                file.write(rmtLog)
+            file.write(noise)
+
+
+def benchmarkCapture(logPath, sizeMB=500, repeat=3):
+    """
+    benchmarkCapture compares the throughput (MB/s) of parseLogFile, which memory maps the file and only
+    reads the RMT log, and the line by line reader on a large capture made from one log file
+
+    Args:
+        logPath (str): path of RMT log file
+        sizeMB (float): size of capture in MB
+        repeat (int): number of runs of each parser, the fastest is reported
+
+    Returns:
+        dict: contains the size, run time and throughput of each parser
+
+    """
+    with tempfile.TemporaryDirectory() as tempDir:
+        capturePath = os.path.join(tempDir, "capture.log")
+        makeCapture(capturePath, logPath, sizeMB)
+        captureMB = os.path.getsize(capturePath) / (1024 * 1024)
+
+        streamTime, streamResults = timeParser(streamParseFile, [capturePath], repeat)
+        mappedTime, mappedResults = timeParser(parseLogFile, [capturePath], repeat)
+
+    if streamResults != mappedResults or mappedResults[0] != parseLogFile(logPath):
+        raise ValueError("parseLogFile output differs from line by line reader for capture of " + logPath)
+
+    result = {"sizeMB": round(captureMB, 3),
+              "streamSeconds": round(streamTime, 4), "streamMBps": round(captureMB / streamTime, 2),
+              "mappedSeconds": round(mappedTime, 4), "mappedMBps": round(captureMB / mappedTime, 2),
+              "speedup": round(streamTime / mappedTime, 2)}
+
+    print("Parsed capture of", result["sizeMB"], "MB")
+    print("Line by line reader:", result["streamMBps"], "MB/s")
+    print("Memory mapped reader:", result["mappedMBps"], "MB/s")
+    print("Speedup:", result["speedup"], "x")
+    return result
+
+
+def benchmarkPrefetch(folderPath, latency=0.05, depth=PREFETCH_DEPTH):
+    """
+    benchmarkPrefetch reads a folder with each file slowed down by latency seconds, once reading each file
+    when it is parsed and once prefetching depth files, and compares the time waiting for files and parsing them
+
+    Args:
+        folderPath (str): path of folder with log files
+        latency (float): seconds waited for each file, like opening a file on a network share
+        depth (int): number of files read ahead of parsing
+
+    Returns:
+        dict: contains the run time, time waiting for files and time parsing of "serial" and "prefetch"
+
+    """
+    folder = os.listdir(folderPath)
+    readFile = makeLatencyReader(latency)
+
+    result = {}
+    allFolderData = {}
+    for name, prefetchDepth in (("serial", 0), ("prefetch", depth)):
+        report = openRunReport()
+        start = time.perf_counter()
+        allFolderData[name] = readData(folder, folderPath, getVendorName(folderPath), report=report, prefetchDepth=prefetchDepth, readFile=readFile)
+        runTime = time.perf_counter() - start
+        result[name] = {"seconds": round(runTime, 3), "waitSeconds": round(report["phases"]["read wait"]["seconds"], 3),
+                        "parseSeconds": round(report["phases"]["read parse"]["seconds"], 3)}
+
+    serialStores, prefetchStores = allFolderData["serial"][0], allFolderData["prefetch"][0]
+    same = list(serialStores) == list(prefetchStores) and all(np.array_equal(serialStores[cpuNum][marginType]["values"], prefetchStores[cpuNum][marginType]["values"])
+                                                             for cpuNum in serialStores for marginType in serialStores[cpuNum])
+    if not same:
+        raise ValueError("prefetched data differs from data read one file at a time for " + folderPath)
+
+    print("Read", len(folder), "files with", latency, "s latency per file")
+    for name in result:
+        print(name.capitalize() + ":", result[name]["seconds"], "s, waiting", result[name]["waitSeconds"], "s, parsing", result[name]["parseSeconds"], "s")
+    print("Speedup:", round(result["serial"]["seconds"] / result["prefetch"]["seconds"], 2), "x with depth", depth)
+    return result
+
+
+def benchmarkCharts(folders):
+    """
+    benchmarkCharts creates the bit margin and average bit margin excel files of the folders with images and
+    with native excel charts, and compares the run time and size of the excel files
+
+    Args:
+        folders (list): contains all folder paths
+
+    Returns:
+        dict: contains the run time and total size of the excel files of "image" and "native"
+
+    """
+    folders = [os.path.abspath(folder) for folder in folders]
+    vendorNames = [getVendorName(folder) for folder in folders]
+    currentDir = os.getcwd()
+
+    result = {}
+    for chartMode in ("image", "native"):
+        with tempfile.TemporaryDirectory() as tempDir:
+            os.chdir(tempDir)
+            try:
+                start = time.perf_counter()
+                processData(folders, vendorNames, "N", "Y", False, False, False, False, True, True, cacheDir=None, csvMode="off", chartMode=chartMode)
+                runTime = time.perf_counter() - start
+            finally:
+                os.chdir(currentDir)
+            excelFiles = [fileName for fileName in os.listdir(tempDir) if fileName.endswith(".xlsx")]
+            sizeMB = sum(os.path.getsize(os.path.join(tempDir, fileName)) for fileName in excelFiles) / (1024 * 1024)
+        result[chartMode] = {"seconds": round(runTime, 3), "files": len(excelFiles), "sizeMB": round(sizeMB, 3)}
+
+    for chartMode in result:
+        print(chartMode.capitalize(), "charts:", result[chartMode]["seconds"], "s,", result[chartMode]["files"], "excel files,", result[chartMode]["sizeMB"], "MB")
+    print("Speedup:", round(result["image"]["seconds"] / result["native"]["seconds"], 2), "x, size", 
+          round(result["native"]["sizeMB"] / result["image"]["sizeMB"] * 100, 1), "% of images")
+    return result
+
+
+def timePhases(folders, outputDir, renderWorkers=1, chartMode="image"):
+    """
+    timePhases runs each phase of processData on the folders and times it, parse reads the logs without CSV files,
+    export is the extra time of reading them with CSV files, stats calculates the statistics and lanes of every
+    margin and render draws and saves every graph and table
+
+    Args:
+        folders (list): contains all folder paths
+        outputDir (str): folder the CSV files, graphs and tables are saved to
+        renderWorkers (int): number of processes rendering graphs and tables
+        chartMode (str): 'image' or 'native', see processData
+
+    Returns:
+        dict: contains the seconds of each phase in SUITE_PHASES
+
+    """
+    vendorNames = [getVendorName(folder) for folder in folders]
+    phases = {}
+    currentDir = os.getcwd()
+    os.chdir(outputDir)
+    try:
+        start = time.perf_counter()
+        allFolderData = [readData(os.listdir(folders[i]), folders[i], vendorNames[i]) for i in range(0, len(folders))]
+        phases["parse"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        csvExport = openCSVExport("truncate")
+        for i in range(0, len(folders)):
+            readData(os.listdir(folders[i]), folders[i], vendorNames[i], csvExport=csvExport)
+        closeCSVExport(csvExport)
+        phases["export"] = max(0.0, time.perf_counter() - start - phases["parse"])
+
+        start = time.perf_counter()
+        allSocketStores = [folderData[0] for folderData in allFolderData]
+        marginTypes = getMarginTypes(getSockets(allSocketStores))
+        allStats = {}
+        for marginType, cpuNum, marginName in marginTypes:
+            allMarginList = getMarginList(allSocketStores, cpuNum, marginName)
+            allAccumulators = calculateStats(allMarginList)[0]
+            allLaneGroups = None
+            if marginName != "RankMargin":
+                allLaneGroups = [makeLaneGroups(marginList) for marginList in allMarginList]
+            allStats[marginType] = (allMarginList, allAccumulators, allLaneGroups)
+        phases["stats"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rankVarList, caLaneVarList = allFolderData[0][1], allFolderData[0][2]
+        renderJobs = []
+        for marginType, cpuNum, marginName in marginTypes:
+            allMarginList, allAccumulators, allLaneGroups = allStats[marginType]
+            variableList = caLaneVarList if "CA Lane" in marginType else rankVarList
+            varNum = len(allMarginList[0]["values"]) + 1
+            renderJobs += makeGraphs(allMarginList, variableList, vendorNames, "Y", "N", marginType, True, True, True, True, True, True, varNum,
+                                     allLaneGroups=allLaneGroups, allAccumulators=allAccumulators, chartMode=chartMode)
+        runRenderJobs(renderJobs, renderWorkers)
+        phases["render"] = time.perf_counter() - start
+    finally:
+        os.chdir(currentDir)
+    return phases
+
+
+def benchmarkSuite(resultPath, scales=None, comparePath=None, renderWorkers=1, chartMode="image"):
+    """
+    benchmarkSuite writes synthetic logs of each scale, times each phase of a run on them and saves the 
+    results to JSON, results can be compared to the JSON of an earlier run
+
+    Args:
+        resultPath (str): path of JSON file the results are saved to
+        scales (list): contains names of scales in SUITE_SCALES, None runs all scales
+        comparePath (str): path of JSON file of an earlier run, None to not compare
+        renderWorkers (int): number of processes rendering graphs and tables
+        chartMode (str): 'image' or 'native', see processData
+
+    Returns:
+        dict: contains the results of each scale
+        list: contains regressions (str) found when comparing
+
+    """
+    if scales is None:
+        scales = list(SUITE_SCALES)
+
+    results = {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+               "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "renderWorkers": renderWorkers, "chartMode": chartMode, "scales": {}}
+
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tempDir:
+            logDir = os.path.join(tempDir, "logs")
+            outputDir = os.path.join(tempDir, "output")
+            os.makedirs(outputDir)
+            folders = writeSyntheticLogs(logDir, **SUITE_SCALES[scale])
+            sizeMB = sum(os.path.getsize(os.path.join(folder, fileName)) for folder in folders for fileName in os.listdir(folder)) / (1024 * 1024)
+
+            phases = timePhases(folders, outputDir, renderWorkers, chartMode)
+
+        results["scales"][scale] = {"options": SUITE_SCALES[scale], "sizeMB": round(sizeMB, 3),
+                                    "seconds": {phase: round(phases[phase], 4) for phase in SUITE_PHASES},
+                                    "totalSeconds": round(sum(phases.values()), 4)}
+        print(scale.capitalize() + ":", round(sizeMB, 1), "MB,", ", ".join(phase + " " + str(round(phases[phase], 3)) + " s" for phase in SUITE_PHASES))
+
+    peakMemory = peakMemoryMB()
+    results["peakMemoryMB"] = None if peakMemory is None else round(peakMemory, 1)
+
+    with open(resultPath, "w") as file:
+        json.dump(results, file, indent=2)
+
+    regressions = []
+    if comparePath is not None:
+        with open(comparePath, "r") as file:
+            oldResults = json.load(file)
+        regressions = compareResults(oldResults, results)
+    return results, regressions
+
+
+def compareResults(oldResults, results):
+    """
+    compareResults prints the time of each phase against an earlier run, phases more than REGRESSION_LIMIT 
+    slower are regressions
+
+    Args:
+        oldResults (dict): results of earlier run from benchmarkSuite
+        results (dict): results of this run from benchmarkSuite
+
+    Returns:
+        list: contains a description (str) of each regression
+
+    """
+    regressions = []
+    for scale in results["scales"]:
+        if not scale in oldResults["scales"]:
+            continue
+        for phase in SUITE_PHASES:
+            oldTime = oldResults["scales"][scale]["seconds"].get(phase)
+            newTime = results["scales"][scale]["seconds"][phase]
+            if not oldTime:
+                continue
+            change = newTime / oldTime - 1
+            print(scale.capitalize(), phase + ":", oldTime, "s ->", newTime, "s (" + ("+" if change >= 0 else "") + str(round(change * 100, 1)) + "%)")
+            if change > REGRESSION_LIMIT:
+                regressions.append(scale + " " + phase + " " + str(round(change * 100, 1)) + "% slower")
+
+    for regression in regressions:
+        print("Regression:", regression)
+    return regressions
+
+
+def parseSuiteArguments(argv):
+    """
+    parseSuiteArguments reads the command line of the suite
+
+    Args:
+        argv (list): contains command line arguments after 'suite'
+
+    Returns:
+        namespace: options of the suite
+
+    """
+    parser = argparse.ArgumentParser(prog="DDR5_RMT_Benchmark.py suite", description="Times each phase of a run on synthetic logs")
+    parser.add_argument("results", help="JSON file the results are saved to")
+    parser.add_argument("--scales", nargs="+", choices=list(SUITE_SCALES), help="scales to run, all if not given")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare to")
+    parser.add_argument("--render-workers", type=int, default=1, help="processes drawing graphs, 0 uses every core")
+    parser.add_argument("--charts", default="image", choices=["image", "native"], help="bit margin excel files with images or native excel charts")
+    return parser.parse_args(argv)
+
+
+def timeImport(moduleName):
+    """
+    timeImport imports a module in a new python process with -X importtime
+
+    Args:
+        moduleName (str): name of module
+
+    Returns:
+        float: wall time of the new process in ms
+        dict: module name to cumulative import time in ms, for every module imported
+
+    """
+    # modules are imported from the folder of this file, without importing them in this process first
+    sourceDir = os.path.dirname(os.path.abspath(__file__))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + moduleName],
+                            cwd=sourceDir, capture_output=True, text=True, check=True)
+    wallTime = (time.perf_counter() - start) * 1000
+
+    # lines look like 'import time:       345 |      12345 |   matplotlib.pyplot'
+    importTimes = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        selfTime, cumulativeTime, name = line[len("import time:"):].split("|")
+        importTimes[name.strip()] = int(cumulativeTime) / 1000
+    return wallTime, importTimes
+
+
+def benchmarkImports(repeat=5):
+    """
+    benchmarkImports measures how long the GUI and the command line take to import, and which heavy 
+    packages each one imports
+
+    Args:
+        repeat (int): number of runs of each import, the fastest is reported
+
+    Returns:
+        dict: contains the wall time, import time and heavy packages of "gui" and "cli"
+
+    """
+    heavyPackages = ["numpy", "matplotlib", "matplotlib.pyplot", "openpyxl", "sklearn", "tkinter"]
+    result = {}
+    for launch, moduleName in (("gui", "DDR5_RMT_GUI"), ("cli", "DDR5_RMT_CLI")):
+        bestWall, bestImport, loaded = None, None, []
+        for run in range(0, repeat):
+            wallTime, importTimes = timeImport(moduleName)
+            if bestWall is None or wallTime < bestWall:
+                bestWall = wallTime
+            if bestImport is None or importTimes[moduleName] < bestImport:
+                bestImport = importTimes[moduleName]
+            loaded = [package for package in heavyPackages if package in importTimes]
+
+        result[launch] = {"wallMs": round(bestWall, 1), "importMs": round(bestImport, 1), "heavyPackages": loaded}
+        print(launch.upper(), "launch:", result[launch]["importMs"], "ms import,", result[launch]["wallMs"], "ms process,",
+              "loads", ", ".join(loaded) if loaded else "no heavy packages")
+    return result
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "imports":
+        benchmarkImports()
+    elif sys.argv[1] == "suite":
+        suiteArgs = parseSuiteArguments(sys.argv[2:])
+        suiteResults, suiteRegressions = benchmarkSuite(suiteArgs.results, suiteArgs.scales, suiteArgs.compare, suiteArgs.render_workers or None, suiteArgs.charts)
+        sys.exit(1 if suiteRegressions else 0)
+    elif sys.argv[1] == "prefetch":
+        benchmarkPrefetch(sys.argv[2], float(sys.argv[3]) if len(sys.argv) > 3 else 0.05, int(sys.argv[4]) if len(sys.argv) > 4 else PREFETCH_DEPTH)
+    elif sys.argv[1] == "charts":
+        benchmarkCharts(sys.argv[2:])
+    elif sys.argv[1] == "capture":
+        benchmarkCapture(sys.argv[2], float(sys.argv[3]) if len(sys.argv) > 3 else 500)
+    else:
+        benchmarkParser(sys.argv[1])
@@ -0,0 +1,310 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_CLI.py
+# Date: 10/18/2026
+
+# Description: Command line version of DDR5_RMT_GUI.py for servers without a display, runs one
+# comparison from the command line or many comparisons from a JSON/TOML manifest in one process
+
+# Usage:
+#   python DDR5_RMT_CLI.py <folder> <folder> ... [--vendors SK Samsung ...] [--output results] [--graphs histogram boxPlot ...]
+#   python DDR5_RMT_CLI.py --manifest jobs.json [--status status.json]
+#   python DDR5_RMT_CLI.py <folder> <folder> ... --watch 60 [--cycles 10] to redraw graphs as new log files arrive
+#   python DDR5_RMT_CLI.py <folder> <folder> ... --report run.json [--profile] [--trace-memory] to see where the time goes
+#   python DDR5_RMT_CLI.py <folder> <folder> ... --violations [--thresholds thresholds.json] [--max-violation-rate 0.01] to gate a qualification
+#   python DDR5_RMT_CLI.py <folder> <folder> ... --database results.db [--run-label BIOS_1.2] to keep the margins for DDR5_RMT_Database.py
+#   python DDR5_RMT_CLI.py --help for all options
+
+# Manifest:
+#   {"defaults": {"output": "results", "workers": 4},
+#    "jobs": [{"name": "EMR 1DPC", "folders": ["logs/Everett_EMR_SK_64GB_1DPC", "logs/Everett_EMR_Micron_64GB_1DPC"]},
+#             {"name": "EMR 2DPC", "folders": [...], "vendors": [...], "output": "results/2dpc", "graphs": ["boxPlot"]}]}
+#   job keys are the keys of JOB_DEFAULTS, relative paths are relative to the manifest
+
+# Assumption:
+#   1. Exit code is 0 if every job passed and 1 if any job failed, each job's status is printed at the end
+#   2. A job with maxViolationRate fails when any variable has more violations than that, see DDR5_RMT_Violations.py
+#   3. A watched job only redraws graphs/tables, a job with watch and an option of WATCH_UNSUPPORTED fails instead of
+#      ignoring the option
+# ----------------------------------------------
+
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+
+# draw off screen, render processes inherit this as well
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from DDR5_RMT_Processing import processData, getVendorName, BOOTSTRAP_REPLICATES, BOOTSTRAP_SEED
+from DDR5_RMT_Cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MB
+from DDR5_RMT_Watch import watchData
+from DDR5_RMT_Report import summarizeRunReport
+from DDR5_RMT_Violations import loadThresholds
+
+
+GRAPH_NAMES = ["histogram", "vendorTable", "boxPlot", "varTable", "bitMargin", "comparator"]
+CHART_MODES = ["image", "native"]
+
+JOB_DEFAULTS = {"name": "job", "folders": [], "vendors": None, "output": ".", "graphs": GRAPH_NAMES,
+                "bootstrap": False, "line": False, "workers": 1, "renderWorkers": None, "csvMode": "truncate",
+                "cacheDir": DEFAULT_CACHE_DIR, "maxCacheMB": DEFAULT_CACHE_MB, "replicates": BOOTSTRAP_REPLICATES, "seed": BOOTSTRAP_SEED,
+                "watch": None, "cycles": None, "charts": "image", "report": None, "profile": False, "traceMemory": False,
+                "prefetch": 0, "thresholds": None, "violations": False, "maxViolationRate": None,
+                "database": None, "runLabel": None}
+
+# job options watchData does not do, with the command line option of each
+WATCH_UNSUPPORTED = {"violations": "--violations", "maxViolationRate": "--max-violation-rate", "database": "--database",
+                     "report": "--report", "profile": "--profile", "traceMemory": "--trace-memory"}
+
+
+def loadManifest(manifestPath):
+    """
+    loadManifest reads all jobs of a JSON or TOML manifest, defaults of the manifest are added to each job
+
+    Args:
+        manifestPath (str): path of manifest, TOML if it ends with .toml
+
+    Returns:
+        list: contains each job (dict)
+
+    """
+    if manifestPath.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            # python before 3.11
+            import tomli as tomllib
+        with open(manifestPath, "rb") as file:
+            manifest = tomllib.load(file)
+    else:
+        with open(manifestPath, "r") as file:
+            manifest = json.load(file)
+
+    # paths in the manifest are relative to the manifest
+    manifestDir = os.path.dirname(os.path.abspath(manifestPath))
+    jobs = []
+    for jobNum, jobOptions in enumerate(manifest.get("jobs", [])):
+        job = dict(JOB_DEFAULTS)
+        job["name"] = "job " + str(jobNum + 1)
+        job.update(manifest.get("defaults", {}))
+        job.update(jobOptions)
+
+        job["folders"] = [os.path.join(manifestDir, folder) for folder in job["folders"]]
+        job["output"] = os.path.join(manifestDir, job["output"])
+        if job["cacheDir"] is not None:
+            job["cacheDir"] = os.path.join(manifestDir, job["cacheDir"])
+        if job["report"] is not None:
+            job["report"] = os.path.join(manifestDir, job["report"])
+        if isinstance(job["thresholds"], str):
+            job["thresholds"] = os.path.join(manifestDir, job["thresholds"])
+        if job["database"] is not None:
+            job["database"] = os.path.join(manifestDir, job["database"])
+        jobs.append(job)
+    return jobs
+
+
+def getWatchConflicts(job):
+    """
+    getWatchConflicts finds the options of a watched job that watchData does not do
+
+    Args:
+        job (dict): contains the options of the job, keys of JOB_DEFAULTS
+
+    Returns:
+        list: contains the job keys of the options, empty if the job is not watched
+
+    """
+    if job.get("watch") is None:
+        return []
+    return [key for key in WATCH_UNSUPPORTED if job.get(key) not in (None, False)]
+
+
+def runJob(job):
+    """
+    runJob runs processData for one job and saves its graphs/tables to the job's output folder, jobs with
+    a watch interval run watchData instead, a job fails when its violation rate is above maxViolationRate
+
+    Args:
+        job (dict): contains the options of the job, keys of JOB_DEFAULTS
+
+    Returns:
+        dict: contains job name ("name"), exit status ("status", 0 if passed, 1 if failed), run time ("seconds"),
+              error message ("error", None if passed) and one line summary of the run report ("summary", None if not run)
+
+    """
+    start = time.perf_counter()
+    currentDir = os.getcwd()
+    status = {"name": job.get("name", "job"), "status": 0, "seconds": 0.0, "error": None, "summary": None}
+
+    try:
+        unknownKeys = [key for key in job if not key in JOB_DEFAULTS]
+        if unknownKeys:
+            raise ValueError("unknown job options: " + ", ".join(unknownKeys))
+
+        folders = [os.path.abspath(folder) for folder in job["folders"]]
+        if not folders:
+            raise ValueError("no folders given")
+        for folder in folders:
+            if not os.path.isdir(folder):
+                raise ValueError("folder not found: " + folder)
+
+        vendorNames = job["vendors"]
+        if vendorNames is None:
+            vendorNames = [getVendorName(folder) for folder in folders]
+        if len(vendorNames) != len(folders):
+            raise ValueError("number of vendors does not match number of folders")
+
+        graphs = GRAPH_NAMES if "all" in job["graphs"] else job["graphs"]
+        unknownGraphs = [graph for graph in graphs if not graph in GRAPH_NAMES]
+        if unknownGraphs:
+            raise ValueError("unknown graphs: " + ", ".join(unknownGraphs))
+        if not job["charts"] in CHART_MODES:
+            raise ValueError("unknown charts: " + str(job["charts"]))
+        watchConflicts = getWatchConflicts(job)
+        if watchConflicts:
+            raise ValueError("watch can not be used with: " + ", ".join(watchConflicts))
+
+        # workers of 0 use every core like None
+        workers = job["workers"] or None
+        renderWorkers = workers if job["renderWorkers"] is None else (job["renderWorkers"] or None)
+        cacheDir = None if job["cacheDir"] is None else os.path.abspath(job["cacheDir"])
+        reportPath = None if job["report"] is None else os.path.abspath(job["report"])
+        databasePath = None if job["database"] is None else os.path.abspath(job["database"])
+
+        # thresholds are a JSON file or, in a manifest, the thresholds themselves
+        thresholds = loadThresholds(job["thresholds"]) if isinstance(job["thresholds"], str) else job["thresholds"]
+        violations = job["violations"] or job["maxViolationRate"] is not None
+
+        # graphs/tables are saved to the current folder
+        os.makedirs(job["output"], exist_ok=True)
+        os.chdir(job["output"])
+
+        print("Running", status["name"] + ":", ", ".join(vendorNames))
+        if job["watch"] is not None:
+            watchData(folders, vendorNames, "Y" if job["bootstrap"] else "N", "Y" if job["line"] else "N",
+                      "histogram" in graphs, "vendorTable" in graphs, "boxPlot" in graphs, "varTable" in graphs,
+                      "bitMargin" in graphs, "comparator" in graphs, job["watch"], job["cycles"], workers, cacheDir=cacheDir,
+                      maxCacheMB=job["maxCacheMB"], csvMode=job["csvMode"], replicates=job["replicates"], seed=job["seed"],
+                      renderWorkers=renderWorkers, chartMode=job["charts"], prefetchDepth=job["prefetch"], thresholds=thresholds)
+        else:
+            savedReport = processData(folders, vendorNames, "Y" if job["bootstrap"] else "N", "Y" if job["line"] else "N",
+                        "histogram" in graphs, "vendorTable" in graphs, "boxPlot" in graphs, "varTable" in graphs,
+                        "bitMargin" in graphs, "comparator" in graphs, workers, cacheDir=cacheDir, maxCacheMB=job["maxCacheMB"],
+                        csvMode=job["csvMode"], replicates=job["replicates"], seed=job["seed"], renderWorkers=renderWorkers,
+                        chartMode=job["charts"], reportPath=reportPath, profile=job["profile"], traceMemory=job["traceMemory"],
+                        prefetchDepth=job["prefetch"], thresholds=thresholds, violations=violations, maxViolationRate=job["maxViolationRate"],
+                        databasePath=databasePath, runLabel=job["runLabel"])
+            status["summary"] = summarizeRunReport(savedReport)
+            if violations and not savedReport["violations"]["passed"]:
+                status["status"] = 1
+                status["error"] = "violation rate " + str(savedReport["violations"]["maxRate"]) + " above " + str(job["maxViolationRate"])
+    except Exception as error:
+        traceback.print_exc()
+        status["status"] = 1
+        status["error"] = type(error).__name__ + ": " + str(error)
+    finally:
+        os.chdir(currentDir)
+
+    status["seconds"] = round(time.perf_counter() - start, 3)
+    return status
+
+
+def parseArguments(argv):
+    """
+    parseArguments reads the command line
+
+    Args:
+        argv (list): contains command line arguments without the program name
+
+    Returns:
+        list: contains each job (dict)
+        str: path of JSON status file, None if not saved
+
+    """
+    parser = argparse.ArgumentParser(description="Creates DDR5 RMT graphs and tables without the GUI")
+    parser.add_argument("folders", nargs="*", help="folders of log files, one per vendor")
+    parser.add_argument("--manifest", help="JSON or TOML file listing many jobs, folders are then not given")
+    parser.add_argument("--name", default=JOB_DEFAULTS["name"], help="name of the job in the status")
+    parser.add_argument("--vendors", nargs="+", help="vendor names, one per folder, taken from the folder names if not given")
+    parser.add_argument("--output", default=JOB_DEFAULTS["output"], help="folder the graphs/tables are saved to")
+    parser.add_argument("--graphs", nargs="+", default=["all"], choices=GRAPH_NAMES + ["all"], help="graphs/tables to create")
+    parser.add_argument("--bootstrap", action="store_true", help="add bootstrap confidence intervals to tables")
+    parser.add_argument("--line", action="store_true", help="include threshold line")
+    parser.add_argument("--charts", default=JOB_DEFAULTS["charts"], choices=CHART_MODES, help="bit margin excel files with images or native excel charts")
+    parser.add_argument("--workers", type=int, default=JOB_DEFAULTS["workers"], help="processes reading log files, 0 uses every core")
+    parser.add_argument("--render-workers", type=int, help="processes drawing graphs, same as --workers if not given")
+    parser.add_argument("--prefetch", type=int, default=JOB_DEFAULTS["prefetch"], help="log files read ahead of parsing, e.g. 8 on network shares, 0 (default) memory maps the log files")
+    parser.add_argument("--csv", default=JOB_DEFAULTS["csvMode"], choices=["truncate", "version", "off"], help="CSV export mode")
+    parser.add_argument("--cache-dir", default=JOB_DEFAULTS["cacheDir"], help="folder of parsed log file cache")
+    parser.add_argument("--no-cache", action="store_true", help="always parse the log files")
+    parser.add_argument("--max-cache-mb", type=float, default=JOB_DEFAULTS["maxCacheMB"], help="largest size of the cache in MB")
+    parser.add_argument("--replicates", type=int, default=JOB_DEFAULTS["replicates"], help="number of bootstrap replicates")
+    parser.add_argument("--seed", type=int, default=JOB_DEFAULTS["seed"], help="seed of bootstrap")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", help="check the folders for new log files every SECONDS and redraw changed graphs")
+    parser.add_argument("--cycles", type=int, help="number of checks with --watch, watches until Ctrl+C if not given")
+    parser.add_argument("--status", help="JSON file the status of each job is saved to")
+    parser.add_argument("--report", help="JSON file the run report (time and work of each phase) is saved to")
+    parser.add_argument("--profile", action="store_true", help="add a cProfile of the run to the report, saved next to it as .prof")
+    parser.add_argument("--trace-memory", action="store_true", help="add tracemalloc peaks and allocation sites to the report")
+    parser.add_argument("--thresholds", help="JSON file of the thresholds of each margin and variable, 6 for all if not given")
+    parser.add_argument("--violations", action="store_true", help="write the samples below the thresholds to Violations.csv and ViolationReport.json")
+    parser.add_argument("--max-violation-rate", type=float, help="fail the job when any variable has a higher violation rate, implies --violations")
+    parser.add_argument("--database", help="SQLite file the margins of the run are added to, see DDR5_RMT_Database.py")
+    parser.add_argument("--run-label", help="name of the run in the database, e.g. BIOS version or test campaign")
+    args = parser.parse_args(argv)
+
+    if args.manifest is not None:
+        if args.folders:
+            parser.error("folders can not be given with --manifest")
+        return loadManifest(args.manifest), args.status
+
+    if not args.folders:
+        parser.error("give folders or --manifest")
+
+    job = {"name": args.name, "folders": args.folders, "vendors": args.vendors, "output": args.output, "graphs": args.graphs,
+           "bootstrap": args.bootstrap, "line": args.line, "workers": args.workers, "renderWorkers": args.render_workers,
+           "csvMode": args.csv, "cacheDir": None if args.no_cache else args.cache_dir, "maxCacheMB": args.max_cache_mb,
+           "replicates": args.replicates, "seed": args.seed, "watch": args.watch, "cycles": args.cycles,
+           "charts": args.charts, "report": args.report, "profile": args.profile, "traceMemory": args.trace_memory,
+           "prefetch": args.prefetch, "thresholds": args.thresholds, "violations": args.violations, "maxViolationRate": args.max_violation_rate,
+           "database": args.database, "runLabel": args.run_label}
+
+    watchConflicts = getWatchConflicts(job)
+    if watchConflicts:
+        parser.error("--watch can not be used with " + ", ".join(WATCH_UNSUPPORTED[key] for key in watchConflicts))
+    return [job], args.status
+
+
+def main(argv=None):
+    """
+    main runs every job and prints the status of each job
+
+    Args:
+        argv (list): contains command line arguments without the program name, None reads sys.argv
+
+    Returns:
+        int: 0 if every job passed, 1 if any job failed
+
+    """
+    jobs, statusPath = parseArguments(sys.argv[1:] if argv is None else argv)
+
+    allStatus = []
+    for job in jobs:
+        allStatus.append(runJob(job))
+
+    print()
+    for status in allStatus:
+        result = "OK" if status["status"] == 0 else "FAILED (" + status["error"] + ")"
+        print(status["name"] + ":", result, "in", status["seconds"], "s")
+
+    if statusPath is not None:
+        with open(statusPath, "w") as file:
+            json.dump(allStatus, file, indent=2)
+
+    return 1 if any(status["status"] != 0 for status in allStatus) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Cache.py
+# Date: 10/18/2026
+
+# Description: Saves the parsed data of each log file to disk, so reruns on the same folders
+# do not have to parse the logs again
+
+# Assumption:
+#   1. A log file has not changed if its path, size and modification time are the same
+#   2. Cache files are only read by the parser version that wrote them
+# ----------------------------------------------
+
+import os
+import hashlib
+import zipfile
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ddr5_rmt_cache")
+DEFAULT_CACHE_MB = 1024
+
+
+def getCachePath(filePath, cacheDir, parserVersion):
+    """
+    getCachePath finds the cache file of a log file, the name changes when the log file changes
+
+    Args:
+        filePath (str): path of log file
+        cacheDir (str): folder of cache files
+        parserVersion (int): version of the parser that reads the log file
+
+    Returns:
+        str: path of cache file
+
+    """
+    fileStat = os.stat(filePath)
+    key = os.path.abspath(filePath) + "|" + str(fileStat.st_size) + "|" + str(fileStat.st_mtime_ns) + "|" + str(parserVersion)
+    return os.path.join(cacheDir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".npz")
+
+
+def saveCachedFile(cachePath, fileData):
+    """
+    saveCachedFile saves the parsed data of one log file as a compressed numpy file
+
+    Args:
+        cachePath (str): path of cache file
+        fileData (dict): parsed data of log file from readLogFile
+
+    """
+    arrays = {}
+    for cpuNum in fileData:
+        for key, value in fileData[cpuNum].items():
+            if key == "CSV":
+                for marginType in value:
+                    arrays[cpuNum + "_CSV_" + marginType] = np.frombuffer(value[marginType].encode("utf-8"), dtype=np.uint8)
+            elif isinstance(value, dict):
+                arrays[cpuNum + "_" + key + "_labels"] = value["labels"]
+                arrays[cpuNum + "_" + key + "_rowKeys"] = value["rowKeys"]
+                arrays[cpuNum + "_" + key + "_values"] = value["values"]
+            else:
+                arrays[cpuNum + "_" + key + "_list"] = np.array(value, dtype=str)
+
+    # write to a temporary file first, so other processes never read a half written cache file
+    tempPath = cachePath + "." + str(os.getpid()) + ".tmp"
+    with open(tempPath, "wb") as file:
+        np.savez_compressed(file, **arrays)
+    os.replace(tempPath, cachePath)
+
+
+def loadCachedFile(cachePath, fileNum):
+    """
+    loadCachedFile loads the parsed data of one log file from its cache file
+
+    Args:
+        cachePath (str): path of cache file
+        fileNum (int): position of file in folder
+
+    Returns:
+        dict: parsed data of log file in the same form as readLogFile, None if the cache file is missing or broken
+
+    """
+    if not os.path.isfile(cachePath):
+        return None
+
+    fileData = {}
+    try:
+        with np.load(cachePath, allow_pickle=False) as arrays:
+            for name in arrays.files:
+                cpuNum, key, field = name.split("_", 2)
+                cpuData = fileData.setdefault(cpuNum, {})
+                if key == "CSV":
+                    cpuData.setdefault("CSV", {})[field] = arrays[name].tobytes().decode("utf-8")
+                elif field == "list":
+                    cpuData[key] = arrays[name].tolist()
+                else:
+                    cpuData.setdefault(key, {})[field] = arrays[name]
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    for cpuNum in fileData:
+        for key, value in fileData[cpuNum].items():
+            if isinstance(value, dict) and "labels" in value:
+                value["fileIndex"] = np.full(len(value["labels"]), fileNum, dtype=np.int32)
+
+    # mark cache file as recently used for trimCache
+    os.utime(cachePath)
+    return fileData
+
+
+def trimCache(cacheDir, maxCacheMB):
+    """
+    trimCache deletes the least recently used cache files until the cache is no larger than maxCacheMB
+
+    Args:
+        cacheDir (str): folder of cache files
+        maxCacheMB (float): largest size of the cache in MB
+
+    Returns:
+        int: number of cache files deleted
+
+    """
+    if not os.path.isdir(cacheDir):
+        return 0
+
+    cacheFiles = []
+    for fileName in os.listdir(cacheDir):
+        if fileName.endswith(".npz"):
+            fileStat = os.stat(os.path.join(cacheDir, fileName))
+            cacheFiles.append((fileStat.st_mtime, fileStat.st_size, fileName))
+    cacheFiles.sort()
+
+    totalSize = sum(cacheFile[1] for cacheFile in cacheFiles)
+    deleted = 0
+    for mtime, size, fileName in cacheFiles:
+        if totalSize <= maxCacheMB * 1024 * 1024:
+            break
+        os.remove(os.path.join(cacheDir, fileName))
+        totalSize = totalSize - size
+        deleted = deleted + 1
+    return deleted
@@ -0,0 +1,250 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Charts.py
+# Date: 10/18/2026
+
+# Description: Writes bit margin and average bit margin graphs to excel as native excel charts, the data of
+# each graph is written to a 'Data' sheet and the charts read it from there, so no images are drawn
+
+# Assumption:
+#   1. Charts are placed like the matplotlib graphs, 2 rows of varNum//2 charts under the graph title
+#   2. Excel draws the charts when the file is opened, so the charts look like excel charts, not like matplotlib
+# ----------------------------------------------
+
+# openpyxl is imported by the functions that write charts
+
+from DDR5_RMT_Violations import DEFAULT_THRESHOLD
+
+# chart size in cm and the sheet rows/columns each chart covers
+CHART_WIDTH = 12
+CHART_HEIGHT = 7.5
+CHART_COLUMNS = 8
+CHART_ROWS = 15
+
+
+def openChartWorkbook():
+    """
+    openChartWorkbook creates an excel workbook with only the 'Data' sheet
+
+    Returns:
+        workbook: excel workbook
+        worksheet: 'Data' sheet the data of every chart is written to
+
+    """
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    dataWs = wb.active
+    dataWs.title = "Data"
+    return wb, dataWs
+
+
+def saveChartWorkbook(wb, fileName):
+    """
+    saveChartWorkbook moves the 'Data' sheet behind the chart sheets and saves the workbook
+
+    Args:
+        wb (workbook): excel workbook from openChartWorkbook
+        fileName (str): name of excel file
+
+    """
+    wb.move_sheet("Data", offset=len(wb.sheetnames) - 1)
+    wb.active = 0
+    wb.save(fileName)
+    wb.close()
+
+
+def writeDataBlock(dataWs, graphTitle, headers, rows):
+    """
+    writeDataBlock writes the data of one graph under the data already on the 'Data' sheet
+
+    Args:
+        dataWs (worksheet): 'Data' sheet
+        graphTitle (str): title of graph, written above the data
+        headers (list): contains the name of each column
+        rows (list): contains the values of each row
+
+    Returns:
+        int: row of the first values
+        int: row of the last values
+
+    """
+    if dataWs.max_row > 1:
+        dataWs.append([])
+    dataWs.append([graphTitle])
+    dataWs.append(headers)
+    firstRow = dataWs.max_row + 1
+    for row in rows:
+        dataWs.append(row)
+    return firstRow, dataWs.max_row
+
+
+def placeChart(ws, chart, graphPos, graphNum, varNum):
+    """
+    placeChart sizes a chart and adds it to the sheet in the position of its matplotlib subplot
+
+    Args:
+        ws (worksheet): sheet of tab
+        chart (chart): excel chart
+        graphPos (int): row of graph title
+        graphNum (int): position of variable, starting at 0
+        varNum (int): number of variables to plot
+
+    """
+    from openpyxl.utils import get_column_letter
+
+    x = 0
+    y = graphNum
+    if graphNum > (varNum//2) - 1:
+        x = 1
+        y = graphNum % (varNum//2)
+
+    chart.width = CHART_WIDTH
+    chart.height = CHART_HEIGHT
+    chart.x_axis.delete = False
+    chart.y_axis.delete = False
+    chart.x_axis.title = "Lane"
+    chart.x_axis.majorGridlines = None
+    ws.add_chart(chart, get_column_letter(y * CHART_COLUMNS + 1) + str(graphPos + 1 + x * CHART_ROWS))
+
+
+def getThresholdColumns(variableList, varNum, thresholdList):
+    """
+    getThresholdColumns gives the threshold columns of the data of one graph, one column if every variable
+    has the same threshold, or one column per variable
+
+    Args:
+        variableList (list): contains all variables
+        varNum (int): number of variables to plot
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+
+    Returns:
+        list: contains header of each threshold column
+        list: contains threshold of each threshold column
+        list: contains the threshold column of each variable, counted from the first threshold column
+
+    """
+    thresholds = [DEFAULT_THRESHOLD if thresholdList is None else thresholdList[graphNum] for graphNum in range(0, varNum - 1)]
+    if len(set(thresholds)) <= 1:
+        return ["Threshold"], thresholds[:1], [0] * (varNum - 1)
+    return ["Threshold " + variable for variable in variableList[:varNum - 1]], thresholds, list(range(0, varNum - 1))
+
+
+def addBitMarginCharts(ws, dataWs, graphTitle, lanes, columns, variableList, includeLine, varNum, graphPos, thresholdList=None):
+    """
+    addBitMarginCharts adds the bit margin graphs (scatter charts) of one graph title to a sheet
+
+    Args:
+        ws (worksheet): sheet of tab
+        dataWs (worksheet): 'Data' sheet
+        graphTitle (str): title of graph
+        lanes (list): contains lane number of each row
+        columns (list): contains the margins of each variable, one value per row
+        variableList (list): contains all variables
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        varNum (int): number of variables to plot
+        graphPos (int): row of graph title
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+
+    Returns:
+        int: row of next graph title
+
+    """
+    from openpyxl.chart import ScatterChart, Reference, Series
+
+    thresholdHeaders, thresholds, thresholdColumns = getThresholdColumns(variableList, varNum, thresholdList)
+    headers = ["Lane"] + variableList[:varNum - 1] + (thresholdHeaders if includeLine == "Y" else [])
+    rows = []
+    for i in range(0, len(lanes)):
+        row = [lanes[i]] + [int(columns[graphNum][i]) for graphNum in range(0, varNum - 1)]
+        rows.append(row + thresholds if includeLine == "Y" else row)
+    firstRow, lastRow = writeDataBlock(dataWs, graphTitle, headers, rows)
+
+    ws.cell(row=graphPos, column=1, value=graphTitle)
+    xValues = Reference(dataWs, min_col=1, min_row=firstRow, max_row=lastRow)
+    for graphNum in range(0, varNum - 1):
+        chart = ScatterChart()
+        chart.title = variableList[graphNum]
+        chart.style = 13
+        chart.legend = None
+
+        series = Series(Reference(dataWs, min_col=graphNum + 2, min_row=firstRow, max_row=lastRow), xValues, title=variableList[graphNum])
+        series.marker.symbol = "circle"
+        series.marker.size = 4
+        series.graphicalProperties.line.noFill = True
+        chart.series.append(series)
+
+        if includeLine == "Y":
+            line = Series(Reference(dataWs, min_col=varNum + 1 + thresholdColumns[graphNum], min_row=firstRow, max_row=lastRow), xValues, title="Threshold")
+            line.marker.symbol = "none"
+            line.graphicalProperties.line.dashStyle = "dash"
+            chart.series.append(line)
+
+        placeChart(ws, chart, graphPos, graphNum, varNum)
+
+    return graphPos + 2 * CHART_ROWS + 2
+
+
+def addComparatorCharts(ws, dataWs, graphTitle, allLanes, allMeans, vendorNames, variableList, includeLine, varNum, graphPos, thresholdList=None):
+    """
+    addComparatorCharts adds the average bit margin graphs (line charts) of one graph title to a sheet,
+    with one line per vendor
+
+    Args:
+        ws (worksheet): sheet of tab
+        dataWs (worksheet): 'Data' sheet
+        graphTitle (str): title of graph
+        allLanes (list): contains lane numbers of each vendor, None if the vendor does not have the graph
+        allMeans (list): contains average of each lane of each vendor, one list per variable
+        vendorNames (list): contains all vendor names
+        variableList (list): contains all variables
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        varNum (int): number of variables to plot
+        graphPos (int): row of graph title
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+
+    Returns:
+        int: row of next graph title
+
+    """
+    from openpyxl.chart import LineChart, Reference, Series
+
+    # vendors without a lane leave a gap in their line
+    vendors = [i for i in range(0, len(vendorNames)) if allLanes[i] is not None]
+    lanes = sorted(set(lane for i in vendors for lane in allLanes[i]))
+    lanePos = [{lane: pos for pos, lane in enumerate(allLanes[i])} if allLanes[i] is not None else None for i in range(0, len(vendorNames))]
+
+    headers = ["Lane"]
+    for graphNum in range(0, varNum - 1):
+        headers += [variableList[graphNum] + " " + vendorNames[i] for i in vendors]
+    thresholdHeaders, thresholds, thresholdColumns = getThresholdColumns(variableList, varNum, thresholdList)
+    thresholdStart = len(headers) + 1
+    if includeLine == "Y":
+        headers += thresholdHeaders
+
+    rows = []
+    for lane in lanes:
+        row = [lane]
+        for graphNum in range(0, varNum - 1):
+            row += [round(allMeans[i][graphNum][lanePos[i][lane]], 2) if lane in lanePos[i] else None for i in vendors]
+        rows.append(row + thresholds if includeLine == "Y" else row)
+    firstRow, lastRow = writeDataBlock(dataWs, graphTitle, headers, rows)
+
+    ws.cell(row=graphPos, column=1, value=graphTitle)
+    for graphNum in range(0, varNum - 1):
+        chart = LineChart()
+        chart.title = variableList[graphNum]
+        chart.style = 12
+        chart.display_blanks = "gap"
+
+        for vendorNum in range(0, len(vendors)):
+            column = 2 + graphNum * len(vendors) + vendorNum
+            chart.series.append(Series(Reference(dataWs, min_col=column, min_row=firstRow, max_row=lastRow), title=vendorNames[vendors[vendorNum]]))
+        if includeLine == "Y":
+            line = Series(Reference(dataWs, min_col=thresholdStart + thresholdColumns[graphNum], min_row=firstRow, max_row=lastRow), title="Threshold")
+            line.graphicalProperties.line.dashStyle = "dash"
+            chart.series.append(line)
+        chart.set_categories(Reference(dataWs, min_col=1, min_row=firstRow, max_row=lastRow))
+
+        placeChart(ws, chart, graphPos, graphNum, varNum)
+
+    return graphPos + 2 * CHART_ROWS + 2
@@ -0,0 +1,206 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Database.py
+# Date: 10/18/2026
+
+# Description: Saves the parsed margins of every run to a SQLite database with the run, vendor and file
+# they came from, so margins of old runs (other BIOS versions or test campaigns) can be compared without
+# parsing their log folders again
+
+# Usage:
+#   python DDR5_RMT_Database.py <database> runs
+#   python DDR5_RMT_Database.py <database> trend RxDqs- [--margin LaneMargin] [--location N1.C3.D0.R1] [--vendor SK]
+
+# Tables:
+#   runs (runId, started, label, parserVersion)
+#   files (fileId, runId, vendor, folder, fileName)
+#   margins (fileId, cpu, margin, socket, channel, dimm, rank, subchannel, lane, strobe, variable, value)
+
+# Assumption:
+#   1. Each run is saved in one transaction, a run that fails while saving leaves nothing in the database
+#   2. Margins are saved as absolute values like the margin stores, one row per sample and variable
+#   3. Fields a row name does not have are -1, like decodeRowKeys
+# ----------------------------------------------
+
+import sys
+import time
+import sqlite3
+import argparse
+import itertools
+
+from DDR5_RMT_Processing import decodeRowKeys, ROW_FIELDS, PARSER_VERSION
+
+
+DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (runId INTEGER PRIMARY KEY, started TEXT, label TEXT, parserVersion INTEGER);
+CREATE TABLE IF NOT EXISTS files (fileId INTEGER PRIMARY KEY, runId INTEGER REFERENCES runs(runId), vendor TEXT, folder TEXT, fileName TEXT);
+CREATE TABLE IF NOT EXISTS margins (fileId INTEGER REFERENCES files(fileId), cpu INTEGER, margin TEXT,
+                                    socket INTEGER, channel INTEGER, dimm INTEGER, rank INTEGER, subchannel INTEGER, lane INTEGER, strobe INTEGER,
+                                    variable TEXT, value INTEGER);
+CREATE INDEX IF NOT EXISTS marginsLocation ON margins (socket, channel, dimm, rank, lane);
+CREATE INDEX IF NOT EXISTS marginsVariable ON margins (margin, variable);
+CREATE INDEX IF NOT EXISTS filesRun ON files (runId, vendor);
+"""
+
+
+def openDatabase(databasePath):
+    """
+    openDatabase opens a results database and creates its tables and indexes if they are missing
+
+    Args:
+        databasePath (str): path of SQLite file
+
+    Returns:
+        Connection: open database
+
+    """
+    connection = sqlite3.connect(databasePath)
+    connection.executescript(DATABASE_SCHEMA)
+    return connection
+
+
+def saveRun(databasePath, folders, vendorNames, allFolders, allSocketStores, rankVarList, caLaneVarList, label=None):
+    """
+    saveRun adds the margins of every vendor of one run to the database in one transaction
+
+    Args:
+        databasePath (str): path of SQLite file
+        folders (list): contains all folder paths
+        vendorNames (list): contains all vendor names
+        allFolders (list): contains the files of each folder, in the order they were read
+        allSocketStores (list): contains margin stores of each vendor by CPU number, from readData
+        rankVarList (list): contains all rank margin variables
+        caLaneVarList (list): contains all CA lane margin variables
+        label (str): name of run to find it by later (e.g. BIOS version or test campaign), None for no name
+
+    Returns:
+        int: number of the run in the database
+        int: number of margin rows saved
+
+    """
+    insertMargin = "INSERT INTO margins VALUES (?, ?, ?, " + ", ".join(["?"] * len(ROW_FIELDS)) + ", ?, ?)"
+    rowCount = 0
+
+    connection = openDatabase(databasePath)
+    try:
+        with connection:
+            cursor = connection.execute("INSERT INTO runs (started, label, parserVersion) VALUES (?, ?, ?)",
+                                        (time.strftime("%Y-%m-%dT%H:%M:%S"), label, PARSER_VERSION))
+            runId = cursor.lastrowid
+
+            for i in range(0, len(folders)):
+                # position of each file in the folder to its number in the database
+                fileIds = []
+                for fileName in allFolders[i]:
+                    cursor = connection.execute("INSERT INTO files (runId, vendor, folder, fileName) VALUES (?, ?, ?, ?)",
+                                                (runId, vendorNames[i], folders[i], fileName))
+                    fileIds.append(cursor.lastrowid)
+
+                for cpuNum, cpuStores in allSocketStores[i].items():
+                    for marginName, store in cpuStores.items():
+                        if len(store["labels"]) == 0:
+                            continue
+                        variableList = caLaneVarList if marginName == "CALaneMargin" else rankVarList
+                        rowFileIds = [fileIds[fileNum] for fileNum in store["fileIndex"].tolist()]
+                        rowKeys = [store["rowKeys"][field].tolist() for field in range(0, len(ROW_FIELDS))]
+
+                        # one batch per variable, every column but the margin is the same for all variables
+                        for varNum in range(0, min(len(variableList), len(store["values"]))):
+                            connection.executemany(insertMargin, zip(rowFileIds, itertools.repeat(int(cpuNum)), itertools.repeat(marginName), *rowKeys,
+                                                                     itertools.repeat(variableList[varNum]), store["values"][varNum].tolist()))
+                            rowCount = rowCount + len(rowFileIds)
+    finally:
+        connection.close()
+    return runId, rowCount
+
+
+def listRuns(databasePath):
+    """
+    listRuns gives every run in the database with its vendors and number of files
+
+    Args:
+        databasePath (str): path of SQLite file
+
+    Returns:
+        list: contains run number, start time, name, vendors and number of files of each run (tuple)
+
+    """
+    connection = openDatabase(databasePath)
+    try:
+        return connection.execute("SELECT runs.runId, runs.started, runs.label, GROUP_CONCAT(DISTINCT files.vendor), COUNT(files.fileId) "
+                                  "FROM runs LEFT JOIN files ON files.runId = runs.runId GROUP BY runs.runId ORDER BY runs.runId").fetchall()
+    finally:
+        connection.close()
+
+
+def queryTrend(databasePath, variable, marginName="LaneMargin", location=None, vendor=None):
+    """
+    queryTrend finds the number of samples, mean, minimum and maximum of one variable for each run and vendor,
+    oldest run first, to follow a margin over BIOS versions or test campaigns
+
+    Args:
+        databasePath (str): path of SQLite file
+        variable (str): name of variable (e.g. 'RxDqs-')
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+        location (str): fields of the row names to include (e.g. 'N1.C3.D0.R1'), None for every row
+        vendor (str): name of vendor to include, None for every vendor
+
+    Returns:
+        list: contains run number, name, vendor, number of samples, mean, minimum and maximum of each run and vendor (tuple)
+
+    """
+    conditions = ["margins.margin = ?", "margins.variable = ?"]
+    parameters = [marginName, variable]
+    if location is not None:
+        locationKeys = decodeRowKeys([location])[:, 0].tolist()
+        for field in range(0, len(ROW_FIELDS)):
+            if locationKeys[field] >= 0:
+                conditions.append("margins." + ROW_FIELDS[field] + " = ?")
+                parameters.append(locationKeys[field])
+    if vendor is not None:
+        conditions.append("files.vendor = ?")
+        parameters.append(vendor)
+
+    connection = openDatabase(databasePath)
+    try:
+        return connection.execute("SELECT runs.runId, runs.label, files.vendor, COUNT(*), ROUND(AVG(margins.value), 3), MIN(margins.value), MAX(margins.value) "
+                                  "FROM margins JOIN files ON files.fileId = margins.fileId JOIN runs ON runs.runId = files.runId "
+                                  "WHERE " + " AND ".join(conditions) + " GROUP BY runs.runId, files.vendor ORDER BY runs.runId, files.vendor",
+                                  parameters).fetchall()
+    finally:
+        connection.close()
+
+
+def main(argv=None):
+    """
+    main prints the runs of a database or the trend of one variable
+
+    Args:
+        argv (list): contains command line arguments without the program name, None reads sys.argv
+
+    """
+    parser = argparse.ArgumentParser(description="Lists runs and margin trends saved by DDR5_RMT_CLI.py --database")
+    parser.add_argument("database", help="SQLite file of saved runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("runs", help="list every run")
+    trendParser = commands.add_parser("trend", help="mean, minimum and maximum of a variable for each run and vendor")
+    trendParser.add_argument("variable", help="variable (e.g. RxDqs-)")
+    trendParser.add_argument("--margin", default="LaneMargin", choices=["RankMargin", "LaneMargin", "CALaneMargin"])
+    trendParser.add_argument("--location", help="fields of the row names to include (e.g. N1.C3.D0.R1)")
+    trendParser.add_argument("--vendor", help="vendor to include, every vendor if not given")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "runs":
+        header = ["Run", "Started", "Label", "Vendors", "Files"]
+        rows = listRuns(args.database)
+    else:
+        header = ["Run", "Label", "Vendor", "Samples", "Mean", "Min", "Max"]
+        rows = queryTrend(args.database, args.variable, args.margin, args.location, args.vendor)
+
+    lines = [header] + [["" if value is None else str(value) for value in row] for row in rows]
+    widths = [max(len(line[column]) for line in lines) for column in range(0, len(header))]
+    for line in lines:
+        print("  ".join(line[column].ljust(widths[column]) for column in range(0, len(header))).rstrip())
+
+
+if __name__ == "__main__":
+    main()
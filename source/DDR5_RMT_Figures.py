@@ -0,0 +1,217 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Figures.py
+# Date: 10/18/2026
+
+# Description: Keeps one figure per kind of graph and layout, the figure is cleared and drawn again for
+# every graph instead of opening a new figure, and closes all figures when the graphs are done, graphs
+# with too many vendors for one page are saved as one page per group of vendors in the same PDF
+
+# Assumption:
+#   1. Graphs of the same kind set the same figure size, spacing and title every time they are drawn
+#   2. Tables size their cells when the figure is first saved, so figures with tables are opened again
+#      instead of cleared (reuse=False), the old figure of the same kind is closed first
+#   3. Files with one page are saved like before paging, so they do not change
+#   4. Graphs drawn without a figure manager reuse the figures of UNMANAGED_FIGURES, so figures are never
+#      left open one per graph, closeFigureManager(None) closes them
+# ----------------------------------------------
+
+# matplotlib is imported when the first figure is opened
+
+import sys
+
+
+# figures of graphs drawn without a figure manager, same as a figure manager from openFigureManager
+UNMANAGED_FIGURES = {"figures": {}, "opened": 0, "graphs": 0}
+
+
+def openFigureManager():
+    """
+    openFigureManager starts a figure manager with no figures
+
+    Returns:
+        dict: contains open figures by kind and layout ("figures"), the number of figures closed before 
+              the end ("opened") and the number of graphs drawn ("graphs")
+
+    """
+    return {"figures": {}, "opened": 0, "graphs": 0}
+
+
+def getFigure(figureManager, kind, rows, cols, squeeze=True, reuse=True):
+    """
+    getFigure gives an empty figure for one graph, the figure of the same kind and layout is reused
+    if there is one
+
+    Args:
+        figureManager (dict): figure manager from openFigureManager, None uses UNMANAGED_FIGURES
+        kind (str): kind of graph (e.g. histogram, bitMargin)
+        rows (int): number of rows of subplots
+        cols (int): number of columns of subplots
+        squeeze (boolean): same as squeeze of plt.subplots
+        reuse (boolean): False closes the figure of the same kind and layout and opens a new one
+
+    Returns:
+        figure: figure of graph
+        axes: axes of subplots
+
+    """
+    import matplotlib.pyplot as plt
+
+    if figureManager is None:
+        figureManager = UNMANAGED_FIGURES
+
+    figureManager["graphs"] = figureManager["graphs"] + 1
+    key = (kind, rows, cols, squeeze)
+    if key in figureManager["figures"] and not reuse:
+        plt.close(figureManager["figures"][key][0])
+        del figureManager["figures"][key]
+        figureManager["opened"] = figureManager["opened"] + 1
+
+    if not key in figureManager["figures"]:
+        figureManager["figures"][key] = plt.subplots(rows, cols, squeeze=squeeze)
+        return figureManager["figures"][key]
+
+    fig, axs = figureManager["figures"][key]
+    for ax in fig.axes:
+        ax.clear()
+        ax.set_axis_on()
+    return fig, axs
+
+
+def closeFigureManager(figureManager=None):
+    """
+    closeFigureManager closes all figures of the figure manager
+
+    Args:
+        figureManager (dict): figure manager from openFigureManager, None closes the figures of UNMANAGED_FIGURES
+
+    Returns:
+        int: number of figures opened
+        int: number of graphs drawn on them
+
+    """
+    import matplotlib.pyplot as plt
+
+    if figureManager is None:
+        figureManager = UNMANAGED_FIGURES
+    for fig, axs in figureManager["figures"].values():
+        plt.close(fig)
+    figureCount = len(figureManager["figures"]) + figureManager["opened"]
+    figureManager["figures"] = {}
+    figureManager["opened"] = 0
+    return figureCount, figureManager["graphs"]
+
+
+def getPages(count, pageSize):
+    """
+    getPages splits a number of vendors into pages of at most pageSize vendors, all pages but the last are full
+
+    Args:
+        count (int): number of vendors
+        pageSize (int): largest number of vendors on one page
+
+    Returns:
+        list: contains the first vendor and the vendor after the last one of each page
+
+    """
+    return [(start, min(start + pageSize, count)) for start in range(0, max(count, 1), pageSize)]
+
+
+def getPageTitle(title, pageNum, pageCount):
+    """
+    getPageTitle adds the page number to the title of a page, when there is more than one page
+
+    Args:
+        title (str): title of graph
+        pageNum (int): position of page
+        pageCount (int): number of pages
+
+    Returns:
+        str: title of page
+
+    """
+    if pageCount == 1:
+        return title
+    return title + " (" + str(pageNum + 1) + "/" + str(pageCount) + ")"
+
+
+def openPages(fileName, pageCount):
+    """
+    openPages opens a PDF file with many pages, one page is saved straight to the file instead
+
+    Args:
+        fileName (str): name of PDF file
+        pageCount (int): number of pages
+
+    Returns:
+        dict: contains name of file ("fileName") and the open PDF file ("pdf", None if there is only one page)
+
+    """
+    pdf = None
+    if pageCount > 1:
+        from matplotlib.backends.backend_pdf import PdfPages
+        pdf = PdfPages(fileName)
+    return {"fileName": fileName, "pdf": pdf}
+
+
+def savePage(pages, fig, **options):
+    """
+    savePage saves a figure as the next page
+
+    Args:
+        pages (dict): pages from openPages
+        fig (figure): figure of page
+        options: options of savefig (e.g. bbox_inches)
+
+    """
+    if pages["pdf"] is None:
+        fig.savefig(pages["fileName"], **options)
+    else:
+        pages["pdf"].savefig(fig, **options)
+
+
+def closePages(pages):
+    """
+    closePages finishes the PDF file of openPages
+
+    Args:
+        pages (dict): pages from openPages
+
+    """
+    if pages["pdf"] is not None:
+        pages["pdf"].close()
+
+
+def peakMemoryMB():
+    """
+    peakMemoryMB finds the largest memory this process has used so far
+
+    Returns:
+        float: peak resident memory in MB, None if it can not be read
+
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        getProcessMemoryInfo = ctypes.windll.psapi.GetProcessMemoryInfo
+        getProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        if not getProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on mac and in KB on linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
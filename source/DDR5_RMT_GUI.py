@@ -30,12 +30,18 @@ def jean_analysis():
     variable_table = variable_table_var.get()
     bit_margin = bit_margin_var.get()
     comparator = comparator_var.get()
+    workers = int(workers_var.get())
+    csvMode = "truncate" if export_csv_var.get() else "off"
+    reportPath = "RunReport.json" if run_report_var.get() else None
 
     # Test cases, to print the variable content to CP.
     print("Number of folders to analyze:", numData)
     print("Path to folder:", folders)
     print("Bootstrap?", bootstrap)
     print("Margin Line?", includeLine)
+    print("Workers:", workers)
+    print("CSV Export:", csvMode)
+    print("Run Report:", reportPath)
 
 
     # ---- Your code should begin here ----------------------------------------------------------- #
@@ -43,13 +49,13 @@ def jean_analysis():
     # create list of vendor names
     vendorNames = []
     for i in range(0, numData):
-        name = folders[i][folders[i].rfind("/")+1:folders[i].rfind("_")]
-        name = name[name.find("_")+1:name.rfind("_")]
-        name = name[name.find("_")+1:]
-        vendorNames.append(name)
+        vendorNames.append(getVendorName(folders[i]))
 
     # run DDR5_RMT_Processing.py with all GUI inputs
-    processData(folders, vendorNames, bootstrap, includeLine, histogram, vendor_table, box_plot, variable_table, bit_margin, comparator)
+    savedReport = processData(folders, vendorNames, bootstrap, includeLine, histogram, vendor_table, box_plot, variable_table, bit_margin, comparator, workers, csvMode=csvMode, renderWorkers=workers, reportPath=reportPath)
+
+    # one line summary of where the time went
+    summary_var.set(summarizeRunReport(savedReport))
 
 
 # ---GUI Code Below ------------------------------------------------------------------------------- #
@@ -57,66 +63,86 @@ def jean_analysis():
 def browse_folder():
     return filedialog.askdirectory()
 
-root = tk.Tk()
-root.title("DDR5 RMT GUI")
-root.geometry("500x230")
+# worker processes import this file again, so the window is only created when it is run directly
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("DDR5 RMT GUI")
+    root.geometry("500x325")
+
+    # assign variables on GUI
+    num_data_var = tk.StringVar()
+    folder_path_var = tk.StringVar()
+    bootstrap_var = tk.BooleanVar()
+    include_line_var = tk.BooleanVar()
+    histogram_var = tk.BooleanVar()
+    vendor_table_var = tk.BooleanVar()
+    box_plot_var = tk.BooleanVar()
+    variable_table_var = tk.BooleanVar()
+    bit_margin_var = tk.BooleanVar()
+    comparator_var = tk.BooleanVar()
+    workers_var = tk.StringVar(value="1")
+    export_csv_var = tk.BooleanVar(value=True)
+    run_report_var = tk.BooleanVar(value=False)
+    summary_var = tk.StringVar()
+
+
+    num_label = tk.Label(root, text="Number of folders to analyze:")                                # numData
+    num_label.grid(row=0, column=0, padx=10, pady=5)
+    num_data_combobox = ttk.Combobox(root, textvariable=num_data_var, values=list(range(1, 31)))
+    num_data_combobox.grid(row=0, column=1, padx=10, pady=5)
+
+    bootstrap_label = tk.Label(root, text="Bootstrap?")                                             # bootstrap
+    bootstrap_label.grid(row=1, column=0, padx=10, pady=5)
+    bootstrap_yes_radio = tk.Radiobutton(root, text="Yes", variable=bootstrap_var, value=True)
+    bootstrap_yes_radio.grid(row=1, column=1, padx=10, pady=5)
+    bootstrap_no_radio = tk.Radiobutton(root, text="No", variable=bootstrap_var, value=False)
+    bootstrap_no_radio.grid(row=1, column=2, padx=10, pady=5)
 
-# assign variables on GUI
-num_data_var = tk.StringVar()
-folder_path_var = tk.StringVar()
-bootstrap_var = tk.BooleanVar()
-include_line_var = tk.BooleanVar()
-histogram_var = tk.BooleanVar()
-vendor_table_var = tk.BooleanVar()
-box_plot_var = tk.BooleanVar()
-variable_table_var = tk.BooleanVar()
-bit_margin_var = tk.BooleanVar()
-comparator_var = tk.BooleanVar()
+    include_line_label = tk.Label(root, text="Threshold Line?")                                            # includeLine
+    include_line_label.grid(row=2, column=0, padx=10, pady=5)
+    include_line_yes_radio = tk.Radiobutton(root, text="Yes", variable=include_line_var, value=True)
+    include_line_yes_radio.grid(row=2, column=1, padx=10, pady=5)
+    include_line_no_radio = tk.Radiobutton(root, text="No", variable=include_line_var, value=False)
+    include_line_no_radio.grid(row=2, column=2, padx=10, pady=5)
 
+    graph_types_label = tk.Label(root, text="Select Graph Type:")                                           
+    graph_types_label.grid(row=3, column=0, padx=9, pady=5)
 
-num_label = tk.Label(root, text="Number of folders to analyze:")                                # numData
-num_label.grid(row=0, column=0, padx=10, pady=5)
-num_data_combobox = ttk.Combobox(root, textvariable=num_data_var, values=[1, 2, 3])
-num_data_combobox.grid(row=0, column=1, padx=10, pady=5)
+    histogram_radio = tk.Checkbutton(root, text="Histogram", variable=histogram_var, onvalue = True, offvalue = False)                # histogram
+    histogram_radio.grid(row=3, column=1, padx=10, pady=5)
 
-bootstrap_label = tk.Label(root, text="Bootstrap?")                                             # bootstrap
-bootstrap_label.grid(row=1, column=0, padx=10, pady=5)
-bootstrap_yes_radio = tk.Radiobutton(root, text="Yes", variable=bootstrap_var, value=True)
-bootstrap_yes_radio.grid(row=1, column=1, padx=10, pady=5)
-bootstrap_no_radio = tk.Radiobutton(root, text="No", variable=bootstrap_var, value=False)
-bootstrap_no_radio.grid(row=1, column=2, padx=10, pady=5)
+    vendor_table_radio = tk.Checkbutton(root, text="Vendor Table", variable=vendor_table_var, onvalue = True, offvalue = False)       # vendor_table
+    vendor_table_radio.grid(row=3, column=2, padx=10, pady=5)
 
-include_line_label = tk.Label(root, text="Threshold Line?")                                            # includeLine
-include_line_label.grid(row=2, column=0, padx=10, pady=5)
-include_line_yes_radio = tk.Radiobutton(root, text="Yes", variable=include_line_var, value=True)
-include_line_yes_radio.grid(row=2, column=1, padx=10, pady=5)
-include_line_no_radio = tk.Radiobutton(root, text="No", variable=include_line_var, value=False)
-include_line_no_radio.grid(row=2, column=2, padx=10, pady=5)
+    box_plot_radio = tk.Checkbutton(root, text="Box Plot", variable=box_plot_var, onvalue = True, offvalue = False)                   # box_plot
+    box_plot_radio.grid(row=4, column=1, padx=10, pady=3)
 
-graph_types_label = tk.Label(root, text="Select Graph Type:")                                           
-graph_types_label.grid(row=3, column=0, padx=9, pady=5)
+    variable_table_radio = tk.Checkbutton(root, text="Variable Table", variable=variable_table_var, onvalue = True, offvalue = False) # variable_table
+    variable_table_radio.grid(row=4, column=2, padx=10, pady=3)
 
-histogram_radio = tk.Checkbutton(root, text="Histogram", variable=histogram_var, onvalue = True, offvalue = False)                # histogram
-histogram_radio.grid(row=3, column=1, padx=10, pady=5)
+    bit_margin_radio = tk.Checkbutton(root, text="Bit Margin", variable=bit_margin_var, onvalue = True, offvalue = False)             # bit_margin
+    bit_margin_radio.grid(row=5, column=1, padx=10, pady=3)
 
-vendor_table_radio = tk.Checkbutton(root, text="Vendor Table", variable=vendor_table_var, onvalue = True, offvalue = False)       # vendor_table
-vendor_table_radio.grid(row=3, column=2, padx=10, pady=5)
+    comparator_radio = tk.Checkbutton(root, text="Comparator", variable=comparator_var, onvalue = True, offvalue = False)             # comparator
+    comparator_radio.grid(row=5, column=2, padx=10, pady=3)
 
-box_plot_radio = tk.Checkbutton(root, text="Box Plot", variable=box_plot_var, onvalue = True, offvalue = False)                   # box_plot
-box_plot_radio.grid(row=4, column=1, padx=10, pady=3)
+    workers_label = tk.Label(root, text="Worker processes:")                                      # workers
+    workers_label.grid(row=6, column=0, padx=10, pady=5)
+    workers_combobox = ttk.Combobox(root, textvariable=workers_var, values=[1, 2, 4, 8])
+    workers_combobox.grid(row=6, column=1, padx=10, pady=5)
 
-variable_table_radio = tk.Checkbutton(root, text="Variable Table", variable=variable_table_var, onvalue = True, offvalue = False) # variable_table
-variable_table_radio.grid(row=4, column=2, padx=10, pady=3)
+    export_csv_radio = tk.Checkbutton(root, text="Export CSV", variable=export_csv_var, onvalue = True, offvalue = False)   # export_csv
+    export_csv_radio.grid(row=6, column=2, padx=10, pady=5)
 
-bit_margin_radio = tk.Checkbutton(root, text="Bit Margin", variable=bit_margin_var, onvalue = True, offvalue = False)             # bit_margin
-bit_margin_radio.grid(row=5, column=1, padx=10, pady=3)
+    run_report_radio = tk.Checkbutton(root, text="Run Report", variable=run_report_var, onvalue = True, offvalue = False)   # run_report
+    run_report_radio.grid(row=7, column=2, padx=10, pady=5)
 
-comparator_radio = tk.Checkbutton(root, text="Comparator", variable=comparator_var, onvalue = True, offvalue = False)             # comparator
-comparator_radio.grid(row=5, column=2, padx=10, pady=3)
+    run_button = tk.Button(root, text="Run", command=jean_analysis, width=20)                                   # button to run jean_analysis()
+    run_button.grid(row=8, column=0, columnspan=3, padx=10, pady=5)
 
-run_button = tk.Button(root, text="Run", command=jean_analysis, width=20)                                   # button to run jean_analysis()
-run_button.grid(row=6, column=0, columnspan=3, padx=10, pady=5)
+    summary_label = tk.Label(root, textvariable=summary_var, wraplength=480)                                   # summary of last run
+    summary_label.grid(row=9, column=0, columnspan=3, padx=10, pady=5)
 
 
 
-root.mainloop()
\ No newline at end of file
+    root.mainloop()
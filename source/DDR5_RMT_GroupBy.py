@@ -0,0 +1,69 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_GroupBy.py
+# Date: 10/18/2026
+
+# Description: Groups rows of a margin store by integer keys and adds up each group
+# with numpy instead of python loops
+
+# Assumption:
+#   1. Keys are non-negative integers, e.g. numbers given to graph titles or lane numbers
+# ----------------------------------------------
+
+import numpy as np
+
+
+def encodeGroups(keyColumns):
+    """
+    encodeGroups gives every distinct combination of keys a group number, groups are numbered in sorted key order
+
+    Args:
+        keyColumns (list): contains one integer array per key, with one key per row
+
+    Returns:
+        array: contains group number of each row
+        list: contains one array per key, with the key of each group
+
+    """
+    # keys are combined into one integer per row, the first key changes slowest
+    code = np.zeros(len(keyColumns[0]), dtype=np.int64)
+    for keyColumn in keyColumns:
+        code = code * (int(keyColumn.max()) + 1 if len(keyColumn) else 1) + keyColumn
+
+    groupCodes, groupIndex = np.unique(code, return_inverse=True)
+
+    groupKeys = []
+    for keyColumn in keyColumns[::-1]:
+        radix = int(keyColumn.max()) + 1 if len(keyColumn) else 1
+        groupKeys.insert(0, groupCodes % radix)
+        groupCodes = groupCodes // radix
+    return groupIndex.ravel(), groupKeys
+
+
+def groupStats(groupIndex, values, groupCount, rowCounts=None):
+    """
+    groupStats adds up every variable of each group and finds the mean of each group
+
+    Args:
+        groupIndex (array): contains group number of each row
+        values (array): contains data, one row per variable and one column per row of groupIndex
+        groupCount (int): number of groups
+        rowCounts (array): contains number of rows each row is a sum of, None if each row is one row
+
+    Returns:
+        array: contains number of rows in each group
+        array: contains sum of each variable of each group, one row per variable
+        array: contains mean of each variable of each group, one row per variable
+
+    """
+    if rowCounts is None:
+        counts = np.bincount(groupIndex, minlength=groupCount)
+    else:
+        counts = np.bincount(groupIndex, weights=rowCounts, minlength=groupCount).astype(np.int64)
+
+    sums = np.empty((len(values), groupCount))
+    for k in range(0, len(values)):
+        sums[k] = np.bincount(groupIndex, weights=values[k], minlength=groupCount)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+    return counts, sums, means
@@ -0,0 +1,110 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Prefetch.py
+# Date: 10/18/2026
+
+# Description: Reads log files in background threads ahead of the parser, so opening and reading the next
+# files (slow on network shares) overlaps with parsing the current one
+
+# Assumption:
+#   1. Files are given to the parser in the order they were asked for
+#   2. At most depth files are being read or waiting to be parsed at once, a new file is only started when
+#      the parser takes one (backpressure), so memory stays bounded when parsing is slower than reading
+#   3. makeLatencyReader only slows reading down, for trying prefetching on a local disk
+#   4. Prefetched files are read whole into memory, so prefetching is off unless asked for (e.g. on network
+#      shares), local files are memory mapped by readMappedLog instead
+# ----------------------------------------------
+
+import time
+import collections
+import concurrent.futures
+
+
+# number of files read ahead of the parser when prefetching is turned on and largest number of files read at the same time
+PREFETCH_DEPTH = 8
+PREFETCH_THREADS = 4
+
+
+def readFileBytes(filePath):
+    """
+    readFileBytes reads a whole file
+
+    Args:
+        filePath (str): path of file
+
+    Returns:
+        bytes: contents of file
+
+    """
+    with open(filePath, "rb") as file:
+        return file.read()
+
+
+def makeLatencyReader(latency, bandwidthMBps=None):
+    """
+    makeLatencyReader makes a file reader that waits like a network share before it reads a file
+
+    Args:
+        latency (float): seconds waited for each file, like opening a file on a network share
+        bandwidthMBps (float): MB per second files are read at, None to not limit it
+
+    Returns:
+        function: reader that takes a file path and gives its contents (bytes)
+
+    """
+    def readSlowFile(filePath):
+        data = readFileBytes(filePath)
+        delay = latency
+        if bandwidthMBps is not None:
+            delay = delay + len(data) / (bandwidthMBps * 1024 * 1024)
+        time.sleep(delay)
+        return data
+
+    return readSlowFile
+
+
+def prefetchFiles(filePaths, depth=PREFETCH_DEPTH, readFile=readFileBytes):
+    """
+    prefetchFiles reads files in background threads and gives them in order, with the time the caller
+    waited for each one, depth 0 reads each file when it is asked for without threads
+
+    Args:
+        filePaths (list): contains paths of files
+        depth (int): largest number of files being read or waiting to be used
+        readFile (function): reader that takes a file path and gives its contents, e.g. from makeLatencyReader
+
+    Yields:
+        int: position of file in filePaths
+        bytes: contents of file
+        float: seconds waited for the file
+
+    """
+    if depth < 1:
+        for fileNum in range(0, len(filePaths)):
+            start = time.perf_counter()
+            data = readFile(filePaths[fileNum])
+            yield fileNum, data, time.perf_counter() - start
+        return
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(depth, PREFETCH_THREADS))
+    pending = collections.deque()
+    nextFile = 0
+    try:
+        while nextFile < len(filePaths) and len(pending) < depth:
+            pending.append(pool.submit(readFile, filePaths[nextFile]))
+            nextFile = nextFile + 1
+
+        for fileNum in range(0, len(filePaths)):
+            start = time.perf_counter()
+            data = pending.popleft().result()
+            waitTime = time.perf_counter() - start
+
+            # the next file is only read once the caller takes one
+            if nextFile < len(filePaths):
+                pending.append(pool.submit(readFile, filePaths[nextFile]))
+                nextFile = nextFile + 1
+            yield fileNum, data, waitTime
+    finally:
+        # files not used yet are not read when the caller stops early
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
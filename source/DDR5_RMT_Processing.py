@@ -7,7 +7,8 @@
 # bit margin (scatterplot), and average bit margin graphs
 
 # Assumption:
-#   1. There is no csv files with the name: vendorName + "_" + marginType + ".csv"
+#   1. CSV files with the name vendorName + "_" + marginType + ".csv" from earlier runs are overwritten
+#      (csvMode 'version' keeps them and writes vendorName + "_" + marginType + "_1.csv" and so on)
 #           vendorName: 3rd to last word in folder name, separated by '_'
 #                       look at assumption 2 for examples
 #           marginType ex: CPU0_RankMargin, CPU0_LaneMargin, CPU1_RankMargin, CPU1_LaneMargin
@@ -15,31 +16,87 @@
 #           Everett_EMR_SK_64GB_1DPC --> SK
 #           Everett_EMR_Samsung_64GB_1DPC --> Samsung
 #           Everett_EMR_Micron_64GB_1DPC --> Micron
-#   3. Files within input folders must have exactly one 'START_RMT_N0', 'STOP_RMT_N0', 'START_RMT_N1', 'STOP_RMT_N1'
+#   3. Files within input folders must have exactly one 'START_RMT_N*' and 'STOP_RMT_N*' for each CPU (N0, N1, N2, ...),
+#      every CPU found in any file is graphed
 #   4. All folders have the same number of files for average bit margin
+#   5. Box plots, variable tables and vendor tables of many vendors are saved as one PDF page per PAGE_VENDORS,
+#      PAGE_TABLE_VENDORS or PAGE_VENDOR_TABLES vendors, statistics are calculated once for all pages
 # ----------------------------------------------
 
 # pip install matplotlib
-# pip install scikit-learn
 # pip install openpyxl
 
+# matplotlib and openpyxl are imported by the functions that draw and save graphs, so the GUI and
+# the command line start without loading them
+
 import os
+import io
+import gzip
+import mmap
+import locale
+import time
+import concurrent.futures
 import numpy as np
-import matplotlib.pyplot as plt
-import statistics as stats
 import csv
-from sklearn.utils import resample
-import openpyxl
-
-
-def processData(folders, vendorNames, bootstrap, includeLine, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator):
+import collections
+from DDR5_RMT_Cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MB, getCachePath, saveCachedFile, loadCachedFile, trimCache
+from DDR5_RMT_GroupBy import encodeGroups, groupStats
+from DDR5_RMT_Accumulator import makeAccumulator, addToAccumulator, getAccumulatorStats, getHistogram, getBoxStats
+from DDR5_RMT_Figures import openFigureManager, getFigure, closeFigureManager, peakMemoryMB, getPages, getPageTitle, openPages, savePage, closePages
+from DDR5_RMT_Charts import openChartWorkbook, saveChartWorkbook, addBitMarginCharts, addComparatorCharts
+from DDR5_RMT_Prefetch import prefetchFiles, readFileBytes
+from DDR5_RMT_Violations import DEFAULT_THRESHOLD, getThresholdList, findViolations, writeViolationCSV, summarizeViolations, writeViolationReport
+from DDR5_RMT_Report import openRunReport, initReportWorker, startPhase, endPhase, addToPhase, mergeRunReports, finishRunReport, summarizeRunReport
+
+
+# margin sections in the order they appear in the log, with the header that starts each section
+# and the first variable of the section's variable list
+MARGIN_SECTIONS = [("RankMargin", "Rank Margin", "RxDqs-"), ("LaneMargin", "Lane Margin", None), ("CALaneMargin", "CA Lane Margin", "Ca-")]
+
+# first bytes of a gzip compressed log file
+GZIP_MAGIC = b"\x1f\x8b"
+
+# change when the output of readLogFile changes, so cached log files are parsed again
+PARSER_VERSION = 4
+
+# fields of a row name (e.g. 'N0.C1.D0.R1.L12:') kept as integers next to the margins, and the letters before
+# the number of each field, lane margins use 'L' and CA lane margins use 'A' for the lane
+ROW_FIELDS = ["socket", "channel", "dimm", "rank", "subchannel", "lane", "strobe"]
+ROW_FIELD_LETTERS = {"N": 0, "C": 1, "D": 2, "R": 3, "S": 4, "SC": 4, "L": 5, "A": 5, "B": 6, "DQS": 6}
+
+# graphs are drawn per rank (all fields but the lane) and sheets are per channel
+TAB_FIELDS = [0, 1]
+TITLE_FIELDS = [0, 1, 2, 3, 4, 6]
+LANE_FIELD = 5
+
+# CSV text is written to disk in blocks of this many bytes
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# bootstrap draws this many replicates with this seed and reports percentile confidence intervals
+BOOTSTRAP_REPLICATES = 1000
+BOOTSTRAP_SEED = 1
+BOOTSTRAP_CONFIDENCE = 95
+
+# largest number of resampled values held in memory at once, replicates are drawn in chunks below this
+BOOTSTRAP_CHUNK_SIZE = 4 * 1024 * 1024
+
+# largest number of vendors on one page of box plots, variable tables and vendor tables (2 by 2 tables)
+PAGE_VENDORS = 10
+PAGE_TABLE_VENDORS = 3
+PAGE_VENDOR_TABLES = 4
+
+
+def processData(folders, vendorNames, bootstrap, includeLine, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, workers=1, parallelLevel="file", 
+                cacheDir=DEFAULT_CACHE_DIR, maxCacheMB=DEFAULT_CACHE_MB, csvMode="truncate", replicates=BOOTSTRAP_REPLICATES, seed=BOOTSTRAP_SEED, 
+                renderWorkers=1, chartMode="image", reportPath=None, profile=False, traceMemory=False,
+                prefetchDepth=0, thresholds=None, violations=False, maxViolationRate=None, databasePath=None, runLabel=None):
     """
-    processData puts file data into variables and prints done after plotting and saving the graphs
+    processData puts file data into variables and prints done and a summary of the run after plotting and saving the graphs
 
     Args:
         folders (list): contains all folder paths
         vendorNames (list): contains all vendor names
-        bootstrap (str): 'Y' if yes, 'N' if no - decides if data is bootstrapped
+        bootstrap (str): 'Y' if yes, 'N' if no - decides if tables include bootstrap confidence intervals
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
         histogram (boolean): True if graphs histogram
         vendorTable (boolean): True if creates vendor table
@@ -47,27 +104,216 @@ def processData(folders, vendorNames, bootstrap, includeLine, histogram, vendorT
         varTable (boolean): True if creates variable table
         bitMarg (boolean): True if graphs bit margin (scatterplot)
         comparator (boolean): True if graphs average bit margin (line graph)
+        workers (int): number of processes reading log files, 1 reads them one after another, None uses every core
+        parallelLevel (str): 'file' if each log file is read by a process, 'folder' if each folder is read by a process
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+        maxCacheMB (float): largest size of the cache in MB, least recently used files are deleted first
+        csvMode (str): 'truncate' overwrites old CSV files, 'version' writes new numbered CSV files next to them, 'off' writes no CSV files
+        replicates (int): number of bootstrap replicates
+        seed (int): seed of the bootstrap random number generator, the same seed gives the same intervals
+        renderWorkers (int): number of processes rendering graphs and tables, 1 renders them one after another, None uses every core
+        chartMode (str): 'image' puts matplotlib images of the bit margin graphs in excel, 'native' writes excel charts
+        reportPath (str): path of JSON run report with the time and work of each phase, None to not save it
+        profile (boolean): True if the run report includes a cProfile of the main process
+        traceMemory (boolean): True if the run report includes tracemalloc peaks and allocation sites of the main process
+        prefetchDepth (int): number of log files read ahead of parsing when files are not read by worker processes (e.g. PREFETCH_DEPTH on
+                             network shares), 0 to not read ahead and memory map the log files
+        thresholds (dict): contains the thresholds of the margins and variables from loadThresholds, None uses DEFAULT_THRESHOLD
+        violations (boolean): True writes the samples below the thresholds to Violations.csv and ViolationReport.json
+        maxViolationRate (float): highest violation rate of any variable that passes, None passes any rate
+        databasePath (str): path of SQLite file the margins of the run are added to, None to not save them
+        runLabel (str): name of the run in the database (e.g. BIOS version or test campaign), None for no name
+
+    Returns:
+        dict: run report from finishRunReport, with the violation summary ("violations") if violations were counted
 
     """ 
-    allRankMarginCPU0, allLaneMarginCPU0, allCALaneMarginCPU0 = [None] * len(folders), [None] * len(folders), [None] * len(folders)
-    allRankMarginCPU1, allLaneMarginCPU1, allCALaneMarginCPU1 = [None] * len(folders), [None] * len(folders), [None] * len(folders)
-    rankVarList, caLaneVarList = [None] * len(folders), [None] * len(folders)
-    for i in range(0, len(folders)):
-        allRankMarginCPU0[i], allLaneMarginCPU0[i], allCALaneMarginCPU0[i], allRankMarginCPU1[i], allLaneMarginCPU1[i], allCALaneMarginCPU1[i], rankVarList, caLaneVarList = readData(os.listdir(folders[i]), folders[i], vendorNames[i])
-        
-    makeGraphs(allRankMarginCPU0, rankVarList, vendorNames, includeLine, bootstrap, "CPU0 Rank Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allLaneMarginCPU0[0][0]))
-    makeGraphs(allLaneMarginCPU0, rankVarList, vendorNames, includeLine, bootstrap, "CPU0 Lane Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allLaneMarginCPU0[0][0]))
-    makeGraphs(allCALaneMarginCPU0, caLaneVarList, vendorNames, includeLine, bootstrap, "CPU0 CA Lane Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allCALaneMarginCPU0[0][0]))
+    report = openRunReport(profile, traceMemory)
+    report["run"] = {"folders": folders, "vendors": vendorNames, "workers": workers, "parallelLevel": parallelLevel, "csvMode": csvMode,
+                     "renderWorkers": renderWorkers, "chartMode": chartMode, "cache": cacheDir is not None, "prefetchDepth": prefetchDepth}
+
+    allSocketStores = [None] * len(folders)
+    rankVarList, caLaneVarList = [], []
 
-    makeGraphs(allRankMarginCPU1, rankVarList, vendorNames, includeLine, bootstrap, "CPU1 Rank Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allLaneMarginCPU0[0]))
-    makeGraphs(allLaneMarginCPU1, rankVarList, vendorNames, includeLine, bootstrap, "CPU1 Lane Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allLaneMarginCPU0[0][0]))
-    makeGraphs(allCALaneMarginCPU1, caLaneVarList, vendorNames, includeLine, bootstrap, "CPU1 CA Lane Margin", histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, len(os.listdir(folders[0])), len(allCALaneMarginCPU0[0][0]))
+    pool = None
+    if workers != 1:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initReportWorker)
 
-    plt.close()
+    # CSV files stay open for the whole run and are closed once all folders are read
+    csvExport = openCSVExport(csvMode)
+
+    start = startPhase(report)
+    allFolders = [os.listdir(folderPath) for folderPath in folders]
+    endPhase(report, "read list", start, fileCount=sum(len(folder) for folder in allFolders))
+
+    # folders can only be read in parallel when each vendor writes to its own CSV files
+    folderJobs = None
+    if pool is not None and parallelLevel == "folder" and len(set(vendorNames)) == len(vendorNames):
+        folderJobs = [pool.submit(readFolder, allFolders[i], folders[i], vendorNames[i], cacheDir, csvMode, prefetchDepth) for i in range(0, len(folders))]
+
+    # results are saved in folder order, so the output matches reading one folder at a time
+    for i in range(0, len(folders)):
+        if folderJobs is not None:
+            folderData, folderReport = folderJobs[i].result()
+            mergeRunReports(report, folderReport)
+        else:
+            folderData = readData(allFolders[i], folders[i], vendorNames[i], pool, cacheDir, csvExport, report, prefetchDepth)
+        allSocketStores[i], rankVarList, caLaneVarList = folderData
+
+    closeCSVExport(csvExport)
+    if pool is not None:
+        pool.shutdown()
+
+    if cacheDir is not None:
+        start = startPhase(report)
+        trimCache(cacheDir, maxCacheMB)
+        endPhase(report, "read trimCache", start)
+        
+    if databasePath is not None:
+        # imported here since DDR5_RMT_Database reads row names with decodeRowKeys
+        from DDR5_RMT_Database import saveRun
+        start = startPhase(report)
+        runId, rowCount = saveRun(databasePath, folders, vendorNames, allFolders, allSocketStores, rankVarList, caLaneVarList, runLabel)
+        endPhase(report, "database insert", start, rowCount=rowCount, fileCount=sum(len(folder) for folder in allFolders))
+        print("Saved run", runId, "to", databasePath + ",", rowCount, "margins")
+
+    if violations:
+        report["violations"] = checkViolations(allSocketStores, vendorNames, rankVarList, caLaneVarList, thresholds, maxViolationRate, report)
+
+    # every margin of every CPU found in the folders, CPU0 first
+    renderJobs = []
+    for marginType, cpuNum, marginName in getMarginTypes(getSockets(allSocketStores)):
+        allMarginList = getMarginList(allSocketStores, cpuNum, marginName)
+        missingVendors = [vendorNames[i] for i in range(0, len(vendorNames)) if len(allMarginList[i]["labels"]) == 0]
+        if missingVendors:
+            print("Skipped", marginType + ", no data for", ", ".join(missingVendors))
+            continue
+
+        # varNum counts the row name column as well as the variables, rank margins use the variables of lane margins
+        if marginName == "CALaneMargin":
+            variableList, varNum = caLaneVarList, len(allMarginList[0]["values"]) + 1
+        else:
+            laneMarginList = getMarginList(allSocketStores, cpuNum, "LaneMargin")
+            variableList, varNum = rankVarList, len((laneMarginList[0] if len(laneMarginList[0]["labels"]) > 0 else allMarginList[0])["values"]) + 1
+        renderJobs += makeGraphs(allMarginList, variableList, vendorNames, includeLine, bootstrap, marginType, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, varNum, replicates, seed, 
+                                 chartMode=chartMode, report=report, thresholdList=getThresholdList(thresholds, marginName, variableList))
+
+    runRenderJobs(renderJobs, renderWorkers, report)
+
+    peakMemory = peakMemoryMB()
+    if peakMemory is not None:
+        print("Peak memory:", round(peakMemory, 1), "MB")
+    savedReport = finishRunReport(report, reportPath, peakMemory)
+    print(summarizeRunReport(savedReport))
     print("Done")
+    return savedReport
 
     
-def readData(folder, folderPath, vendorName):
+def checkViolations(allSocketStores, vendorNames, rankVarList, caLaneVarList, thresholds=None, maxRate=None, report=None):
+    """
+    checkViolations counts the samples below the thresholds in every margin of every vendor, writes them to
+    Violations.csv and ViolationReport.json and prints the number of violations
+
+    Args:
+        allSocketStores (list): contains margin stores of each vendor by CPU number, from readData
+        vendorNames (list): contains all vendor names
+        rankVarList (list): contains all rank margin variables
+        caLaneVarList (list): contains all CA lane margin variables
+        thresholds (dict): contains the thresholds of the margins and variables from loadThresholds, None uses DEFAULT_THRESHOLD
+        maxRate (float): highest violation rate of any variable that passes, None passes any rate
+        report (dict): run report from openRunReport, None to not record the phases
+
+    Returns:
+        dict: summary from summarizeViolations without the totals of each margin
+
+    """
+    start = startPhase(report)
+    allViolations = []
+    rowCount = 0
+    for marginType, cpuNum, marginName in getMarginTypes(getSockets(allSocketStores)):
+        variableList = caLaneVarList if marginName == "CALaneMargin" else rankVarList
+        thresholdList = getThresholdList(thresholds, marginName, variableList)
+        for i in range(0, len(vendorNames)):
+            marginList = getMarginList(allSocketStores, cpuNum, marginName)[i]
+            if len(marginList["labels"]) == 0:
+                continue
+            result = findViolations(marginList, thresholdList)
+            result.update({"vendor": vendorNames[i], "marginType": marginType, "variables": variableList, "thresholds": thresholdList})
+            allViolations.append(result)
+            rowCount = rowCount + len(marginList["labels"])
+
+    summary = summarizeViolations(allViolations, maxRate)
+    writeViolationCSV(allViolations, "Violations.csv")
+    writeViolationReport(summary, "ViolationReport.json")
+    endPhase(report, "violations scan", start, rowCount=rowCount, fileCount=2)
+
+    print("Violations:", summary["violations"], "of", summary["samples"], "samples, highest rate", summary["maxRate"], "(passed)" if summary["passed"] else "(FAILED)")
+    return {key: summary[key] for key in summary if key != "margins"}
+
+
+def getVendorName(folderPath):
+    """
+    getVendorName finds the vendor name in a folder name, look at assumption 2
+
+    Args:
+        folderPath (str): path of folder
+
+    Returns:
+        str: name of vendor
+
+    """
+    name = os.path.basename(os.path.normpath(folderPath))
+    name = name[:name.rfind("_")]
+    name = name[name.find("_")+1:name.rfind("_")]
+    name = name[name.find("_")+1:]
+    return name
+
+
+def getSockets(allSocketStores):
+    """
+    getSockets finds the CPU numbers of every CPU in any folder
+
+    Args:
+        allSocketStores (list): contains margin stores of each vendor by CPU number, from readData
+
+    Returns:
+        list: contains CPU numbers (str) in number order
+
+    """
+    return sorted(set(cpuNum for socketStores in allSocketStores for cpuNum in socketStores), key=int)
+
+
+def getMarginTypes(cpuNums):
+    """
+    getMarginTypes gives every margin of the CPUs in the order they are graphed
+
+    Args:
+        cpuNums (list): contains CPU numbers (str) from getSockets
+
+    Returns:
+        list: contains the type of margin (e.g. 'CPU0 Rank Margin'), CPU number and margin name (e.g. 'RankMargin') of each margin
+
+    """
+    return [("CPU" + cpuNum + " " + header, cpuNum, marginName) for cpuNum in cpuNums for marginName, header, firstVar in MARGIN_SECTIONS]
+
+
+def getMarginList(allSocketStores, cpuNum, marginName):
+    """
+    getMarginList gives the margin store of each vendor for one margin of one CPU
+
+    Args:
+        allSocketStores (list): contains margin stores of each vendor by CPU number, from readData
+        cpuNum (str): CPU number
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+
+    Returns:
+        list: contains margin store of each vendor, empty for vendors without the CPU
+
+    """
+    return [socketStores[cpuNum][marginName] if cpuNum in socketStores else makeMarginStore([], 0) for socketStores in allSocketStores]
+
+
+def readData(folder, folderPath, vendorName, pool=None, cacheDir=None, csvExport=None, report=None, prefetchDepth=0, readFile=None, queryIndex=False):
     """
     readData reads files, organizes, and saves data to variables
 
@@ -75,139 +321,750 @@ def readData(folder, folderPath, vendorName):
         folder (list): contains all files in folder
         folderPath (str): path of folder
         vendorName (str): name of vendor
+        pool (ProcessPoolExecutor): processes that read the files in parallel, None reads them one after another
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+        csvExport (dict): open CSV files from openCSVExport, None to not write CSV files
+        report (dict): run report from openRunReport, None to not record the phases
+        prefetchDepth (int): number of files read by threads ahead of parsing when there is no pool, 0 reads each file when it is parsed
+        readFile (function): reader that gives the contents of a file for prefetching (e.g. from makeLatencyReader), 
+                             None reads files with readFileBytes, or memory maps them when prefetchDepth is 0
+        queryIndex (boolean): True if each margin store gets the sort indexes of DDR5_RMT_Query ("index")
         
     Returns:
-        list: contains all CPU0 rank margin data
-        list: contains all CPU0 lane margin data
-        list: contains all CPU0 CA lane margin data
-        list: contains all CPU1 rank margin data
-        list: contains all CPU1 lane margin data
-        list: contains all CPU1 CA lane margin data
+        dict: CPU number (str) of every CPU found in the files to a dict containing the margin store of all rank margin 
+              data ("RankMargin"), lane margin data ("LaneMargin") and CA lane margin data ("CALaneMargin") of the CPU
         list: contains all rank margin variables
         list: contains all CA lane margin variables
 
     """ 
-    allRankMarginCPU0 = []
-    allLaneMarginCPU0 = []
-    allCALaneMarginCPU0 = []
-
-    allRankMarginCPU1 = []
-    allLaneMarginCPU1 = []
-    allCALaneMarginCPU1 = []
-
-    # reads through all files in folder
-    for fileName in folder:
-        file = open(folderPath + "\\" + fileName, "r")
-        text = file.readlines()
-        dataCPU0 = ""
-        dataCPU1 = ""
-        recordCPU0Data = False
-        recordCPU1Data = False
-    
-        # saves data between 'START_RMT' and 'STOP_RMT'
-        for line in text:
-            if line.find("START_RMT_N0") != -1:
-                recordCPU0Data = True
-            if line.find("STOP_RMT_N0") != -1:
-                recordCPU0Data = False
-            if recordCPU0Data:
-                dataCPU0 = dataCPU0 + line
-            if line.find("START_RMT_N1") != -1:
-                recordCPU1Data = True
-            if line.find("STOP_RMT_N1") != -1:
-                recordCPU1Data = False
-            if recordCPU1Data:
-                dataCPU1 = dataCPU1 + line
-        file.close()
+    allMargins = {}
+    rankVarList, caLaneVarList = [], []
+
+    exportCSV = csvExport is not None and csvExport["mode"] != "off"
+    filePaths = [os.path.join(folderPath, fileName) for fileName in folder]
+    cachePaths = [None] * len(folder)
+    allFileData = [None] * len(folder)
+
+    # load files that were already parsed from the cache, files cached without CSV text are parsed again when it is needed
+    if cacheDir is not None:
+        start = startPhase(report)
+        os.makedirs(cacheDir, exist_ok=True)
+        for fileNum in range(0, len(folder)):
+            cachePaths[fileNum] = getCachePath(filePaths[fileNum], cacheDir, PARSER_VERSION)
+            allFileData[fileNum] = loadCachedFile(cachePaths[fileNum], fileNum)
+            if allFileData[fileNum] is not None and exportCSV and not all("CSV" in cpuData for cpuData in allFileData[fileNum].values()):
+                allFileData[fileNum] = None
+
+    missing = [fileNum for fileNum in range(0, len(folder)) if allFileData[fileNum] is None]
+    if cacheDir is not None:
+        endPhase(report, "read cache", start, fileCount=len(folder) - len(missing))
+        print(vendorName, "cache hits:", len(folder) - len(missing), "misses:", len(missing))
+
+    missingPaths = [filePaths[fileNum] for fileNum in missing]
+    missingCachePaths = [cachePaths[fileNum] for fileNum in missing]
+    missingExport = [exportCSV] * len(missing)
+    start = startPhase(report)
+    prefetch = pool is None and (prefetchDepth > 0 or readFile is not None)
+    if prefetch:
+        # reading and parsing are timed apart by readPrefetched
+        missingData = readPrefetched(missingPaths, missing, missingCachePaths, exportCSV, prefetchDepth, readFile or readFileBytes, report)
+    elif pool is None:
+        missingData = map(readLogFile, missingPaths, missing, missingCachePaths, missingExport)
+    else:
+        missingData = pool.map(readLogFile, missingPaths, missing, missingCachePaths, missingExport)
+    for fileNum, fileData in zip(missing, missingData):
+        allFileData[fileNum] = fileData
+    if report is not None and not prefetch:
+        endPhase(report, "read parse", start, sum(os.path.getsize(filePath) for filePath in missingPaths), fileCount=len(missing))
+
+    # reads through all files in folder in file order, CPUs of each file in number order
+    csvTime, csvBytes, csvFiles = 0.0, 0, set()
+    for fileData in allFileData:
+        if exportCSV:
+            start = time.perf_counter()
+            for cpuNum in fileData:
+                for marginType in ["RankMargin", "LaneMargin", "CALaneMargin"]:
+                    csvName = vendorName + "_CPU" + cpuNum + "_" + marginType + ".csv"
+                    createCSVFile(csvExport, csvName, fileData[cpuNum]["CSV"][marginType])
+                    csvBytes = csvBytes + len(fileData[cpuNum]["CSV"][marginType])
+                    csvFiles.add(csvName)
+            csvTime = csvTime + time.perf_counter() - start
+
+        for cpuNum in fileData:
+            cpuMargins = allMargins.setdefault(cpuNum, {"RankMargin": [], "LaneMargin": [], "CALaneMargin": []})
+            for marginType in cpuMargins:
+                cpuMargins[marginType].append(fileData[cpuNum][marginType])
+
+        # variable lists are taken from the first CPU of the last file with CPU data
+        if len(fileData) > 0:
+            firstCPU = next(iter(fileData))
+            rankVarList, caLaneVarList = fileData[firstCPU]["RankVarList"], fileData[firstCPU]["CALaneVarList"]
+    if exportCSV:
+        addToPhase(report, "read csv", csvTime, len(allFileData), csvBytes, fileCount=len(csvFiles))
+
+    start = startPhase(report)
+    socketStores = {}
+    for cpuNum in sorted(allMargins, key=int):
+        socketStores[cpuNum] = {marginType: mergeMarginStores(allMargins[cpuNum][marginType]) for marginType in allMargins[cpuNum]}
+    endPhase(report, "read merge", start, rowCount=sum(len(store["labels"]) for cpuStores in socketStores.values() for store in cpuStores.values()))
+
+    if queryIndex:
+        # imported here since DDR5_RMT_Query reads the folders with readData
+        from DDR5_RMT_Query import makeQueryIndex
+        start = startPhase(report)
+        for cpuStores in socketStores.values():
+            for store in cpuStores.values():
+                store["index"] = makeQueryIndex(store)
+        endPhase(report, "read index", start, rowCount=sum(len(store["labels"]) for cpuStores in socketStores.values() for store in cpuStores.values()))
+    return socketStores, rankVarList, caLaneVarList
+
+
+def readFolder(folder, folderPath, vendorName, cacheDir, csvMode, prefetchDepth=0):
+    """
+    readFolder reads one folder with its own CSV files, it runs in a worker process when folders are read in parallel
+
+    Args:
+        folder (list): contains all files in folder
+        folderPath (str): path of folder
+        vendorName (str): name of vendor
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+        csvMode (str): 'truncate', 'version' or 'off', see openCSVExport
+        prefetchDepth (int): number of files read ahead of parsing, 0 to not read ahead
+
+    Returns:
+        tuple: same as readData
+        dict: run report of the worker process with the phases of reading the folder
+
+    """
+    report = openRunReport()
+    csvExport = openCSVExport(csvMode)
+    folderData = readData(folder, folderPath, vendorName, None, cacheDir, csvExport, report, prefetchDepth)
+    closeCSVExport(csvExport)
+    return folderData, report
+
+
+def readPrefetched(filePaths, fileNums, cachePaths, exportCSV, prefetchDepth, readFile, report=None):
+    """
+    readPrefetched parses files while the next files are read by prefetchFiles, the time waiting for files
+    and the time parsing them are recorded as separate phases
+
+    Args:
+        filePaths (list): contains paths of log files
+        fileNums (list): contains position of each file in folder
+        cachePaths (list): contains path of cache file of each file, None to not cache it
+        exportCSV (boolean): True if formats the CSV text
+        prefetchDepth (int): number of files read ahead of parsing, 0 reads each file when it is parsed
+        readFile (function): reader that gives the contents of a file
+        report (dict): run report from openRunReport, None to not record the phases
+
+    Yields:
+        dict: parsed data of each file from readLogFile, in file order
+
+    """
+    for pos, data, waitTime in prefetchFiles(filePaths, prefetchDepth, readFile):
+        addToPhase(report, "read wait", waitTime, 1, len(data), fileCount=1)
+        start = time.perf_counter()
+        fileData = readLogFile(filePaths[pos], fileNums[pos], cachePaths[pos], exportCSV, data)
+        addToPhase(report, "read parse", time.perf_counter() - start, 1, len(data), fileCount=1)
+        yield fileData
+
+
+def readLogFile(filePath, fileNum, cachePath=None, exportCSV=True, data=None):
+    """
+    readLogFile parses one log file and converts it into margin stores and CSV text, it runs in a worker 
+    process when files are read in parallel
+
+    Args:
+        filePath (str): path of log file
+        fileNum (int): position of file in folder
+        cachePath (str): path of cache file to save the result to, None to not cache it
+        exportCSV (boolean): True if formats the CSV text
+        data (bytes): contents of log file if it was already read, None reads the file
+
+    Returns:
+        dict: CPU number (str) of every CPU in the file, in number order, to a dict containing the margin store of each 
+              margin type, the variable lists and the CSV text of each margin type ("CSV") if exportCSV
+
+    """
+    # all CPUs are found in one pass over the file
+    cpuData = parseLogFile(filePath, data)
 
+    fileData = {}
+    for cpuNum in sorted(cpuData, key=int):
         # separate each CPU data in lists by margin type 
-        rankMarginCPU0, laneMarginCPU0, caLaneMarginCPU0, rankVarListCPU0, caLaneVarListCPU0 = separateCPU(dataCPU0, str(0), vendorName)
-        rankMarginCPU1, laneMarginCPU1, caLaneMarginCPU1, rankVarListCPU1, caLaneVarListCPU1 = separateCPU(dataCPU1, str(1), vendorName)
+        rankMargin, laneMargin, caLaneMargin, rankVarList, caLaneVarList, csvText = separateCPU(cpuData[cpuNum], exportCSV)
+
+        # convert rows to integer arrays once, while the file's rows are still small
+        fileData[cpuNum] = {"RankMargin": makeMarginStore(rankMargin, fileNum), "LaneMargin": makeMarginStore(laneMargin, fileNum),
+                            "CALaneMargin": makeMarginStore(caLaneMargin, fileNum), "RankVarList": rankVarList, 
+                            "CALaneVarList": caLaneVarList}
+        if exportCSV:
+            fileData[cpuNum]["CSV"] = csvText
+
+    if cachePath is not None:
+        saveCachedFile(cachePath, fileData)
+    return fileData
+
+
+def makeMarginStore(marginData, fileNum):
+    """
+    makeMarginStore converts the rows of one margin type into a columnar store, with the absolute 
+    margin of each variable saved as an integer array
+
+    Args:
+        marginData (list): contains all lines of data for margin type
+        fileNum (int): position of file in folder
+
+    Returns:
+        dict: contains the row names ("labels"), the fields of each row name ("rowKeys", see decodeRowKeys),
+              the absolute margins with one row per variable ("values") and the position of the file of each row ("fileIndex")
+
+    """
+    # rows cut short (e.g. the last row of a truncated capture) and stray lines are dropped, a full row has
+    # as many columns as most rows
+    if len(marginData) > 0:
+        varNum = collections.Counter(len(row) for row in marginData).most_common(1)[0][0]
+        marginData = [row for row in marginData if len(row) >= varNum]
+        try:
+            values = np.array([row[1:varNum] for row in marginData]).astype(np.int16)
+        except ValueError:
+            # rows are only checked one by one when a number was cut off or a line is not numbers
+            marginData = [row for row in marginData if isMarginRow(row, varNum)]
+            values = np.array([row[1:varNum] for row in marginData], dtype=str).reshape(len(marginData), varNum - 1).astype(np.int16)
+
+    if len(marginData) == 0:
+        return {"labels": np.array([], dtype=str), "rowKeys": decodeRowKeys([]), "values": np.zeros((0, 0), dtype=np.int16), 
+                "fileIndex": np.zeros(0, dtype=np.int32)}
+
+    labels = np.array([row[0] for row in marginData])
+    values = np.abs(values)
+
+    return {"labels": labels, "rowKeys": decodeRowKeys(labels.tolist()), "values": np.ascontiguousarray(values.T), 
+            "fileIndex": np.full(len(marginData), fileNum, dtype=np.int32)}
+
+
+def isMarginRow(row, varNum):
+    """
+    isMarginRow checks if a row has a number for every variable
+
+    Args:
+        row (list): contains the columns of one line of margin data
+        varNum (int): number of columns of a full row, with the row name
+
+    Returns:
+        boolean: True if every column after the row name is a whole number
+
+    """
+    return all(value.lstrip("+-").isdigit() for value in row[1:varNum])
+
+
+def decodeRowKeys(labels):
+    """
+    decodeRowKeys reads the socket, channel, DIMM, rank, subchannel, lane and strobe number of each row name once,
+    so graphs are grouped by indexing arrays instead of cutting up row names
+
+    Args:
+        labels (list): contains row name of each row (e.g. 'N0.C1.D0.R1.L12:')
+
+    Returns:
+        array: contains one row per field of ROW_FIELDS with the number of each row name, -1 if the row name does not have the field
+
+    """
+    rowKeys = np.full((len(ROW_FIELDS), len(labels)), -1, dtype=np.int16)
+    for i in range(0, len(labels)):
+        for part in labels[i].rstrip(":").split("."):
+            letters = part.rstrip("0123456789")
+            if letters in ROW_FIELD_LETTERS and len(letters) < len(part):
+                rowKeys[ROW_FIELD_LETTERS[letters], i] = int(part[len(letters):])
+    return rowKeys
 
-        allRankMarginCPU0.extend(rankMarginCPU0)
-        allLaneMarginCPU0.extend(laneMarginCPU0)
-        allCALaneMarginCPU0.extend(caLaneMarginCPU0)
 
-        allRankMarginCPU1.extend(rankMarginCPU1)
-        allLaneMarginCPU1.extend(laneMarginCPU1)
-        allCALaneMarginCPU1.extend(caLaneMarginCPU1)
+def getRowGroups(rowKeys, fields):
+    """
+    getRowGroups numbers every distinct combination of some fields of the row names, in the order they first appear
+
+    Args:
+        rowKeys (array): fields of each row from decodeRowKeys
+        fields (list): contains the positions in ROW_FIELDS of the fields to group by
+
+    Returns:
+        array: contains group number of each row
+        array: contains the first row of each group
+
+    """
+    # fields a row name does not have are -1, encodeGroups needs non-negative keys
+    groupIndex, groupKeys = encodeGroups([rowKeys[field].astype(np.int64) + 1 for field in fields])
+    firstRow = np.full(len(groupKeys[0]), rowKeys.shape[1], dtype=np.int64)
+    np.minimum.at(firstRow, groupIndex, np.arange(rowKeys.shape[1]))
+
+    order = np.argsort(firstRow, kind='stable')
+    groupNums = np.empty(len(order), dtype=np.int64)
+    groupNums[order] = np.arange(len(order))
+    return groupNums[groupIndex], firstRow[order]
+
+
+def hasLanes(marginList):
+    """
+    hasLanes checks if the rows of a margin store are lanes (lane and CA lane margins), which have average bit margin graphs
+
+    Args:
+        marginList (dict): margin store of one vendor for one margin
+
+    Returns:
+        boolean: True if any row has a lane number
+
+    """
+    return bool(np.any(marginList["rowKeys"][LANE_FIELD] >= 0))
+
+
+def getLaneRows(marginList):
+    """
+    getLaneRows keeps the rows of a margin store that have a lane number, the only rows of the bit margin graphs
+
+    Args:
+        marginList (dict): margin store of one vendor for one margin
+
+    Returns:
+        dict: margin store of the rows with a lane number, the same store if every row has one
+
+    """
+    laneRows = marginList["rowKeys"][LANE_FIELD] >= 0
+    if laneRows.all():
+        return marginList
+    return {"labels": marginList["labels"][laneRows], "rowKeys": marginList["rowKeys"][:, laneRows],
+            "values": marginList["values"][:, laneRows], "fileIndex": marginList["fileIndex"][laneRows]}
+
+
+def getTabName(rowKeys, row):
+    """
+    getTabName gives the name of the sheet of a row, its socket and channel (e.g. 'N0.C1')
+
+    Args:
+        rowKeys (array): fields of each row from decodeRowKeys
+        row (int): position of row
 
-    return allRankMarginCPU0, allLaneMarginCPU0, allCALaneMarginCPU0, allRankMarginCPU1, allLaneMarginCPU1, allCALaneMarginCPU1, rankVarListCPU0, caLaneVarListCPU0
+    Returns:
+        str: name of sheet
+
+    """
+    return "N" + str(rowKeys[0, row]) + ".C" + str(rowKeys[1, row])
+
+
+def mergeMarginStores(marginStores):
+    """
+    mergeMarginStores combines the margin stores of all files in a folder into one store, using int8
+    for the margins when they fit
+
+    Args:
+        marginStores (list): contains margin stores of each file
+
+    Returns:
+        dict: margin store of all files
+
+    """
+    marginStores = [store for store in marginStores if len(store["labels"]) > 0]
+    if len(marginStores) == 0:
+        return makeMarginStore([], 0)
+
+    values = np.concatenate([store["values"] for store in marginStores], axis=1)
+    if values.size > 0 and values.max() <= np.iinfo(np.int8).max:
+        values = values.astype(np.int8)
+
+    return {"labels": np.concatenate([store["labels"] for store in marginStores]),
+            "rowKeys": np.concatenate([store["rowKeys"] for store in marginStores], axis=1),
+            "values": values,
+            "fileIndex": np.concatenate([store["fileIndex"] for store in marginStores])}
+
+
+def parseLogFile(filePath, data=None):
+    """
+    parseLogFile sorts the lines between 'START_RMT_N*' and 'STOP_RMT_N*' into rows for each CPU and margin type,
+    the file is memory mapped and only the marked regions are decoded, files that can not be mapped (e.g. gzip 
+    compressed files) are read line by line in a single pass
+
+    Args:
+        filePath (str): path of log file
+        data (bytes): contents of log file if it was already read (e.g. by prefetchFiles), None reads the file
+
+    Returns:
+        dict: CPU number (str) to a dict containing the rows of each margin type 
+              ("RankMargin", "LaneMargin", "CALaneMargin") and the variable lists ("RankVarList", "CALaneVarList")
+
+    """
+    logState = {"cpuStates": {}, "recording": []}
+
+    if data is not None:
+        if data[:2] == GZIP_MAGIC:
+            data = gzip.decompress(data)
+        encoding = locale.getpreferredencoding(False)
+        if isASCIICompatible(encoding):
+            readLogBuffer(data, logState, encoding)
+        else:
+            readLogLines(logState, io.StringIO(data.decode(encoding), newline=None))
+    elif not readMappedLog(filePath, logState):
+        with openLogFile(filePath) as file:
+            readLogLines(logState, file)
+
+    cpuData = {}
+    for cpuNum in logState["cpuStates"]:
+        cpuData[cpuNum] = finishCPUState(logState["cpuStates"][cpuNum])
+    return cpuData
+
+
+def openLogFile(filePath):
+    """
+    openLogFile opens a log file as text, gzip compressed files are decompressed while they are read
+
+    Args:
+        filePath (str): path of log file
+
+    Returns:
+        file: log file opened for reading text
+
+    """
+    with open(filePath, "rb") as file:
+        compressed = file.read(2) == GZIP_MAGIC
+    if compressed:
+        return gzip.open(filePath, "rt")
+    return open(filePath, "r")
 
 
-def separateCPU(data, cpuNum, vendorName):
+def readMappedLog(filePath, logState):
     """
-    separateCPU separates the rank and lane margin data for each CPU
+    readMappedLog memory maps a log file and finds the marker lines with a bytes search, only marker lines and
+    lines while a CPU is recording are decoded and read
+
+    Args:
+        filePath (str): path of log file
+        logState (dict): parser state of log file
+
+    Returns:
+        boolean: True if the file was read, False if it has to be read line by line instead
+
+    """
+    encoding = locale.getpreferredencoding(False)
+    if not isASCIICompatible(encoding):
+        return False
+
+    try:
+        with open(filePath, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0 or file.read(2) == GZIP_MAGIC:
+                return False
+            mappedFile = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+
+    with mappedFile:
+        readLogBuffer(mappedFile, logState, encoding)
+    return True
+
+
+def isASCIICompatible(encoding):
+    """
+    isASCIICompatible checks if markers and line ends can be found in the bytes of a log file, which is
+    only true when the text encoding keeps them as ASCII
+
+    Args:
+        encoding (str): text encoding of log files
+
+    Returns:
+        boolean: True if markers and line ends are ASCII in the encoding
+
+    """
+    return "RMT_N\n".encode(encoding, errors="replace") == b"RMT_N\n"
+
+
+def readLogBuffer(buffer, logState, encoding):
+    """
+    readLogBuffer finds the marker lines of a log file in memory with a bytes search, only marker lines and
+    lines while a CPU is recording are decoded and read
+
+    Args:
+        buffer (bytes): contents of log file, bytes or a memory mapped file
+        logState (dict): parser state of log file
+        encoding (str): text encoding of log file, must be ASCII compatible
+
+    """
+    start = 0
+    markerPos = buffer.find(b"RMT_N")
+    while markerPos != -1:
+        lineStart = buffer.rfind(b"\n", start, markerPos) + 1
+        lineEnd = buffer.find(b"\n", markerPos) + 1
+        if lineEnd == 0:
+            lineEnd = len(buffer)
+
+        # lines before the marker line are skipped when no CPU is recording
+        regionStart = start if logState["recording"] else max(start, lineStart)
+        readLogLines(logState, io.StringIO(buffer[regionStart:lineEnd].decode(encoding), newline=None))
+
+        start = lineEnd
+        markerPos = buffer.find(b"RMT_N", start)
+
+    if logState["recording"] and start < len(buffer):
+        readLogLines(logState, io.StringIO(buffer[start:].decode(encoding), newline=None))
+
+
+def readLogLines(logState, lines):
+    """
+    readLogLines starts and stops recording each CPU at its markers and moves the lines of recording CPUs
+    into their margin sections
+
+    Args:
+        logState (dict): parser state of log file, with the parser state of each CPU ("cpuStates") and 
+                         the CPUs that are recording ("recording")
+        lines (iterable): lines of log file, with universal newlines like a file opened as text
+
+    """
+    cpuStates = logState["cpuStates"]
+    recording = logState["recording"]
+
+    for line in lines:
+        # only lines with a marker can start or stop recording a CPU
+        if "RMT_N" in line:
+            started = findMarkers(line, "START_RMT_N")
+            stopped = findMarkers(line, "STOP_RMT_N")
+            for cpuNum in started:
+                if not cpuNum in cpuStates:
+                    cpuStates[cpuNum] = makeCPUState(cpuNum)
+            recording = [cpuNum for cpuNum in cpuStates if (cpuNum in recording or cpuNum in started) and not cpuNum in stopped]
+
+        # each line is read once the next one arrives, the last line of a CPU is read by finishCPUState
+        for cpuNum in recording:
+            cpuState = cpuStates[cpuNum]
+            if cpuState["lastLine"] is not None:
+                readCPULine(cpuState, cpuState["lastLine"])
+            cpuState["lastLine"] = line
+
+    logState["recording"] = recording
+
+
+def findMarkers(line, marker):
+    """
+    findMarkers finds the CPU numbers of every marker in a line
+
+    Args:
+        line (str): line of log file
+        marker (str): 'START_RMT_N' or 'STOP_RMT_N'
+
+    Returns:
+        list: contains CPU numbers (str) that follow the marker
+
+    """
+    cpuNums = []
+    pos = line.find(marker)
+    while pos != -1:
+        start = end = pos + len(marker)
+        while end < len(line) and line[end].isdigit():
+            end = end + 1
+        if end > start:
+            cpuNums.append(line[start:end])
+        pos = line.find(marker, end)
+    return cpuNums
+
+
+def makeCPUState(cpuNum):
+    """
+    makeCPUState creates the parser state of one CPU
 
     Args:
-        data (str): all data from folder for one CPU
         cpuNum (str): CPU number
-        vendorName (str): name of vendor
-        
+
     Returns:
-        list: contains all rank margin data for CPU
-        list: contains all lane margin data for CPU
-        list: contains all CA lane margin data for CPU without '*'
-        list: contains all rank margin variables
-        list: contains all CA lane margin variables
+        dict: parser state of CPU
 
-    """ 
-    rankMargin = data[data.find("Rank Margin"):data.find("Lane Margin")]
-    laneMargin = data[data.find("Lane Margin"):data.find("CA Lane Margin")]
-    caLaneMargin = data[data.find("CA Lane Margin"):]
+    """
+    sections = {}
+    for marginType, header, firstVar in MARGIN_SECTIONS:
+        sections[marginType] = {"firstVar": firstVar, "rowsStarted": False, "committed": [], "pending": [], "foundIoLevel": False, 
+                                "firstLine": True, "foundRowLine": False, "varState": "search", "varText": []}
+    return {"cpuTag": "N" + cpuNum, "section": -1, "sections": sections, "lastLine": None}
 
-    rankVarList = rankMargin[rankMargin.find("RxDqs-"):rankMargin.find("\nN" + cpuNum)]
-    rankVarList = list(filter(None, rankVarList.split(" ")))
 
-    caLaneVarList = caLaneMargin[caLaneMargin.find("Ca-"):caLaneMargin.find("\nN" + cpuNum)]
-    caLaneVarList = list(filter(None, caLaneVarList.split(" ")))
+def readCPULine(cpuState, line, lastLine=False):
+    """
+    readCPULine moves one line of CPU data into the margin section it belongs to
 
-    # separate each CPU data in lists by line
-    rankMargin = separateMarginData(rankMargin, "CPU" + cpuNum + "_RankMargin", vendorName)
-    laneMargin = separateMarginData(laneMargin, "CPU" + cpuNum + "_LaneMargin", vendorName)
-    caLaneMargin = separateMarginData(caLaneMargin, "CPU" + cpuNum + "_CALaneMargin", vendorName)
+    Args:
+        cpuState (dict): parser state of CPU
+        line (str): line of log file
+        lastLine (boolean): True if it is the last line of the CPU data
 
-    changedCALaneMargin = []
+    """
+    # a header can only start a section that comes after the current one
+    if "Margin" in line:
+        for sectionNum in range(len(MARGIN_SECTIONS) - 1, cpuState["section"], -1):
+            headerPos = line.find(MARGIN_SECTIONS[sectionNum][1])
+            if headerPos != -1:
+                # rank section always ends at the first 'Lane Margin', even when it is part of 'CA Lane Margin'
+                endPos = line.find("Lane Margin") if cpuState["section"] == 0 else headerPos
+                if cpuState["section"] != -1:
+                    readSectionLine(cpuState["sections"][MARGIN_SECTIONS[cpuState["section"]][0]], line[:endPos], cpuState["cpuTag"])
+                cpuState["section"] = sectionNum
+                line = line[headerPos:]
+                break
+
+    if cpuState["section"] != -1:
+        # a section without the next header after it loses the last character of the CPU data
+        if lastLine and cpuState["section"] < len(MARGIN_SECTIONS) - 1:
+            line = line[:-1]
+        readSectionLine(cpuState["sections"][MARGIN_SECTIONS[cpuState["section"]][0]], line, cpuState["cpuTag"])
+
+
+def readSectionLine(section, line, cpuTag):
+    """
+    readSectionLine saves the variable list and the margin rows of a section, which are all lines 
+    from the first CPU tag (e.g. 'N0') up to the last line starting with 'IoLevel'
 
-    for i in range(0, len(caLaneMargin)):
-        if not '*' in caLaneMargin[i]:
-            changedCALaneMargin.append(caLaneMargin[i])
+    Args:
+        section (dict): parser state of margin section
+        line (str): line of margin section
+        cpuTag (str): 'N' + CPU number
 
+    """
+    # once the rows have started and the variable list is finished, only 'IoLevel' lines matter
+    if section["foundRowLine"] and section["rowsStarted"]:
+        if line.startswith("IoLevel"):
+            section["foundIoLevel"] = True
+            section["committed"].extend(section["pending"])
+            section["pending"] = [line]
+        else:
+            section["pending"].append(line)
+        return
+
+    firstLine = section["firstLine"]
+    section["firstLine"] = False
+
+    # variable list ends at the first line starting with the CPU tag
+    if not firstLine and not section["foundRowLine"] and line.startswith(cpuTag):
+        section["foundRowLine"] = True
+        section["varState"] = "done" if section["varState"] == "saving" else "missing"
+    if section["varState"] == "search" and section["firstVar"] is not None:
+        varPos = line.find(section["firstVar"])
+        if varPos != -1:
+            section["varState"] = "saving"
+            section["varText"].append(line[varPos:])
+    elif section["varState"] == "saving":
+        section["varText"].append(line)
+
+    # rows are kept once another 'IoLevel' line confirms them
+    if not section["rowsStarted"]:
+        if not firstLine and line.startswith("IoLevel"):
+            section["foundIoLevel"] = True
+        rowPos = line.find(cpuTag)
+        if rowPos != -1:
+            section["rowsStarted"] = True
+            section["pending"].append(line[rowPos:])
+    elif line.startswith("IoLevel"):
+        section["foundIoLevel"] = True
+        section["committed"].extend(section["pending"])
+        section["pending"] = [line]
+    else:
+        section["pending"].append(line)
 
-    return rankMargin, laneMargin, changedCALaneMargin, rankVarList, caLaneVarList
 
+def finishCPUState(cpuState):
+    """
+    finishCPUState reads the last line of the CPU data and splits the saved rows of each margin section into columns
+
+    Args:
+        cpuState (dict): parser state of CPU
+
+    Returns:
+        dict: contains the rows of each margin type and the variable lists
 
-def separateMarginData(data, marginType, vendorName):
     """
-    separateMarginData separates line of data for each margin
+    if cpuState["lastLine"] is not None:
+        readCPULine(cpuState, cpuState["lastLine"], True)
+        cpuState["lastLine"] = None
+
+    cpuData = {}
+    for sectionNum in range(0, len(MARGIN_SECTIONS)):
+        marginType, header, firstVar = MARGIN_SECTIONS[sectionNum]
+        section = cpuState["sections"][marginType]
+
+        # rows end at the newline before the last 'IoLevel' line, or one character before the end without one
+        text = "".join(section["committed"])[:-1]
+        if section["rowsStarted"] and not section["foundIoLevel"]:
+            text = "".join(section["pending"])
+            text = text[:-1]
+        cpuData[marginType] = splitRows(text)
+
+        if firstVar is not None:
+            varText = ""
+            if section["varState"] == "done":
+                varText = "".join(section["varText"])[:-1]
+            elif section["varState"] == "saving":
+                varText = "".join(section["varText"])
+                varText = varText[:-1]
+            cpuData[marginType[:-6] + "VarList"] = list(filter(None, varText.split(" ")))
+    return cpuData
+
+
+def splitRows(text):
+    """
+    splitRows splits the saved text of a margin section into rows of columns separated by spaces
 
     Args:
-        data (str): all data from folder for one type of margin (e.g. rank, lane)
-        marginType (str): type of margin
-        vendorName (str): name of vendor
-        
+        text (str): saved text of margin section
+
     Returns:
         list: contains all lines of data for margin type
 
+    """
+    # split() is much faster and gives the same columns when spaces are the only whitespace left in a line
+    if text.isascii() and text.find("\t") == -1 and text.find("\x1f") == -1:
+        return [line.split() for line in text.splitlines()]
+    return [list(filter(None, line.split(" "))) for line in text.splitlines()]
+
+
+def separateCPU(cpuData, exportCSV=True):
+    """
+    separateCPU separates the rank and lane margin data for each CPU and formats it for the CSV files
+
+    Args:
+        cpuData (dict): parsed data of one CPU from parseLogFile, None if the CPU is not in the file
+        exportCSV (boolean): True if formats the CSV text
+        
+    Returns:
+        list: contains all rank margin data for CPU
+        list: contains all lane margin data for CPU
+        list: contains all CA lane margin data for CPU without '*'
+        list: contains all rank margin variables
+        list: contains all CA lane margin variables
+        dict: contains CSV text of each margin type, CA lane margin includes '*', None if not exportCSV
+
     """ 
-    data = data[data.find("N" + marginType[3]):data.rfind("\nIoLevel")]
-    data = data.splitlines()
-    for i in range(0, len(data)):
-        data[i] = list(filter(None, data[i].split(" ")))
-    createCSVFile(vendorName + "_" + marginType + '.csv', data)
-    return data
+    if cpuData is None:
+        cpuData = {"RankMargin": [], "LaneMargin": [], "CALaneMargin": [], "RankVarList": [], "CALaneVarList": []}
 
+    csvText = None
+    if exportCSV:
+        csvText = {}
+        for marginType in ["RankMargin", "LaneMargin", "CALaneMargin"]:
+            csvText[marginType] = formatCSV(cpuData[marginType])
 
-def makeGraphs(allMarginList, variableList, vendorNames, includeLine, bootstrap, marginType, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, numFiles, varNum):    
+    changedCALaneMargin = []
+
+    for i in range(0, len(cpuData["CALaneMargin"])):
+        if not '*' in cpuData["CALaneMargin"][i]:
+            changedCALaneMargin.append(cpuData["CALaneMargin"][i])
+
+
+    return cpuData["RankMargin"], cpuData["LaneMargin"], changedCALaneMargin, cpuData["RankVarList"], cpuData["CALaneVarList"], csvText
+
+
+def makeGraphs(allMarginList, variableList, vendorNames, includeLine, bootstrap, marginType, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, varNum, 
+               replicates=BOOTSTRAP_REPLICATES, seed=BOOTSTRAP_SEED, changedVendors=None, allLaneGroups=None, allAccumulators=None,
+               chartMode="image", report=None, thresholdList=None):    
     """
-    makeGraphs plots each type of graph/table that was selected in the GUI
+    makeGraphs calculates the statistics and makes a render job for each type of graph/table that was selected in the GUI
 
     Args:
-        allMarginList (list): contains all data for one margin
+        allMarginList (list): contains margin store of each vendor for one margin
         variableList (list): contains all variables
         vendorNames (list): contains all vendor names
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
-        bootstrap (str): 'Y' if yes, 'N' if no - decides if data is bootstrapped
+        bootstrap (str): 'Y' if yes, 'N' if no - decides if tables include bootstrap confidence intervals
         marginType (str): type of margin
         histogram (boolean): True if graphs histogram
         vendorTable (boolean): True if creates vendor table
@@ -215,101 +1072,439 @@ def makeGraphs(allMarginList, variableList, vendorNames, includeLine, bootstrap,
         varTable (boolean): True if creates variable table
         bitMarg (boolean): True if graphs bit margin (scatterplot)
         comparator (boolean): True if graphs average bit margin (line graph)
-        numFiles (int): number of files in folder
         varNum (int): number of variables to plot
+        replicates (int): number of bootstrap replicates
+        seed (int): seed of the bootstrap random number generator
+        changedVendors (list): True for each vendor whose data changed, graphs of a single vendor are only made
+                               for changed vendors, None makes them for all vendors
+        allLaneGroups (list): contains average of each lane of each vendor from makeLaneGroups, None finds them from allMarginList
+        allAccumulators (list): contains accumulator of each vendor from addToAccumulator, None counts allMarginList
+        chartMode (str): 'image' or 'native', see processData
+        report (dict): run report from openRunReport, None to not record the phases
+        thresholdList (list): contains the threshold of each variable from getThresholdList, None uses DEFAULT_THRESHOLD
+
+    Returns:
+        list: contains render jobs in the order they would be drawn one after another, see runRenderJobs
 
     """ 
+    renderJobs = []
+    fileType = marginType.replace(" ", "_")
+    cpuName = marginType.split(" ")[0]
+
+    # statistics of every variable and vendor are calculated once and shared by all graphs and tables
+    if boxPlot or varTable or vendorTable or histogram:
+        start = startPhase(report)
+        allAccumulators, allMean, allMedian, allSD, allIQR, allMeanSD1, allMeanSD2, allMeanSD3 = calculateStats(allMarginList, allAccumulators)
+        endPhase(report, "stats summary", start, rowCount=sum(len(marginList["labels"]) for marginList in allMarginList))
+
+        # tables show the confidence interval next to each statistic, histograms keep the plain values
+        tableMean, tableMedian, tableSD, tableMeanSD1, tableMeanSD2, tableMeanSD3 = allMean, allMedian, allSD, allMeanSD1, allMeanSD2, allMeanSD3
+        if bootstrap == "Y" and (varTable or vendorTable):
+            start = startPhase(report)
+            intervals = calculateIntervals(allMarginList, replicates, seed)
+            endPhase(report, "stats bootstrap", start, rowCount=sum(len(marginList["labels"]) for marginList in allMarginList))
+            tableMean = addIntervals(allMean, intervals["Mean"])
+            tableMedian = addIntervals(allMedian, intervals["Median"])
+            tableSD = addIntervals(allSD, intervals["SD"])
+            tableMeanSD1 = addIntervals(allMeanSD1, intervals["Mean-1SD"])
+            tableMeanSD2 = addIntervals(allMeanSD2, intervals["Mean-2SD"])
+            tableMeanSD3 = addIntervals(allMeanSD3, intervals["Mean-3SD"])
+
     if boxPlot:
-        boxFig, boxAxs = plt.subplots(2, varNum//2)
+        renderJobs.append(makeRenderJob(fileType + "BoxPlot.pdf", renderBoxPlot, 
+                                        allAccumulators, vendorNames, variableList, includeLine, marginType, varNum, thresholdList))
 
     if varTable:
-        tableFig, tableAxs = plt.subplots(2, varNum//2)
+        renderJobs.append(makeRenderJob(fileType + "VarTable.pdf", renderVarTable, 
+                                        tableMean, tableMedian, tableSD, allIQR, tableMeanSD1, tableMeanSD2, tableMeanSD3, vendorNames, variableList, marginType, varNum))
+
+    if vendorTable:
+        renderJobs.append(makeRenderJob(fileType + "VendorTable.pdf", makeTable, 
+                                        variableList, vendorNames, tableMean, tableMedian, tableSD, allIQR, tableMeanSD1, tableMeanSD2, tableMeanSD3, marginType))
+
+    # a vendor without data for the margin has an empty store, the other vendors still get bit margin graphs
+    laneLabels = any(hasLanes(marginList) for marginList in allMarginList)
+    for i in range(0, len(vendorNames)):
+        if changedVendors is not None and not changedVendors[i]:
+            continue
+
+        if histogram:
+            renderJobs.append(makeRenderJob(vendorNames[i] + "_" + fileType + "Histogram.pdf", renderHistogram, 
+                                            allAccumulators[i], [mean[i] for mean in allMean], [sd[i] for sd in allSD], variableList, vendorNames[i], marginType, includeLine, varNum, thresholdList))
+
+        # lane and CA lane bit margin graphs of the same vendor and CPU are saved to the same png files
+        if laneLabels and bitMarg and not hasLanes(allMarginList[i]):
+            print("Skipped", vendorNames[i], marginType, "bit margin, no lanes")
+        elif laneLabels and bitMarg:
+            renderJobs.append(makeRenderJob(vendorNames[i] + fileType + "BitMargin.xlsx", makeBitMargin, 
+                                            allMarginList[i], variableList, includeLine, vendorNames[i], varNum, marginType, chartMode, thresholdList, chain="BitMargin " + vendorNames[i] + " " + cpuName))
+
+    # each vendor adds its line to the same average bit margin graphs, so all vendors are one job
+    if laneLabels and comparator:
+        if allLaneGroups is None:
+            start = startPhase(report)
+            allLaneGroups = [makeLaneGroups(marginList) for marginList in allMarginList]
+            endPhase(report, "stats lanes", start, rowCount=sum(len(marginList["labels"]) for marginList in allMarginList))
+        renderJobs.append(makeRenderJob(fileType + "_Comparison.xlsx", renderComparator, 
+                                        allLaneGroups, variableList, includeLine, vendorNames, varNum, marginType, chartMode, thresholdList, chain="Comparator " + cpuName))
+
+    return renderJobs
+
+
+def makeRenderJob(name, function, *args, chain=None):
+    """
+    makeRenderJob makes a job that draws and saves one graph/table file
+
+    Args:
+        name (str): name of the file the job saves
+        function (function): function that draws and saves the file
+        *args: arguments of function
+        chain (str): jobs with the same chain save to the same files and are run one after another, 
+                     None if the job only saves its own files
+
+    Returns:
+        dict: contains the file name ("name"), chain ("chain"), function ("function") and arguments ("args")
+
+    """
+    if chain is None:
+        chain = name
+    return {"name": name, "chain": chain, "function": function, "args": args}
+
+
+def runRenderJobs(renderJobs, renderWorkers=1, report=None):
+    """
+    runRenderJobs draws and saves all graphs/tables and prints how long each one took, jobs of different
+    chains are drawn in parallel when renderWorkers is not 1
+
+    Args:
+        renderJobs (list): contains render jobs from makeGraphs
+        renderWorkers (int): number of processes drawing graphs/tables, 1 draws them one after another, None uses every core
+        report (dict): run report from openRunReport, None to not record the render time of each kind of graph/table
+
+    Returns:
+        list: contains the file name and render time in seconds of each job, in job order
+
+    """
+    # jobs that save the same files keep the order they had in renderJobs
+    chains = {}
+    for renderJob in renderJobs:
+        chains.setdefault(renderJob["chain"], []).append(renderJob)
+
+    start = time.perf_counter()
+    chainResults = {}
+    if renderWorkers == 1 or len(chains) < 2:
+        # one figure manager for all chains, so figures are reused across margins
+        figureManager = openFigureManager()
+        for chain in chains:
+            chainResults[chain] = runRenderChain(chains[chain], figureManager)
+        figureCount, graphCount = closeFigureManager(figureManager)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=renderWorkers, initializer=initRenderWorker) as pool:
+            chainJobs = {chain: pool.submit(runRenderChain, chains[chain]) for chain in chains}
+            for chain in chainJobs:
+                chainResults[chain] = chainJobs[chain].result()
+        figureCount = sum(chainResults[chain][1] for chain in chainResults)
+        graphCount = sum(chainResults[chain][2] for chain in chainResults)
+    totalTime = time.perf_counter() - start
+
+    renderTimes = []
+    chainPos = {chain: 0 for chain in chains}
+    for renderJob in renderJobs:
+        renderTimes.append((renderJob["name"], chainResults[renderJob["chain"]][0][chainPos[renderJob["chain"]]]))
+        chainPos[renderJob["chain"]] = chainPos[renderJob["chain"]] + 1
+
+    for renderJob, (name, renderTime) in zip(renderJobs, renderTimes):
+        # files of a chain are saved by its last job, so earlier jobs may have no file yet
+        fileSize = os.path.getsize(name) if os.path.isfile(name) else None
+        if fileSize is not None:
+            print("Rendered", name, "in", round(renderTime, 3), "s,", round(fileSize / 1024, 1), "KB")
+        else:
+            print("Rendered", name, "in", round(renderTime, 3), "s")
+        addToPhase(report, "render " + renderJob["function"].__name__, renderTime, 1, fileSize or 0, fileCount=1 if fileSize is not None else 0)
+    print("Rendered", len(renderTimes), "files in", round(totalTime, 3), "s,", graphCount, "graphs drawn on", figureCount, "figures")
+    if report is not None:
+        report["figures"] = report["figures"] + figureCount
+        report["graphs"] = report["graphs"] + graphCount
+        report["renderSeconds"] = report["renderSeconds"] + totalTime
+
+    peakMemories = [chainResults[chain][3] for chain in chainResults if chainResults[chain][3] is not None]
+    if peakMemories:
+        print("Peak memory of render processes:", round(max(peakMemories), 1), "MB")
+    return renderTimes
+
+
+def runRenderChain(chain, figureManager=None):
+    """
+    runRenderChain runs render jobs one after another
+
+    Args:
+        chain (list): contains render jobs of one chain
+        figureManager (dict): figure manager from openFigureManager, None opens one for this chain and closes it after
 
-    if comparator:
-        compGraphs = makeCompGraphs(allMarginList[0], varNum)
+    Returns:
+        list: contains render time in seconds of each job
+        int: number of figures opened
+        int: number of graphs drawn
+        float: peak memory of the process in MB, None if it can not be read
 
-    allMean = []
-    allMedian = []
-    allSD = []
-    allIQR = []
-    allMeanSD1 = []
-    allMeanSD2 = []
-    allMeanSD3 = []
+    """
+    closeManager = figureManager is None
+    if closeManager:
+        figureManager = openFigureManager()
+    figureCount = len(figureManager["figures"]) + figureManager["opened"]
+    graphCount = figureManager["graphs"]
+
+    renderTimes = []
+    for renderJob in chain:
+        start = time.perf_counter()
+        renderJob["function"](*renderJob["args"], figureManager=figureManager)
+        renderTimes.append(time.perf_counter() - start)
+
+    figureCount = len(figureManager["figures"]) + figureManager["opened"] - figureCount
+    graphCount = figureManager["graphs"] - graphCount
+    if closeManager:
+        closeFigureManager(figureManager)
+    return renderTimes, figureCount, graphCount, peakMemoryMB()
+
+
+def initRenderWorker():
+    """
+    initRenderWorker draws off screen in render processes, so no window system is needed, and stops
+    profiling inherited from the main process
+
+    """
+    initReportWorker()
+    import matplotlib.pyplot as plt
+    plt.switch_backend("Agg")
+
+
+def renderBoxPlot(allAccumulators, vendorNames, variableList, includeLine, marginType, varNum, thresholdList=None, figureManager=None):
+    """
+    renderBoxPlot creates and saves the box plots of all variables for one margin, PAGE_VENDORS vendors per page
+
+    Args:
+        allAccumulators (list): contains accumulator of each vendor
+        vendorNames (list): contains all vendor names
+        variableList (list): contains all variables
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        marginType (str): type of margin
+        varNum (int): number of variables to plot
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
+
+    """
+    allBoxStats = [[getBoxStats(allAccumulators[j], i - 1, vendorNames[j]) for j in range(0, len(vendorNames))] for i in range(1, varNum)]
+    pageList = getPages(len(vendorNames), PAGE_VENDORS)
+    pages = openPages(marginType.replace(" ", "_") + "BoxPlot.pdf", len(pageList))
+
+    for pageNum in range(0, len(pageList)):
+        start, stop = pageList[pageNum]
+        boxFig, boxAxs = getFigure(figureManager, "boxPlot", 2, varNum//2)
 
-    if boxPlot or varTable or vendorTable:
         for i in range(1, varNum):
-            columns, x, y, mean, median, sd, iqr, meanSD1, meanSD2, meanSD3 = calculateStats(allMarginList, i, bootstrap, varNum)
-
-            if boxPlot:
-                makeBoxPlot(columns, vendorNames, variableList[i - 1], boxAxs[x, y], includeLine)
-
-            if varTable:
-                makeVarTable(mean, median, sd, iqr, meanSD1, meanSD2, meanSD3, vendorNames, variableList[i-1], tableAxs[x, y])
-
-            if vendorTable:
-                allMean.append(mean)
-                allMedian.append(median)
-                allSD.append(sd)
-                allIQR.append(iqr)
-                allMeanSD1.append(meanSD1)
-                allMeanSD2.append(meanSD2)
-                allMeanSD3.append(meanSD3)
-
-        if boxPlot:
-            boxFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.3, hspace=0.3)
-            boxFig.suptitle(marginType)
-            boxFig.savefig(marginType.replace(" ", "_") + "BoxPlot.pdf")
-
-        if varTable:
-            # different spacing between tables according to number of tables
-            if len(vendorNames) == 1:
-                tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=1.5, hspace=0.3)
-            elif len(vendorNames) == 2:
-                tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.8, hspace=0.3)
-            elif len(vendorNames) == 3:
-                tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.4, hspace=0.3)
-            tableFig.suptitle(marginType)
-            tableFig.savefig(marginType.replace(" ", "_") + "VarTable.pdf", bbox_inches='tight')
-
-        if vendorTable:
-            makeTable(variableList, vendorNames, allMean, allMedian, allSD, allIQR, allMeanSD1, allMeanSD2, allMeanSD3, marginType)
-
-    if histogram or bitMarg or comparator:
-        for i in range(0, len(vendorNames)):
-            if histogram:
-                histFig, histAxs = plt.subplots(2, varNum//2)
-            
-                for j in range(1, varNum):
-                    makeHistogram(allMarginList[i], variableList[j - 1], j, histAxs, includeLine, bootstrap, varNum)
-            
-                histFig.subplots_adjust(top=0.9, bottom=0.18, wspace=0.3, hspace=0.75)
-                histFig.suptitle(vendorNames[i] + " " + marginType)
-                histFig.savefig(vendorNames[i] + "_" + marginType.replace(" ", "_") + "Histogram.pdf")
+            x = 0
+            y = i - 1
+            if i > varNum//2:
+                x = 1
+                y = (i - 1) % (varNum//2)
+            makeBoxPlot(allBoxStats[i - 1][start:stop], variableList[i - 1], boxAxs[x, y], includeLine, 
+                        DEFAULT_THRESHOLD if thresholdList is None else thresholdList[i - 1])
+
+            # every page of a variable has the same scale, so vendors on different pages can be compared
+            if len(pageList) > 1:
+                low = min(min([stats["whislo"]] + stats["fliers"].tolist()) for stats in allBoxStats[i - 1])
+                high = max(max([stats["whishi"]] + stats["fliers"].tolist()) for stats in allBoxStats[i - 1])
+                boxAxs[x, y].set_ylim(low - 1, high + 1)
+
+        boxFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.3, hspace=0.3)
+        boxFig.suptitle(getPageTitle(marginType, pageNum, len(pageList)))
+        savePage(pages, boxFig)
+    closePages(pages)
+
+
+def renderVarTable(allMean, allMedian, allSD, allIQR, allMeanSD1, allMeanSD2, allMeanSD3, vendorNames, variableList, marginType, varNum, figureManager=None):
+    """
+    renderVarTable creates and saves the variable tables of all variables for one margin, PAGE_TABLE_VENDORS vendors per page
+
+    Args:
+        allMean (list): contains mean of each vendor for each variable
+        allMedian (list): contains median of each vendor for each variable
+        allSD (list): contains standard deviation of each vendor for each variable
+        allIQR (list): contains interquartile range of each vendor for each variable
+        allMeanSD1 (list): contains value one standard deviation from mean of each vendor for each variable
+        allMeanSD2 (list): contains value two standard deviation from mean of each vendor for each variable
+        allMeanSD3 (list): contains value three standard deviation from mean of each vendor for each variable
+        vendorNames (list): contains all vendor names
+        variableList (list): contains all variables
+        marginType (str): type of margin
+        varNum (int): number of variables to plot
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
+
+    """
+    pageList = getPages(len(vendorNames), PAGE_TABLE_VENDORS)
+    pages = openPages(marginType.replace(" ", "_") + "VarTable.pdf", len(pageList))
+
+    for pageNum in range(0, len(pageList)):
+        start, stop = pageList[pageNum]
+        tableFig, tableAxs = getFigure(figureManager, "varTable", 2, varNum//2, reuse=False)
+
+        for i in range(1, varNum):
+            x = 0
+            y = i - 1
+            if i > varNum//2:
+                x = 1
+                y = (i - 1) % (varNum//2)
+            makeVarTable(allMean[i - 1][start:stop], allMedian[i - 1][start:stop], allSD[i - 1][start:stop], allIQR[i - 1][start:stop], 
+                         allMeanSD1[i - 1][start:stop], allMeanSD2[i - 1][start:stop], allMeanSD3[i - 1][start:stop], 
+                         vendorNames[start:stop], variableList[i-1], tableAxs[x, y])
+
+        # different spacing between tables according to number of tables
+        if stop - start == 1:
+            tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=1.5, hspace=0.3)
+        elif stop - start == 2:
+            tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.8, hspace=0.3)
+        elif stop - start == 3:
+            tableFig.subplots_adjust(top=0.85, bottom=0.05, wspace=0.4, hspace=0.3)
+        tableFig.suptitle(getPageTitle(marginType, pageNum, len(pageList)))
+        savePage(pages, tableFig, bbox_inches='tight')
+    closePages(pages)
+
+
+def renderHistogram(accumulator, means, stdevs, variableList, vendor, marginType, includeLine, varNum, thresholdList=None, figureManager=None):
+    """
+    renderHistogram creates and saves the histograms of all variables of one vendor for one margin
+
+    Args:
+        accumulator (dict): accumulator of vendor from addToAccumulator
+        means (list): contains mean of each variable
+        stdevs (list): contains standard deviation of each variable
+        variableList (list): contains all variables
+        vendor (str): name of vendor
+        marginType (str): type of margin
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        varNum (int): number of variables to plot
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
+
+    """
+    histFig, histAxs = getFigure(figureManager, "histogram", 2, varNum//2)
+
+    for j in range(1, varNum):
+        makeHistogram(getHistogram(accumulator, j - 1), means[j - 1], stdevs[j - 1], variableList[j - 1], j, histAxs, includeLine, varNum,
+                      DEFAULT_THRESHOLD if thresholdList is None else thresholdList[j - 1])
+
+    histFig.subplots_adjust(top=0.9, bottom=0.18, wspace=0.3, hspace=0.75)
+    histFig.suptitle(vendor + " " + marginType)
+    histFig.savefig(vendor + "_" + marginType.replace(" ", "_") + "Histogram.pdf")
+
+
+def renderComparator(allLaneGroups, variableList, includeLine, vendorNames, varNum, marginType, chartMode="image", thresholdList=None, figureManager=None):
+    """
+    renderComparator creates the average bit margin graphs of one margin, adding one vendor at a time,
+    and saves them to excel
+
+    Args:
+        allLaneGroups (list): contains average of each lane of each vendor from makeLaneGroups
+        variableList (list): contains all variables
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        vendorNames (list): contains all vendor names
+        varNum (int): number of variables to plot
+        marginType (str): type of margin
+        chartMode (str): 'image' or 'native', see processData
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
+
+    """
+    compGraphs = makeCompGraphs(allLaneGroups)
 
-            if (allMarginList[0][0][0].find('L') != -1 or allMarginList[0][0][0].find('A') != -1) and bitMarg:
-                makeBitMargin(allMarginList[i], variableList, includeLine, vendorNames[i], varNum, marginType)
+    if chartMode == "native":
+        makeCompCharts(allLaneGroups, compGraphs, variableList, includeLine, vendorNames, varNum, marginType, thresholdList)
+        return
 
-            if (allMarginList[0][0][0].find('L') != -1 or allMarginList[0][0][0].find('A') != -1) and comparator:
-                makeComparator(allMarginList[i], compGraphs, variableList, includeLine, vendorNames[i], numFiles, varNum, marginType)
+    # each graph is finished for all vendors before the next one, so only one figure is needed
+    graphVendors = {}
+    for tabName in compGraphs:
+        for graphTitle in compGraphs[tabName]:
+            compFig, compAxs = getFigure(figureManager, "comparator", 2, varNum//2)
+            for i in range(0, len(vendorNames)):
+                if graphTitle in allLaneGroups[i]["titles"]:
+                    makeComparator(allLaneGroups[i], compFig, compAxs, graphTitle, variableList, includeLine, vendorNames[i], varNum, thresholdList)
+                    graphVendors[graphTitle] = vendorNames[i]
 
+    # image of the last vendor plotted shows the graph with all vendors
+    makeCompExcel(compGraphs, graphVendors, marginType)
 
-def createCSVFile(fileName, marginData):
+
+def formatCSV(marginData):
     """
-    createCSVFile creates a CSV file for one margin
+    formatCSV formats the data for one margin as CSV text
 
     Args:
+        marginData (list): contains all data for one margin
+
+    Returns:
+        str: CSV text of margin data
+
+    """
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerows(marginData)
+    return text.getvalue()
+
+
+def openCSVExport(csvMode):
+    """
+    openCSVExport starts the CSV export of a run, CSV files are opened when they are first written to
+
+    Args:
+        csvMode (str): 'truncate' overwrites old CSV files, 'version' writes new numbered CSV files next to them, 'off' writes no CSV files
+
+    Returns:
+        dict: contains the mode ("mode") and the open CSV files by name ("files")
+
+    """
+    if not csvMode in ["truncate", "version", "off"]:
+        raise ValueError("csvMode must be 'truncate', 'version' or 'off', not " + str(csvMode))
+    return {"mode": csvMode, "files": {}}
+
+
+def createCSVFile(csvExport, fileName, csvText):
+    """
+    createCSVFile creates a CSV file for one margin the first time it is written to in a run, 
+    and adds the CSV text to its write buffer
+
+    Args:
+        csvExport (dict): open CSV files from openCSVExport
         fileName (str): name of csv file
-        rankMarginData (list): contains all data for one margin
+        csvText (str): CSV text of data for one margin
 
     """
-    if os.path.isfile(fileName):
-        with open(fileName, 'a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerows(marginData)
-    else:
-        with open(fileName, 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerows(marginData)
+    if csvExport["mode"] == "off":
+        return
+
+    if not fileName in csvExport["files"]:
+        filePath = fileName
+        if csvExport["mode"] == "version":
+            version = 1
+            while os.path.isfile(filePath):
+                filePath = fileName[:-4] + "_" + str(version) + ".csv"
+                version = version + 1
+        csvExport["files"][fileName] = open(filePath, 'w', newline='', buffering=CSV_BUFFER_SIZE)
+
+    csvExport["files"][fileName].write(csvText)
+
+
+def closeCSVExport(csvExport):
+    """
+    closeCSVExport flushes and closes all CSV files of a run
+
+    Args:
+        csvExport (dict): open CSV files from openCSVExport
+
+    """
+    for file in csvExport["files"].values():
+        file.close()
+    csvExport["files"] = {}
 
 
 def makeVarTable(mean, median, sd, iqr, meanSD1, meanSD2, meanSD3, vendorNames, variable, axs):
@@ -337,78 +1532,146 @@ def makeVarTable(mean, median, sd, iqr, meanSD1, meanSD2, meanSD3, vendorNames,
     axs.set_title(variable)
 
 
-def makeComparator(marginList, allGraphs, variableList, includeLine, vendor, numFiles, varNum, marginType):
+def makeLaneGroups(marginList):
+    """
+    makeLaneGroups finds the average of each lane of each graph over all files of one vendor, 
+    rows are grouped by the fields of their row names from decodeRowKeys
+        
+    Args:
+        marginList (dict): margin store of one vendor for one margin
+
+    Returns:
+        dict: contains tab names ("tabs"), graph titles ("titles") and the tab of each graph title ("titleTab"),
+              and the graph title ("title"), lane number ("lane"), number of rows ("count"), sum ("sum") and 
+              mean ("mean") of each variable of each lane, one row per variable
+
+    """
+    # rows without a lane number would be grouped with lanes of the graph before them
+    marginList = getLaneRows(marginList)
+    rowKeys = marginList["rowKeys"]
+
+    # tabs and graph titles are numbered in the order they first appear in the file
+    rowTab, tabRows = getRowGroups(rowKeys, TAB_FIELDS)
+    rowTitle, titleRows = getRowGroups(rowKeys, TITLE_FIELDS)
+    tabs = [getTabName(rowKeys, row) for row in tabRows]
+    titles = [str(marginList["labels"][row])[:str(marginList["labels"][row]).rfind('.')] for row in titleRows]
+    titleTab = rowTab[titleRows].tolist()
+
+    groupIndex, (groupTitle, groupLane) = encodeGroups([rowTitle, rowKeys[LANE_FIELD].astype(np.int64)])
+    counts, sums, means = groupStats(groupIndex, marginList["values"], len(groupTitle))
+
+    return {"tabs": tabs, "titles": titles, "titleTab": titleTab, 
+            "title": groupTitle, "lane": groupLane, "count": counts, "sum": sums, "mean": means}
+
+
+def mergeLaneGroups(laneGroups, newLaneGroups):
+    """
+    mergeLaneGroups adds the lanes of new files to the lanes of one vendor, lanes in both are added together
+        
+    Args:
+        laneGroups (dict): lanes from makeLaneGroups or mergeLaneGroups, None if there are none yet
+        newLaneGroups (dict): lanes of new files from makeLaneGroups
+
+    Returns:
+        dict: lanes of all files, same as makeLaneGroups
+
+    """
+    if laneGroups is None:
+        return newLaneGroups
+
+    # graph titles of the new files are numbered after the graph titles already seen
+    tabs, titles, titleTab = list(laneGroups["tabs"]), list(laneGroups["titles"]), list(laneGroups["titleTab"])
+    titleNums = np.zeros(len(newLaneGroups["titles"]), dtype=np.int64)
+    for titleNum in range(0, len(newLaneGroups["titles"])):
+        tabName = newLaneGroups["tabs"][newLaneGroups["titleTab"][titleNum]]
+        if not tabName in tabs:
+            tabs.append(tabName)
+
+        graphTitle = newLaneGroups["titles"][titleNum]
+        if not graphTitle in titles:
+            titles.append(graphTitle)
+            titleTab.append(tabs.index(tabName))
+        titleNums[titleNum] = titles.index(graphTitle)
+
+    rowTitle = np.concatenate([laneGroups["title"], titleNums[newLaneGroups["title"]]])
+    rowLane = np.concatenate([laneGroups["lane"], newLaneGroups["lane"]])
+    groupIndex, (groupTitle, groupLane) = encodeGroups([rowTitle, rowLane])
+
+    # lanes are added up like rows of a margin store, each lane counting as the rows it was made from
+    counts, sums, means = groupStats(groupIndex, np.concatenate([laneGroups["sum"], newLaneGroups["sum"]], axis=1), len(groupTitle),
+                                     np.concatenate([laneGroups["count"], newLaneGroups["count"]]))
+
+    return {"tabs": tabs, "titles": titles, "titleTab": titleTab, 
+            "title": groupTitle, "lane": groupLane, "count": counts, "sum": sums, "mean": means}
+
+
+def makeComparator(laneGroups, compFig, compAxs, graphTitle, variableList, includeLine, vendor, varNum, thresholdList=None):
     """
-    makeComparator organizes data and creates an excel containing average bit margin graphs
+    makeComparator adds one vendor to an average bit margin graph and saves the graph
         
     Args:
-        marginList (list): contains all data for one margin
-        allGraphs (list): contains axes and figures of all average bit margin graphs
+        laneGroups (dict): average of each lane of one vendor for one margin from makeLaneGroups
+        compFig (figure): figure of average bit margin graph
+        compAxs (axes): axes of average bit margin graph
+        graphTitle (str): title of graph
         variableList (list): contains all variables
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
         vendor (str): name of vendor
-        numFiles (int): number of files in folder
         varNum (int): number of variables to plot
-        marginType (str): type of margin
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
 
     """
-    avgData = {}
-    largestX = int(marginList[-1][0][-2])
+    if not graphTitle in laneGroups["titles"]:
+        return
+
+    graphLanes = laneGroups["title"] == laneGroups["titles"].index(graphTitle)
+    lanes = laneGroups["lane"][graphLanes].tolist()
+
+    for graphNum in range(0, varNum - 1):
+        x = 0
+        y = graphNum
+        if graphNum > (varNum//2) - 1:
+            x = 1
+            y = graphNum % (varNum//2)
+
+        # create each graph
+        avgData = [round(num, 2) for num in laneGroups["mean"][graphNum][graphLanes].tolist()]
+        compAxs[x, y].plot(lanes, avgData, label=vendor)
+        compAxs[x, y].grid(linestyle='dotted')
+        compAxs[x, y].set_title(variableList[graphNum])
+        compAxs[x, y].legend(fontsize='5', loc='upper right')
 
-    # organize and input data into dictionary
-    for i in range(0, len(marginList)):
-        tabName = marginList[i][0][:marginList[i][0].find('C')+2]
-        if not tabName in avgData:
-            avgData[tabName] = {}
+        if includeLine == "Y":
+            compAxs[x, y].axhline(y=DEFAULT_THRESHOLD if thresholdList is None else thresholdList[graphNum], linestyle='dashed')
 
-        graphTitle = marginList[i][0][:marginList[i][0].rfind('.')]
-        if not graphTitle in avgData[tabName]:
-            avgData[tabName][graphTitle] = [],[],[],[],[],[],[],[]
+    compFig.suptitle(graphTitle)
+    compFig.set_figwidth(25)
+    compFig.subplots_adjust(top=0.85, bottom=0.1, wspace=0.3, hspace=0.3)
+    compFig.savefig(vendor+'_'+graphTitle+"Comparator.png")
+
+
+def makeCompExcel(compGraphs, graphVendors, marginType):
+    """
+    makeCompExcel creates an excel containing the average bit margin graphs of all vendors
         
-        laneNum = int(marginList[i][0][marginList[i][0].rfind('.') + 2:-1])
-        for k in range(0, varNum - 1):
-            if len(avgData[tabName][graphTitle][k]) < largestX + 1:
-                avgData[tabName][graphTitle][k].append(abs(int(marginList[i][k+1])))
-            else:
-                avgData[tabName][graphTitle][k][laneNum] += abs(int(marginList[i][k+1]))
-
-    # find average of data
-    for tabName in avgData:
-        for graphTitle in avgData[tabName]:
-            for i in range(0, varNum - 1):
-                avgData[tabName][graphTitle] = list(avgData[tabName][graphTitle])
-                avgData[tabName][graphTitle][i] = [round(num/numFiles,2) for num in avgData[tabName][graphTitle][i]]
+    Args:
+        compGraphs (dict): contains the graph titles of each tab from makeCompGraphs
+        graphVendors (dict): contains the last vendor plotted on each graph by graph title
+        marginType (str): type of margin
+
+    """
+    import openpyxl
 
     # create excel file
     wb = openpyxl.Workbook()
     del wb['Sheet']
     
-    for tabName in avgData:
+    for tabName in compGraphs:
         ws = wb.create_sheet(tabName)
         graphPos = 1
 
-        for graphTitle in avgData[tabName]:
-            for graphNum in range(0, varNum - 1):
-                x = 0
-                y = graphNum
-                if graphNum > (varNum//2) - 1:
-                    x = 1
-                    y = graphNum % (varNum//2)
-
-                # create each graph
-                allGraphs[tabName][graphTitle][0][x, y].plot(range(0, largestX + 1), avgData[tabName][graphTitle][graphNum], label=vendor)
-                allGraphs[tabName][graphTitle][0][x, y].grid(linestyle='dotted')
-                allGraphs[tabName][graphTitle][0][x, y].set_title(variableList[graphNum])
-                allGraphs[tabName][graphTitle][0][x, y].legend(fontsize='5', loc='upper right')
-
-                if includeLine == "Y":
-                    allGraphs[tabName][graphTitle][0][x, y].axhline(y=6, linestyle='dashed')
-
-            allGraphs[tabName][graphTitle][1].suptitle(graphTitle)
-            allGraphs[tabName][graphTitle][1].set_figwidth(25)
-            allGraphs[tabName][graphTitle][1].subplots_adjust(top=0.85, bottom=0.1, wspace=0.3, hspace=0.3)
-            allGraphs[tabName][graphTitle][1].savefig(vendor+'_'+graphTitle+"Comparator.png")
-            img = openpyxl.drawing.image.Image(vendor+'_'+graphTitle+'Comparator.png')
+        for graphTitle in compGraphs[tabName]:
+            img = openpyxl.drawing.image.Image(graphVendors[graphTitle]+'_'+graphTitle+'Comparator.png')
 
             # add graph to excel
             ws.add_image(img, anchor='A'+str(graphPos))
@@ -419,70 +1682,119 @@ def makeComparator(marginList, allGraphs, variableList, includeLine, vendor, num
     wb.close()
 
 
-def makeCompGraphs(marginList, varNum):
+def makeCompCharts(allLaneGroups, compGraphs, variableList, includeLine, vendorNames, varNum, marginType, thresholdList=None):
     """
-    makeCompGraphs creates axes and figures of all average bit margin graphs
+    makeCompCharts creates an excel containing the average bit margin graphs of all vendors as excel charts
         
     Args:
-        marginList (list): contains all data for one margin
+        allLaneGroups (list): contains average of each lane of each vendor from makeLaneGroups
+        compGraphs (dict): contains the graph titles of each tab from makeCompGraphs
+        variableList (list): contains all variables
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        vendorNames (list): contains all vendor names
         varNum (int): number of variables to plot
+        marginType (str): type of margin
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+
+    """
+    wb, dataWs = openChartWorkbook()
+
+    for tabName in compGraphs:
+        ws = wb.create_sheet(tabName)
+        graphPos = 1
+
+        for graphTitle in compGraphs[tabName]:
+            allLanes, allMeans = [], []
+            for laneGroups in allLaneGroups:
+                if not graphTitle in laneGroups["titles"]:
+                    allLanes.append(None)
+                    allMeans.append(None)
+                    continue
+                graphLanes = laneGroups["title"] == laneGroups["titles"].index(graphTitle)
+                allLanes.append(laneGroups["lane"][graphLanes].tolist())
+                allMeans.append(laneGroups["mean"][:, graphLanes].tolist())
+
+            graphPos = addComparatorCharts(ws, dataWs, graphTitle, allLanes, allMeans, vendorNames, variableList, includeLine, varNum, graphPos, thresholdList)
+
+    saveChartWorkbook(wb, marginType.replace(" ", "_")+'_Comparison.xlsx')
+
+
+def makeCompGraphs(allLaneGroups):
+    """
+    makeCompGraphs finds all average bit margin graphs of all vendors
+        
+    Args:
+        allLaneGroups (list): contains average of each lane of each vendor from makeLaneGroups
 
     Returns:
-        list: contains axes and figures of all average bit margin graphs
+        dict: contains the graph titles of each tab
 
     """
     allCompGraphs = {}
 
-    # create all graphs for average bit margin comparison
-    for i in range(0, len(marginList)):
-        tabName = marginList[i][0][:marginList[i][0].find('C')+2]
-        if not tabName in allCompGraphs:
-            allCompGraphs[tabName] = {}
+    # include graphs only some vendors have
+    for laneGroups in allLaneGroups:
+        for titleNum in range(0, len(laneGroups["titles"])):
+            tabName = laneGroups["tabs"][laneGroups["titleTab"][titleNum]]
+            if not tabName in allCompGraphs:
+                allCompGraphs[tabName] = []
 
-        graphTitle = marginList[i][0][:marginList[i][0].rfind('.')]
-        if not graphTitle in allCompGraphs[tabName]:
-            compFig, compAxs = plt.subplots(2, varNum//2)
-            allCompGraphs[tabName][graphTitle] = [compAxs, compFig]
+            graphTitle = laneGroups["titles"][titleNum]
+            if not graphTitle in allCompGraphs[tabName]:
+                allCompGraphs[tabName].append(graphTitle)
 
     return allCompGraphs
 
 
-def makeBitMargin(marginList, variableList, includeLine, vendor, varNum, marginType):
+def makeBitMargin(marginList, variableList, includeLine, vendor, varNum, marginType, chartMode="image", thresholdList=None, figureManager=None):
     """
     makeBitMargin organizes data and creates an excel containing bit margin graphs
         
     Args:
-        marginList (list): contains all data for one margin
+        marginList (dict): margin store of one vendor for one margin
         variableList (list): contains all variables
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
         vendor (str): name of vendor
         varNum (int): number of variables to plot
         marginType (str): type of margin
+        chartMode (str): 'image' or 'native', see processData
+        thresholdList (list): contains the threshold of each variable, None uses DEFAULT_THRESHOLD
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
 
     """
     allData = {}
-    allGraphs = {}
 
-    # organize and input data into dictionary, create all bit margin graphs
-    for i in range(0, len(marginList)):
-        tabName = marginList[i][0][:marginList[i][0].find('C')+2]
+    marginList = getLaneRows(marginList)
+    if len(marginList["labels"]) == 0:
+        return
+    rowKeys = marginList["rowKeys"]
+    rowTitle, titleRows = getRowGroups(rowKeys, TITLE_FIELDS)
+
+    # organize lane numbers and row positions into dictionary, rows of each graph are in file order
+    titleOrder = np.argsort(rowTitle, kind='stable')
+    titleStarts = np.searchsorted(rowTitle[titleOrder], np.arange(len(titleRows) + 1))
+    for titleNum in range(0, len(titleRows)):
+        firstRow = titleRows[titleNum]
+        tabName = getTabName(rowKeys, firstRow)
         if not tabName in allData:
             allData[tabName] = {}
-            allGraphs[tabName] = {}
 
-        graphTitle = marginList[i][0][:marginList[i][0].rfind('.')]
-        if not graphTitle in allData[tabName]:
-            allData[tabName][graphTitle] = [],[],[],[],[],[],[],[],[]
-            
-            bitMargFig, bitMargAxs = plt.subplots(2, varNum//2)
-            allGraphs[tabName][graphTitle] = [bitMargAxs, bitMargFig]
+        graphTitle = str(marginList["labels"][firstRow])[:str(marginList["labels"][firstRow]).rfind('.')]
+        rows = titleOrder[titleStarts[titleNum]:titleStarts[titleNum + 1]]
+        allData[tabName][graphTitle] = rowKeys[LANE_FIELD][rows].tolist(), rows
 
-        laneNum = int(marginList[i][0][marginList[i][0].rfind('.') + 2:-1])
-        for k in range(0, varNum):
-            if k == 0:
-                allData[tabName][graphTitle][k].append(laneNum)
-            else:
-                allData[tabName][graphTitle][k].append(abs(int(marginList[i][k])))
+    if chartMode == "native":
+        wb, dataWs = openChartWorkbook()
+        for tabName in allData:
+            ws = wb.create_sheet(tabName)
+            graphPos = 1
+            for graphTitle in allData[tabName]:
+                lanes, rows = allData[tabName][graphTitle]
+                graphPos = addBitMarginCharts(ws, dataWs, graphTitle, lanes, marginList["values"][:, rows], variableList, includeLine, varNum, graphPos, thresholdList)
+        saveChartWorkbook(wb, vendor+marginType.replace(" ", "_")+'BitMargin.xlsx')
+        return
+
+    import openpyxl
 
     # create excel file
     wb = openpyxl.Workbook()
@@ -493,6 +1805,7 @@ def makeBitMargin(marginList, variableList, includeLine, vendor, varNum, marginT
         graphPos = 1
 
         for graphTitle in allData[tabName]:
+            bitMargFig, bitMargAxs = getFigure(figureManager, "bitMargin", 2, varNum//2)
             for graphNum in range(1, varNum):
                 x = 0
                 y = graphNum - 1
@@ -501,17 +1814,17 @@ def makeBitMargin(marginList, variableList, includeLine, vendor, varNum, marginT
                     y = (graphNum - 1) % (varNum//2)
 
                 # create each graph
-                allGraphs[tabName][graphTitle][0][x, y].scatter(allData[tabName][graphTitle][0], allData[tabName][graphTitle][graphNum])
-                allGraphs[tabName][graphTitle][0][x, y].grid(linestyle='dotted')
-                allGraphs[tabName][graphTitle][0][x, y].set_title(variableList[graphNum-1])
+                bitMargAxs[x, y].scatter(allData[tabName][graphTitle][0], marginList["values"][graphNum - 1][allData[tabName][graphTitle][1]])
+                bitMargAxs[x, y].grid(linestyle='dotted')
+                bitMargAxs[x, y].set_title(variableList[graphNum-1])
 
                 if includeLine == "Y":
-                    allGraphs[tabName][graphTitle][0][x, y].axhline(y=6, linestyle='dashed')
+                    bitMargAxs[x, y].axhline(y=DEFAULT_THRESHOLD if thresholdList is None else thresholdList[graphNum - 1], linestyle='dashed')
 
-            allGraphs[tabName][graphTitle][1].suptitle(graphTitle)
-            allGraphs[tabName][graphTitle][1].set_figwidth(25)
-            allGraphs[tabName][graphTitle][1].subplots_adjust(top=0.85, bottom=0.1, wspace=0.3, hspace=0.3)
-            allGraphs[tabName][graphTitle][1].savefig(vendor+'_'+graphTitle+".png")
+            bitMargFig.suptitle(graphTitle)
+            bitMargFig.set_figwidth(25)
+            bitMargFig.subplots_adjust(top=0.85, bottom=0.1, wspace=0.3, hspace=0.3)
+            bitMargFig.savefig(vendor+'_'+graphTitle+".png")
             img = openpyxl.drawing.image.Image(vendor+'_'+graphTitle+'.png')
 
             # add graph to excel
@@ -523,32 +1836,32 @@ def makeBitMargin(marginList, variableList, includeLine, vendor, varNum, marginT
     wb.close()
 
 
-def makeBoxPlot(columns, vendorNames, variable, axs, includeLine):
+def makeBoxPlot(boxStats, variable, axs, includeLine, threshold=DEFAULT_THRESHOLD):
     """
     makeBoxPlot creates a box plot comparing all vendors for each variable
         
     Args:
-        columns (list): contains all data for variable
-        vendorNames (list): contains all vendor names
+        boxStats (list): contains box plot statistics of each vendor for variable from getBoxStats
         variable (str): variable name
         axs (axes): graph axes and position of subplot
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        threshold (float): margin the threshold line is drawn at
 
     """
-    axs.boxplot(columns, labels=vendorNames)
+    axs.bxp(boxStats)
 
     axs.tick_params(axis='both', which='major', labelsize=5)
     axs.set_title(variable)
     axs.grid(linestyle='dotted')
 
     if includeLine == "Y":
-        axs.axhline(y=6, linestyle='dotted')
+        axs.axhline(y=threshold, linestyle='dotted')
     axs.plot()
 
 
-def makeTable(variableList, vendorNames, allMean, allMedian, allSD, allIQR, allMeanSD1, allMeanSD2, allMeanSD3, marginType):
+def makeTable(variableList, vendorNames, allMean, allMedian, allSD, allIQR, allMeanSD1, allMeanSD2, allMeanSD3, marginType, figureManager=None):
     """
-    makeTable creates a table of statistics comparing variables for each vendor
+    makeTable creates a table of statistics comparing variables for each vendor, PAGE_VENDOR_TABLES vendors per page
         
     Args:
         variableList (list): contains all variables
@@ -561,111 +1874,216 @@ def makeTable(variableList, vendorNames, allMean, allMedian, allSD, allIQR, allM
         allMeanSD2 (list): contains value one standard of deviaton from each mean of data
         allMeanSD3 (list): contains value one standard of deviaton from each mean of data
         marginType (str): type of margin
+        figureManager (dict): figure manager from openFigureManager, None uses the figures closed by closeFigureManager(None)
 
     """
-    dataNum = len(allMean[0])
-    rowTot, colTot = dataNum, 1
-
-    if dataNum > 2:
-        rowTot, colTot = 2, 2
-    tableFig, tableAx = plt.subplots(rowTot, colTot, squeeze=False)
-    for col in range(0, colTot):
-        for row in range(0, rowTot):
-            tableAx[row, col].axis('tight')
-            tableAx[row, col].axis('off')
+    pageList = getPages(len(allMean[0]), PAGE_VENDOR_TABLES)
+    pages = openPages(marginType.replace(" ", "_") + "VendorTable.pdf", len(pageList))
 
     rows = ["Mean", "Median", "SD", "IQR", "Mean-1SD", "Mean-2SD", "Mean-3SD"]
-    for tableNum in range(0, dataNum):
-        col = 0
-        row = tableNum
-        if tableNum + 1 > 2:
-            col = 1
-            row = tableNum % 2
-
-        meanRow, medianRow, sdRow, iqrRow, meanSD1Row, meanSD2Row, meanSD3Row = [], [], [], [], [], [], []
-        for colNum in range(0, len(allMean)):
-            meanRow.append(allMean[colNum][tableNum])
-            medianRow.append(allMedian[colNum][tableNum])
-            sdRow.append(allSD[colNum][tableNum])
-            iqrRow.append(allIQR[colNum][tableNum])
-            meanSD1Row.append(allMeanSD1[colNum][tableNum])
-            meanSD2Row.append(allMeanSD2[colNum][tableNum])
-            meanSD3Row.append(allMeanSD3[colNum][tableNum])
-        tableAx[row, col].table(cellText=[meanRow, medianRow, sdRow, iqrRow, meanSD1Row, meanSD2Row, meanSD3Row],
-                                rowLabels=rows, colLabels=variableList, loc='center')
-        tableAx[row, col].set_title(vendorNames[tableNum])
-
-    tableFig.suptitle(marginType)
-    tableFig.subplots_adjust(top=0.85, bottom=0.04, hspace=0.75)
-    tableFig.savefig(marginType.replace(" ", "_") + "VendorTable.pdf", bbox_inches='tight')
-
-
-def calculateStats(marginList, graphNum, bootstrap, varNum):
-    """
-    calculateStats calculates the statistics of each vendor for each variable
+    for pageNum in range(0, len(pageList)):
+        start, stop = pageList[pageNum]
+        dataNum = stop - start
+        rowTot, colTot = dataNum, 1
+
+        if dataNum > 2:
+            rowTot, colTot = 2, 2
+        tableFig, tableAx = getFigure(figureManager, "vendorTable", rowTot, colTot, squeeze=False, reuse=False)
+        for col in range(0, colTot):
+            for row in range(0, rowTot):
+                tableAx[row, col].axis('tight')
+                tableAx[row, col].axis('off')
+
+        for tableNum in range(start, stop):
+            col = 0
+            row = tableNum - start
+            if tableNum - start + 1 > 2:
+                col = 1
+                row = (tableNum - start) % 2
+
+            meanRow, medianRow, sdRow, iqrRow, meanSD1Row, meanSD2Row, meanSD3Row = [], [], [], [], [], [], []
+            for colNum in range(0, len(allMean)):
+                meanRow.append(allMean[colNum][tableNum])
+                medianRow.append(allMedian[colNum][tableNum])
+                sdRow.append(allSD[colNum][tableNum])
+                iqrRow.append(allIQR[colNum][tableNum])
+                meanSD1Row.append(allMeanSD1[colNum][tableNum])
+                meanSD2Row.append(allMeanSD2[colNum][tableNum])
+                meanSD3Row.append(allMeanSD3[colNum][tableNum])
+            tableAx[row, col].table(cellText=[meanRow, medianRow, sdRow, iqrRow, meanSD1Row, meanSD2Row, meanSD3Row],
+                                    rowLabels=rows, colLabels=variableList, loc='center')
+            tableAx[row, col].set_title(vendorNames[tableNum])
+
+        tableFig.suptitle(getPageTitle(marginType, pageNum, len(pageList)))
+        tableFig.subplots_adjust(top=0.85, bottom=0.04, hspace=0.75)
+        savePage(pages, tableFig, bbox_inches='tight')
+    closePages(pages)
+
+
+def calculateStats(allMarginList, allAccumulators=None):
+    """
+    calculateStats calculates the statistics of every variable for each vendor from the counts of each
+    margin value, so the samples are never copied or sorted
         
     Args:
-        marginList (list): contains all data for one margin
-        graphNum (int): position of subplot
-        bootstrap (str): 'Y' if yes, 'N' if no - decides if data is bootstrapped
-        varNum (int): number of variables to plot
+        allMarginList (list): contains margin store of each vendor for one margin
+        allAccumulators (list): contains accumulator of each vendor from addToAccumulator, None counts allMarginList
 
     Returns:
-        list: contains all data for variable
-        int: x position of subplots
-        int: y position of subplots
-        list: contains mean of each vendor for variable
-        list: contains median of each vendor for variable
-        list: contains standard deviation of each vendor for variable
-        list: contains interquartile range of each vendor for variable
-        list: contains value one standard deviation from mean of each vendor for variable
-        list: contains value two standard deviation from mean of each vendor for variable
-        list: contains value three standard deviation from mean of each vendor for variable
+        list: contains accumulator of each vendor
+        list: contains mean of each vendor for each variable
+        list: contains median of each vendor for each variable
+        list: contains standard deviation of each vendor for each variable
+        list: contains interquartile range of each vendor for each variable
+        list: contains value one standard deviation from mean of each vendor for each variable
+        list: contains value two standard deviation from mean of each vendor for each variable
+        list: contains value three standard deviation from mean of each vendor for each variable
 
     """   
-    x = 0
-    y = graphNum - 1
-    if graphNum > varNum//2:
-        x = 1
-        y = (graphNum - 1) % (varNum//2)
-    
-    columns, bins = [], []
+    if allAccumulators is None:
+        allAccumulators = [addToAccumulator(makeAccumulator(len(marginList["values"])), marginList["values"]) for marginList in allMarginList]
+
+    allMean, allMedian, allSD, allIQR = [], [], [], []
+    for accumulator in allAccumulators:
+        vendorMean, vendorMedian, vendorSD, vendorIQR = getAccumulatorStats(accumulator)
+        allMean.append(vendorMean.tolist())
+        allMedian.append(vendorMedian.tolist())
+        allSD.append(vendorSD.tolist())
+        allIQR.append(vendorIQR.tolist())
+
+    # tables are indexed by variable first, then by vendor
     mean, median, stdev, iqr, meanSD1, meanSD2, meanSD3 = [], [], [], [], [], [], []
+    for var in range(0, len(allMean[0])):
+        mean.append([round(vendorMean[var], 4) for vendorMean in allMean])
+        median.append([round(vendorMedian[var], 4) for vendorMedian in allMedian])
+        stdev.append([round(vendorSD[var], 4) for vendorSD in allSD])
+        iqr.append([round(vendorIQR[var], 4) for vendorIQR in allIQR])
+        meanSD1.append([round(mean[var][i] - stdev[var][i], 4) for i in range(0, len(allMarginList))])
+        meanSD2.append([round(mean[var][i] - (2 * stdev[var][i]), 4) for i in range(0, len(allMarginList))])
+        meanSD3.append([round(mean[var][i] - (3 * stdev[var][i]), 4) for i in range(0, len(allMarginList))])
+
+    return allAccumulators, mean, median, stdev, iqr, meanSD1, meanSD2, meanSD3
+
+
+def calculateIntervals(allMarginList, replicates=BOOTSTRAP_REPLICATES, seed=BOOTSTRAP_SEED, confidence=BOOTSTRAP_CONFIDENCE):
+    """
+    calculateIntervals bootstraps every variable for each vendor and finds the percentile confidence interval 
+    of the mean, median, standard deviation and mean minus 1, 2 and 3 standard deviations
+        
+    Args:
+        allMarginList (list): contains margin store of each vendor for one margin
+        replicates (int): number of bootstrap replicates
+        seed (int): seed of the random number generator, each vendor starts from the same seed
+        confidence (float): confidence level in percent
+
+    Returns:
+        dict: statistic name (table row label) to a list of [lower, upper] of each vendor for each variable
+
+    """
+    names = ["Mean", "Median", "SD", "Mean-1SD", "Mean-2SD", "Mean-3SD"]
+    percentiles = [(100 - confidence) / 2, 100 - (100 - confidence) / 2]
+    allIntervals = {name: [] for name in names}
+
+    for i in range(0, len(allMarginList)):
+        replicateStats = bootstrapStats(allMarginList[i]["values"], replicates, seed)
+        for name in names:
+            lower, upper = np.percentile(replicateStats[name], percentiles, axis=1)
+            allIntervals[name].append([lower.tolist(), upper.tolist()])
+
+    # intervals are indexed by variable first, then by vendor like calculateStats
+    intervals = {name: [] for name in names}
+    for name in names:
+        for var in range(0, len(allIntervals[name][0][0])):
+            intervals[name].append([[round(vendorInterval[0][var], 4), round(vendorInterval[1][var], 4)] for vendorInterval in allIntervals[name]])
+    return intervals
 
-    for i in range(0, len(marginList)):
-        columns.append([])
 
-        for j in range(0, len(marginList[i])):
-            columns[i].append(abs(int(marginList[i][j][graphNum])))
+def bootstrapStats(values, replicates, seed):
+    """
+    bootstrapStats draws bootstrap replicates of every variable of one vendor at once, the same row 
+    indices are used for all variables of a replicate, replicates are drawn in chunks so no more than 
+    BOOTSTRAP_CHUNK_SIZE resampled values are held in memory
+        
+    Args:
+        values (array): contains all data of one vendor, one row per variable
+        replicates (int): number of bootstrap replicates
+        seed (int): seed of the random number generator
 
-        if bootstrap == "Y":
-            columns[i] = resample(columns[i], replace=True, n_samples=1000, random_state=1)
+    Returns:
+        dict: statistic name to an array with one row per variable and one column per replicate
 
-        bins.append(range(min(columns[i]), max(columns[i]) + 2))
+    """
+    varCount, rowCount = values.shape
+    rng = np.random.default_rng(seed)
+
+    # margins are small positive integers, so each replicate is counted per margin value 
+    # and the statistics are read from the counts instead of sorting the samples
+    width = int(values.max()) + 1
+    levels = np.arange(width)
+
+    repMean = np.empty((varCount, replicates))
+    repMedian = np.empty((varCount, replicates))
+    repSD = np.empty((varCount, replicates))
+
+    chunkSize = max(1, BOOTSTRAP_CHUNK_SIZE // max(1, varCount * rowCount))
+    for start in range(0, replicates, chunkSize):
+        stop = min(start + chunkSize, replicates)
+        index = rng.integers(0, rowCount, size=(stop - start, rowCount))
+
+        # every variable and replicate gets its own block of width counts
+        offsets = (np.arange(varCount * (stop - start)) * width).reshape(varCount, stop - start, 1)
+        counts = np.bincount((values[:, index] + offsets).ravel(), minlength=varCount * (stop - start) * width)
+        counts = counts.reshape(varCount, stop - start, width)
+
+        total = counts @ levels
+        mean = total / rowCount
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (counts @ (levels ** 2) - total * mean) / (rowCount - 1)
+        repMean[:, start:stop] = mean
+        repSD[:, start:stop] = np.sqrt(np.maximum(variance, 0))
+
+        # median is the average of the two middle values, which are the same value when rowCount is odd
+        cumulative = counts.cumsum(axis=2)
+        lowMiddle = (cumulative <= (rowCount - 1) // 2).sum(axis=2)
+        highMiddle = (cumulative <= rowCount // 2).sum(axis=2)
+        repMedian[:, start:stop] = (lowMiddle + highMiddle) / 2
+
+    return {"Mean": repMean, "Median": repMedian, "SD": repSD,
+            "Mean-1SD": repMean - repSD, "Mean-2SD": repMean - (2 * repSD), "Mean-3SD": repMean - (3 * repSD)}
+
+
+def addIntervals(stats, intervals):
+    """
+    addIntervals writes each statistic with its confidence interval for the tables
+        
+    Args:
+        stats (list): contains statistic of each vendor for each variable
+        intervals (list): contains [lower, upper] of each vendor for each variable
 
-        mean.append(round(stats.mean(columns[i]), 4))
-        median.append(round(stats.median(columns[i]), 4))
-        stdev.append(round(stats.stdev(columns[i]), 4))
-        iqr.append(round(np.subtract(*np.percentile(columns[i], [75, 25])), 4))
-        meanSD1.append(round(mean[i] - stdev[i], 4))
-        meanSD2.append(round(mean[i] - (2 * stdev[i]), 4))
-        meanSD3.append(round(mean[i] - (3 * stdev[i]), 4))
+    Returns:
+        list: contains text of each vendor for each variable, e.g. '12.5 [12.1, 12.9]'
 
-    return columns, x, y, mean, median, stdev, iqr, meanSD1, meanSD2, meanSD3
+    """
+    cells = []
+    for var in range(0, len(stats)):
+        cells.append([str(stats[var][i]) + " [" + str(intervals[var][i][0]) + ", " + str(intervals[var][i][1]) + "]" for i in range(0, len(stats[var]))])
+    return cells
 
 
-def makeHistogram(marginList, variable, graphNum, axs, includeLine, bootstrap, varNum): 
+def makeHistogram(bins, mean, stdev, variable, graphNum, axs, includeLine, varNum, threshold=DEFAULT_THRESHOLD): 
     """
     makeHistogram creates a histogram of each variable for each vendor
         
     Args:
-        marginList (list): contains all data for one margin
+        bins (tuple): contains value, count and edges of each bin of one vendor for variable from getHistogram
+        mean (float): mean of data from calculateStats
+        stdev (float): standard deviation of data from calculateStats
         variable (str): variable name
         graphNum (int): position of subplot
         axs (axes): graph axes
         includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
-        bootstrap (str): 'Y' if yes, 'N' if no - decides if data is bootstrapped
         varNum (int): number of variables to plot
+        threshold (float): margin the threshold line is drawn at
 
     """   
     x = 0
@@ -674,27 +2092,15 @@ def makeHistogram(marginList, variable, graphNum, axs, includeLine, bootstrap, v
         x = 1
         y = (graphNum - 1) % (varNum//2)
 
-    columns = []
-
-    for i in range(0, len(marginList)):
-        columns.append(abs(int(marginList[i][graphNum])))
-
-    if bootstrap == "Y":
-        columns = resample(columns, replace=True, n_samples=1000, random_state=1)
-
-    bins = range(min(columns), max(columns) + 2)
-
-    axs[x, y].hist(columns, bins, edgecolor='black')
-
-    mean = round(stats.mean(columns), 4)
-    stdev = round(stats.stdev(columns), 4)
+    levels, counts, edges = bins
+    axs[x, y].hist(levels, edges, weights=counts, edgecolor='black')
 
     axs[x, y].tick_params(axis='both', which='major', labelsize=5)
     axs[x, y].grid(linestyle='dotted')
     axs[x, y].set_title(variable)
 
     if includeLine == "Y":
-        axs[x, y].axvline(x=6, linestyle='dotted')
+        axs[x, y].axvline(x=threshold, linestyle='dotted')
     axs[x, y].plot()
 
     col_labels = ['mean', 'standard\ndeviation']
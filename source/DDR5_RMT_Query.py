@@ -0,0 +1,305 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Query.py
+# Date: 10/18/2026
+
+# Description: Looks up margins of the parsed logs without opening the CSV files in Excel, e.g. the worst
+# lanes of one variable over all boots or every sample of one rank, using indexes built once when the
+# folders are read, so each query takes milliseconds
+
+# Usage:
+#   python DDR5_RMT_Query.py <folders> --worst 50 --variable RxDqs- [--margin LaneMargin] [--cpu 0]
+#   python DDR5_RMT_Query.py <folders> --location N1.C3.D0.R1 [--margin LaneMargin]
+
+# Assumption:
+#   1. Smaller absolute margins are worse, the worst rows of a variable are its smallest margins
+#   2. Each row is one lane (or rank) of one file, so the same lane is found once for each boot
+#   3. Every field of a row name is below 255, so all fields of a row fit in one location code
+# ----------------------------------------------
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+from DDR5_RMT_Processing import readData, decodeRowKeys, getVendorName, MARGIN_SECTIONS, ROW_FIELDS
+from DDR5_RMT_Cache import DEFAULT_CACHE_DIR
+
+
+# each field of a row name takes this many values in a location code, -1 (no field) is stored as 0
+LOCATION_RADIX = 256
+
+
+def makeQueryIndex(marginStore):
+    """
+    makeQueryIndex sorts the rows of a margin store by each variable and by location once, so queries
+    only take the first rows or a range of rows
+
+    Args:
+        marginStore (dict): margin store from mergeMarginStores
+
+    Returns:
+        dict: contains the rows sorted by margin, one row per variable ("order"), the sorted location codes
+              ("locations") and the rows in the order of the location codes ("locationOrder")
+
+    """
+    order = np.argsort(marginStore["values"], axis=1, kind='stable').astype(np.int32)
+    locations = encodeLocations(marginStore["rowKeys"])
+    locationOrder = np.argsort(locations, kind='stable').astype(np.int32)
+    return {"order": order, "locations": locations[locationOrder], "locationOrder": locationOrder}
+
+
+def encodeLocations(rowKeys, fieldCount=None):
+    """
+    encodeLocations combines the first fields of each row name into one integer, fields of ROW_FIELDS
+    change slowest first, so all rows of one socket, channel, DIMM or rank have neighbouring codes
+
+    Args:
+        rowKeys (array): fields of each row from decodeRowKeys
+        fieldCount (int): number of fields combined, None for all fields
+
+    Returns:
+        array: contains location code of each row
+
+    """
+    if fieldCount is None:
+        fieldCount = len(rowKeys)
+    code = np.zeros(rowKeys.shape[1], dtype=np.int64)
+    for field in range(0, fieldCount):
+        code = code * LOCATION_RADIX + (rowKeys[field].astype(np.int64) + 1)
+    return code
+
+
+def readQueryData(folders, vendorNames=None, cacheDir=DEFAULT_CACHE_DIR):
+    """
+    readQueryData reads every folder and builds the query indexes of each margin store
+
+    Args:
+        folders (list): contains paths of folders, one per vendor
+        vendorNames (list): contains vendor name of each folder, None takes them from the folder names
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+
+    Returns:
+        dict: contains vendor names ("vendors"), files of each folder ("files"), margin stores of each vendor
+              by CPU number with their indexes ("stores"), rank margin variables ("rankVarList") and CA lane
+              margin variables ("caLaneVarList")
+
+    """
+    if vendorNames is None:
+        vendorNames = [getVendorName(folder) for folder in folders]
+
+    queryData = {"vendors": vendorNames, "files": [], "stores": [], "rankVarList": [], "caLaneVarList": []}
+    for i in range(0, len(folders)):
+        folder = os.listdir(folders[i])
+        socketStores, rankVarList, caLaneVarList = readData(folder, folders[i], vendorNames[i], cacheDir=cacheDir, queryIndex=True)
+        queryData["files"].append(folder)
+        queryData["stores"].append(socketStores)
+        if rankVarList:
+            queryData["rankVarList"], queryData["caLaneVarList"] = rankVarList, caLaneVarList
+    return queryData
+
+
+def getQueryStores(queryData, marginName, cpuNums=None):
+    """
+    getQueryStores gives the margin stores of one margin of every vendor and CPU
+
+    Args:
+        queryData (dict): data from readQueryData
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+        cpuNums (list): contains CPU numbers (str) to look in, None for every CPU
+
+    Returns:
+        list: contains vendor number, CPU number and margin store of each store with rows
+
+    """
+    stores = []
+    for vendorNum in range(0, len(queryData["vendors"])):
+        for cpuNum, cpuStores in queryData["stores"][vendorNum].items():
+            if (cpuNums is None or cpuNum in cpuNums) and len(cpuStores[marginName]["labels"]) > 0:
+                stores.append((vendorNum, cpuNum, cpuStores[marginName]))
+    return stores
+
+
+def getQueryVariables(queryData, marginName):
+    """
+    getQueryVariables gives the variables of one margin
+
+    Args:
+        queryData (dict): data from readQueryData
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+
+    Returns:
+        list: contains all variables of the margin
+
+    """
+    return queryData["caLaneVarList"] if marginName == "CALaneMargin" else queryData["rankVarList"]
+
+
+def makeQueryTable(queryData, variables, parts):
+    """
+    makeQueryTable puts the rows found in several margin stores into one table
+
+    Args:
+        queryData (dict): data from readQueryData
+        variables (list): contains variables of the margin
+        parts (list): contains vendor number, margin store and positions of the rows found in the store
+
+    Returns:
+        dict: contains vendor ("vendor"), file name ("file") and row name ("label") of each row, the margins
+              with one row per variable ("values") and the variables ("variables")
+
+    """
+    if len(parts) == 0:
+        return {"vendor": np.array([], dtype=object), "file": np.array([], dtype=object), "label": np.array([], dtype=object),
+                "values": np.zeros((0, 0), dtype=np.int16), "variables": []}
+
+    varNum = min([len(variables)] + [len(store["values"]) for vendorNum, store, rows in parts])
+    vendor = [np.full(len(rows), queryData["vendors"][vendorNum], dtype=object) for vendorNum, store, rows in parts]
+    files = [np.array(queryData["files"][vendorNum], dtype=object)[store["fileIndex"][rows]] for vendorNum, store, rows in parts]
+    labels = [store["labels"][rows].astype(object) for vendorNum, store, rows in parts]
+    values = [store["values"][:varNum, rows].astype(np.int16) for vendorNum, store, rows in parts]
+
+    return {"vendor": np.concatenate(vendor), "file": np.concatenate(files), "label": np.concatenate(labels),
+            "values": np.concatenate(values, axis=1), "variables": variables[:varNum]}
+
+
+def takeQueryRows(table, rows):
+    """
+    takeQueryRows keeps some rows of a query table, in the given order
+
+    Args:
+        table (dict): table from makeQueryTable
+        rows (array): contains positions of rows to keep
+
+    Returns:
+        dict: table with only the given rows
+
+    """
+    return {"vendor": table["vendor"][rows], "file": table["file"][rows], "label": table["label"][rows],
+            "values": table["values"][:, rows], "variables": table["variables"]}
+
+
+def findWorstRows(queryData, variable, count=50, marginName="LaneMargin", cpuNums=None):
+    """
+    findWorstRows finds the rows with the smallest margins of one variable over every file of every vendor
+
+    Args:
+        queryData (dict): data from readQueryData
+        variable (str): name of variable (e.g. 'RxDqs-')
+        count (int): number of rows
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+        cpuNums (list): contains CPU numbers (str) to look in, None for every CPU
+
+    Returns:
+        dict: table from makeQueryTable, smallest margin first
+
+    """
+    variables = getQueryVariables(queryData, marginName)
+    if not variable in variables:
+        raise ValueError("unknown variable " + variable + ", variables are " + " ".join(variables))
+    varNum = variables.index(variable)
+
+    # the worst rows of all stores are among the worst rows of each store
+    parts = [(vendorNum, store, store["index"]["order"][varNum][:count]) for vendorNum, cpuNum, store in getQueryStores(queryData, marginName, cpuNums)]
+    table = makeQueryTable(queryData, variables, parts)
+    if len(parts) == 0:
+        return table
+    return takeQueryRows(table, np.argsort(table["values"][varNum], kind='stable')[:count])
+
+
+def findLocationRows(queryData, location, marginName="LaneMargin"):
+    """
+    findLocationRows finds every row of a location over every file of every vendor, fields the location
+    does not have match any row (e.g. 'N1.C3.D0.R1' gives every lane of the rank)
+
+    Args:
+        queryData (dict): data from readQueryData
+        location (str): fields of the row names to find (e.g. 'N1.C3.D0.R1')
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+
+    Returns:
+        dict: table from makeQueryTable, rows of each store in location order
+
+    """
+    locationKeys = decodeRowKeys([location])[:, 0]
+    if (locationKeys < 0).all():
+        raise ValueError("no fields found in location " + location)
+    cpuNums = None if locationKeys[0] < 0 else [str(locationKeys[0])]
+
+    # the first fields the location has are found in the sorted location codes, any later fields are checked row by row
+    prefixCount = 0
+    while prefixCount < len(locationKeys) and locationKeys[prefixCount] >= 0:
+        prefixCount = prefixCount + 1
+    shift = LOCATION_RADIX ** (len(ROW_FIELDS) - prefixCount)
+    low = int(encodeLocations(locationKeys.reshape(-1, 1), prefixCount)[0]) * shift
+
+    parts = []
+    for vendorNum, cpuNum, store in getQueryStores(queryData, marginName, cpuNums):
+        index = store["index"]
+        rows = index["locationOrder"][np.searchsorted(index["locations"], low):np.searchsorted(index["locations"], low + shift)]
+        for field in range(prefixCount, len(locationKeys)):
+            if locationKeys[field] >= 0:
+                rows = rows[store["rowKeys"][field][rows] == locationKeys[field]]
+        if len(rows) > 0:
+            parts.append((vendorNum, store, rows))
+    return makeQueryTable(queryData, getQueryVariables(queryData, marginName), parts)
+
+
+def formatQueryTable(table):
+    """
+    formatQueryTable writes a query table as text with one line per row
+
+    Args:
+        table (dict): table from makeQueryTable
+
+    Returns:
+        str: text of table
+
+    """
+    header = ["Vendor", "File", "Row"] + table["variables"]
+    lines = [header] + [[str(table["vendor"][i]), str(table["file"][i]), str(table["label"][i]).rstrip(":")] +
+                        [str(margin) for margin in table["values"][:, i]] for i in range(0, len(table["label"]))]
+    widths = [max(len(line[column]) for line in lines) for column in range(0, len(header))]
+    return "\n".join("  ".join(line[column].ljust(widths[column]) for column in range(0, len(header))).rstrip() for line in lines)
+
+
+def main(argv=None):
+    """
+    main reads the folders and prints the rows of one query
+
+    Args:
+        argv (list): contains command line arguments without the program name, None reads sys.argv
+
+    """
+    parser = argparse.ArgumentParser(description="Finds the worst lanes or every sample of a location in DDR5 RMT logs")
+    parser.add_argument("folders", nargs="+", help="folders of log files, one per vendor")
+    parser.add_argument("--vendors", nargs="+", help="vendor names, one per folder, taken from the folder names if not given")
+    parser.add_argument("--worst", type=int, metavar="COUNT", help="number of rows with the smallest margins of --variable")
+    parser.add_argument("--variable", help="variable of --worst (e.g. RxDqs-)")
+    parser.add_argument("--location", help="fields of the row names to find (e.g. N1.C3.D0.R1)")
+    parser.add_argument("--margin", default="LaneMargin", choices=[marginName for marginName, header, firstVar in MARGIN_SECTIONS])
+    parser.add_argument("--cpu", nargs="+", help="CPU numbers --worst looks in, every CPU if not given")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="folder of parsed log file cache")
+    parser.add_argument("--no-cache", action="store_true", help="always parse the log files")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if (args.worst is None) == (args.location is None) or (args.worst is not None and args.variable is None):
+        parser.error("give either --worst with --variable or --location")
+
+    queryData = readQueryData(args.folders, args.vendors, None if args.no_cache else args.cache_dir)
+    start = time.perf_counter()
+    try:
+        if args.worst is not None:
+            table = findWorstRows(queryData, args.variable, args.worst, args.margin, args.cpu)
+        else:
+            table = findLocationRows(queryData, args.location, args.margin)
+    except ValueError as error:
+        parser.error(str(error))
+    queryTime = time.perf_counter() - start
+
+    print(formatQueryTable(table))
+    print(len(table["label"]), "rows in", round(queryTime * 1000, 2), "ms")
+
+
+if __name__ == "__main__":
+    main()
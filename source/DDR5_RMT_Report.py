@@ -0,0 +1,228 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Report.py
+# Date: 10/18/2026
+
+# Description: Records where the time of a run goes, the wall time, number of calls, bytes, rows and files
+# of each phase (listing folders, parsing, CSV export, statistics, each kind of graph...), the figures drawn
+# and files written, and saves it as a JSON run report with an optional cProfile and tracemalloc capture
+
+# Assumption:
+#   1. Phases do not overlap, a phase is ended before the next one starts
+#   2. Phases in worker processes are timed by the worker and added to the report of the main process,
+#      cProfile and tracemalloc only see the main process
+#   3. Graphs drawn in parallel add the time of every process to their phase, "renderSeconds" is the wall time
+#   4. Functions take report=None to record nothing, like figureManager=None
+# ----------------------------------------------
+
+import json
+import time
+import platform
+
+# number of functions and allocation sites saved in the report
+REPORT_TOP_FUNCTIONS = 25
+REPORT_TOP_ALLOCATIONS = 15
+
+
+def openRunReport(profile=False, traceMemory=False):
+    """
+    openRunReport starts a run report with no phases, and starts cProfile and tracemalloc if asked
+
+    Args:
+        profile (boolean): True if functions of the main process are profiled with cProfile
+        traceMemory (boolean): True if memory allocations of the main process are traced with tracemalloc
+
+    Returns:
+        dict: contains the phases by name ("phases"), information about the run ("run"), figures opened ("figures"),
+              graphs drawn ("graphs"), wall time of drawing them ("renderSeconds"), start time ("start"), the profiler
+              ("profiler", None if not profiled) and if memory is traced ("traceMemory")
+
+    """
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if traceMemory:
+        import tracemalloc
+        tracemalloc.start()
+
+    return {"phases": {}, "run": {}, "figures": 0, "graphs": 0, "renderSeconds": 0.0, "start": time.perf_counter(), "profiler": profiler, "traceMemory": traceMemory}
+
+
+def initReportWorker():
+    """
+    initReportWorker stops cProfile and tracemalloc in a worker process, forked workers inherit them from
+    the main process and would otherwise run many times slower
+
+    """
+    import sys
+    import tracemalloc
+    sys.setprofile(None)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def startPhase(report):
+    """
+    startPhase gives the start time of a phase
+
+    Args:
+        report (dict): run report from openRunReport, None if not recorded
+
+    Returns:
+        float: start time, None if not recorded
+
+    """
+    if report is None:
+        return None
+    return time.perf_counter()
+
+
+def endPhase(report, name, start, byteCount=0, rowCount=0, fileCount=0):
+    """
+    endPhase adds the time since start and the work done to a phase
+
+    Args:
+        report (dict): run report from openRunReport, None if not recorded
+        name (str): name of phase, words before the first space are the group of the phase (e.g. 'read parse')
+        start (float): start time from startPhase
+        byteCount (int): number of bytes read or written
+        rowCount (int): number of rows read or counted
+        fileCount (int): number of files read or written
+
+    """
+    if report is None:
+        return
+    addToPhase(report, name, time.perf_counter() - start, 1, byteCount, rowCount, fileCount)
+
+    # peak of the allocations is started again, so each phase gets its own peak
+    if report["traceMemory"]:
+        import tracemalloc
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        phase = report["phases"][name]
+        phase["peakTracedMB"] = max(phase.get("peakTracedMB", 0.0), peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+
+def addToPhase(report, name, seconds, calls=1, byteCount=0, rowCount=0, fileCount=0):
+    """
+    addToPhase adds time and work done to a phase, for phases timed somewhere else (e.g. worker processes)
+
+    Args:
+        report (dict): run report from openRunReport, None if not recorded
+        name (str): name of phase
+        seconds (float): time of phase in seconds
+        calls (int): number of times the phase ran
+        byteCount (int): number of bytes read or written
+        rowCount (int): number of rows read or counted
+        fileCount (int): number of files read or written
+
+    """
+    if report is None:
+        return
+    phase = report["phases"].setdefault(name, {"seconds": 0.0, "calls": 0, "bytes": 0, "rows": 0, "files": 0})
+    phase["seconds"] = phase["seconds"] + seconds
+    phase["calls"] = phase["calls"] + calls
+    phase["bytes"] = phase["bytes"] + int(byteCount)
+    phase["rows"] = phase["rows"] + int(rowCount)
+    phase["files"] = phase["files"] + int(fileCount)
+
+
+def mergeRunReports(report, otherReport):
+    """
+    mergeRunReports adds the phases, figures and graphs of another report (e.g. of a worker process) to a report
+
+    Args:
+        report (dict): run report from openRunReport, None if not recorded
+        otherReport (dict): run report to add
+
+    """
+    if report is None or otherReport is None:
+        return
+    for name, phase in otherReport["phases"].items():
+        addToPhase(report, name, phase["seconds"], phase["calls"], phase["bytes"], phase["rows"], phase["files"])
+    report["figures"] = report["figures"] + otherReport["figures"]
+    report["graphs"] = report["graphs"] + otherReport["graphs"]
+    report["renderSeconds"] = report["renderSeconds"] + otherReport["renderSeconds"]
+
+
+def finishRunReport(report, reportPath=None, peakMemory=None):
+    """
+    finishRunReport stops cProfile and tracemalloc, adds the totals to the report and saves it to JSON,
+    the cProfile data is also saved next to the report for pstats or snakeviz
+
+    Args:
+        report (dict): run report from openRunReport
+        reportPath (str): path of JSON file, None to not save the report
+        peakMemory (float): peak memory of the run in MB, None if not known
+
+    Returns:
+        dict: the report as saved to JSON
+
+    """
+    totalSeconds = time.perf_counter() - report["start"]
+    phases = report["phases"]
+    savedReport = {"python": platform.python_version(), "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   "run": report["run"], "totalSeconds": round(totalSeconds, 4),
+                   "peakMemoryMB": None if peakMemory is None else round(peakMemory, 1),
+                   "files": sum(phases[name]["files"] for name in phases if name.startswith("render") or name == "read csv"),
+                   "bytesWritten": sum(phases[name]["bytes"] for name in phases if name.startswith("render") or name == "read csv"),
+                   "figures": report["figures"], "graphs": report["graphs"], "renderSeconds": round(report["renderSeconds"], 4),
+                   "phases": {name: dict(phases[name], seconds=round(phases[name]["seconds"], 4)) for name in phases}}
+    if "violations" in report:
+        savedReport["violations"] = report["violations"]
+
+    if report["profiler"] is not None:
+        import pstats
+        report["profiler"].disable()
+        stats = pstats.Stats(report["profiler"])
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:REPORT_TOP_FUNCTIONS]
+        savedReport["profile"] = [{"function": pstats.func_std_string(function), "calls": calls, "seconds": round(ownTime, 4),
+                                   "cumulativeSeconds": round(cumulativeTime, 4)} for function, (primitiveCalls, calls, ownTime, cumulativeTime, callers) in top]
+        if reportPath is not None:
+            savedReport["profilePath"] = reportPath[:-5] + ".prof" if reportPath.endswith(".json") else reportPath + ".prof"
+            stats.dump_stats(savedReport["profilePath"])
+        report["profiler"] = None
+
+    if report["traceMemory"]:
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            savedReport["allocations"] = [{"line": str(stat.traceback), "sizeMB": round(stat.size / (1024 * 1024), 3), "count": stat.count}
+                                          for stat in snapshot.statistics("lineno")[:REPORT_TOP_ALLOCATIONS]]
+            tracemalloc.stop()
+
+    if reportPath is not None:
+        with open(reportPath, "w") as file:
+            json.dump(savedReport, file, indent=2)
+    return savedReport
+
+
+def summarizeRunReport(savedReport):
+    """
+    summarizeRunReport gives one line with the total time, the time of each group of phases and what was written,
+    render is the wall time since graphs drawn in parallel add up to more than the time they took
+
+    Args:
+        savedReport (dict): report from finishRunReport
+
+    Returns:
+        str: summary of run
+
+    """
+    groups = {}
+    for name, phase in savedReport["phases"].items():
+        group = name.split(" ")[0]
+        groups[group] = groups.get(group, 0.0) + phase["seconds"]
+    if "render" in groups:
+        groups["render"] = savedReport["renderSeconds"]
+
+    summary = "Run: " + str(round(savedReport["totalSeconds"], 1)) + " s"
+    for group in groups:
+        summary = summary + ", " + group + " " + str(round(groups[group], 1)) + " s"
+    summary = summary + ", " + str(savedReport["files"]) + " files (" + str(round(savedReport["bytesWritten"] / (1024 * 1024), 1)) + " MB)"
+    summary = summary + ", " + str(savedReport["graphs"]) + " graphs"
+    if savedReport["peakMemoryMB"] is not None:
+        summary = summary + ", peak " + str(savedReport["peakMemoryMB"]) + " MB"
+    return summary
@@ -0,0 +1,160 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Synthetic.py
+# Date: 10/18/2026
+
+# Description: Writes synthetic BIOS RMT logs for benchmarks and for trying out the tool without real logs,
+# one folder per vendor named like the real folders (e.g. Everett_EMR_SK_64GB_1DPC)
+
+# Usage:
+#   python DDR5_RMT_Synthetic.py <output folder> [--vendors 3] [--files 10] [--sockets 2] [--channels 8] ...
+#   python DDR5_RMT_Synthetic.py --help for all options
+
+# Assumption:
+#   1. Each log has boot messages around one START_RMT_N*/STOP_RMT_N* block per socket, each block has a
+#      Rank Margin, Lane Margin and CA Lane Margin table ended by an 'IoLevel' line
+#   2. Margins are random but the same seed always writes the same logs, '-' variables are negative
+#   3. Some CA lane rows are flagged with '*', these rows are left out of the graphs like in real logs
+# ----------------------------------------------
+
+import os
+import sys
+import argparse
+import numpy as np
+
+
+VENDOR_NAMES = ["SK", "Samsung", "Micron", "Kingston", "Nanya", "CXMT"]
+
+RANK_VARIABLES = ["RxDqs-", "RxDqs+", "RxV-", "RxV+", "TxDq-", "TxDq+", "TxV-", "TxV+"]
+CA_VARIABLES = ["Ca-", "Ca+", "CaV-", "CaV+"]
+
+SYNTHETIC_DEFAULTS = {"vendors": 3, "files": 10, "sockets": 2, "channels": 8, "dimms": 1, "ranks": 2, "lanes": 40,
+                      "caLanes": 14, "starRate": 0.02, "noiseLines": 200, "seed": 1}
+
+
+def makeMarginTable(rng, header, variables, labels, meanMargin, spread, starRate=0.0):
+    """
+    makeMarginTable writes one margin table with a row of random margins for each label
+
+    Args:
+        rng (Generator): numpy random number generator
+        header (str): header of table (e.g. 'Rank Margin')
+        variables (list): contains all variables
+        labels (list): contains row name of each row (e.g. 'N0.C0.D0.R0.L0')
+        meanMargin (float): average margin of vendor
+        spread (float): standard deviation of margins
+        starRate (float): share of rows flagged with '*'
+
+    Returns:
+        list: contains lines of table
+
+    """
+    margins = np.clip(np.rint(rng.normal(meanMargin, spread, (len(labels), len(variables)))), 0, 63).astype(int)
+    signs = np.array([-1 if variable.endswith("-") else 1 for variable in variables])
+    starred = rng.random(len(labels)) < starRate
+
+    lines = [header + "\n", "            " + "  ".join(variables) + "\n"]
+    for i in range(0, len(labels)):
+        star = " *" if starred[i] else ""
+        lines.append(labels[i] + ":" + star + "   " + "  ".join(str(margin) for margin in margins[i] * signs) + "\n")
+    lines.append("IoLevel = 1\n")
+    return lines
+
+
+def makeLogText(rng, meanMargin, sockets, channels, dimms, ranks, lanes, caLanes, starRate, noiseLines):
+    """
+    makeLogText writes the text of one synthetic log file
+
+    Args:
+        rng (Generator): numpy random number generator
+        meanMargin (float): average margin of vendor
+        sockets (int): number of CPUs
+        channels (int): number of channels per CPU
+        dimms (int): number of DIMMs per channel
+        ranks (int): number of ranks per DIMM
+        lanes (int): number of data lanes per rank
+        caLanes (int): number of CA lanes per rank
+        starRate (float): share of CA lane rows flagged with '*'
+        noiseLines (int): number of boot messages before and after each RMT block
+
+    Returns:
+        str: text of log file
+
+    """
+    lines = []
+    for socket in range(0, sockets):
+        lines += ["[%10.6f] BIOS: init socket %d step %d\n" % (socket + step * 0.0013, socket, step) for step in range(0, noiseLines)]
+        lines.append("START_RMT_N" + str(socket) + "\n")
+
+        ranksOfSocket = ["N%d.C%d.D%d.R%d" % (socket, channel, dimm, rank)
+                         for channel in range(0, channels) for dimm in range(0, dimms) for rank in range(0, ranks)]
+        lines += makeMarginTable(rng, "Rank Margin", RANK_VARIABLES, ranksOfSocket, meanMargin, 4)
+        lines += makeMarginTable(rng, "Lane Margin", RANK_VARIABLES, [rank + ".L" + str(lane) for rank in ranksOfSocket for lane in range(0, lanes)], meanMargin, 5)
+        lines += makeMarginTable(rng, "CA Lane Margin", CA_VARIABLES, [rank + ".A" + str(lane) for rank in ranksOfSocket for lane in range(0, caLanes)],
+                                 meanMargin + 5, 6, starRate)
+
+        lines.append("STOP_RMT_N" + str(socket) + "\n")
+    lines += ["[%10.6f] BIOS: boot done step %d\n" % (sockets + step * 0.0013, step) for step in range(0, noiseLines)]
+    return "".join(lines)
+
+
+def writeSyntheticLogs(outputDir, vendors=3, files=10, sockets=2, channels=8, dimms=1, ranks=2, lanes=40, caLanes=14,
+                       starRate=0.02, noiseLines=200, seed=1):
+    """
+    writeSyntheticLogs writes a folder of synthetic log files for each vendor
+
+    Args:
+        outputDir (str): folder the vendor folders are written to
+        vendors (int): number of vendors
+        files (int): number of log files per vendor
+        sockets (int): number of CPUs
+        channels (int): number of channels per CPU
+        dimms (int): number of DIMMs per channel
+        ranks (int): number of ranks per DIMM
+        lanes (int): number of data lanes per rank
+        caLanes (int): number of CA lanes per rank
+        starRate (float): share of CA lane rows flagged with '*'
+        noiseLines (int): number of boot messages before and after each RMT block
+        seed (int): seed of the random number generator, the same seed writes the same logs
+
+    Returns:
+        list: contains path of each vendor folder
+
+    """
+    rng = np.random.default_rng(seed)
+    folders = []
+    for vendorNum in range(0, vendors):
+        vendorName = VENDOR_NAMES[vendorNum] if vendorNum < len(VENDOR_NAMES) else "Vendor" + str(vendorNum + 1)
+        folderPath = os.path.join(outputDir, "Everett_EMR_" + vendorName + "_64GB_1DPC")
+        os.makedirs(folderPath, exist_ok=True)
+
+        # each vendor has its own average margin
+        meanMargin = 14 + (2 * vendorNum) % 7
+        for fileNum in range(0, files):
+            with open(os.path.join(folderPath, "log%04d.txt" % fileNum), "w") as file:
+                file.write(makeLogText(rng, meanMargin, sockets, channels, dimms, ranks, lanes, caLanes, starRate, noiseLines))
+        folders.append(folderPath)
+    return folders
+
+
+def main(argv=None):
+    """
+    main writes synthetic logs with the options of the command line
+
+    Args:
+        argv (list): contains command line arguments without the program name, None reads sys.argv
+
+    """
+    parser = argparse.ArgumentParser(description="Writes synthetic DDR5 RMT logs, one folder per vendor")
+    parser.add_argument("output", help="folder the vendor folders are written to")
+    for option, default in SYNTHETIC_DEFAULTS.items():
+        parser.add_argument("--" + option, type=type(default), default=default)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    options = {option: getattr(args, option) for option in SYNTHETIC_DEFAULTS}
+    folders = writeSyntheticLogs(args.output, **options)
+    for folder in folders:
+        print(folder)
+
+
+if __name__ == "__main__":
+    main()
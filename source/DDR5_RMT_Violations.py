@@ -0,0 +1,172 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Violations.py
+# Date: 10/18/2026
+
+# Description: Counts the samples below the margin threshold (guard band) of each variable, for every
+# location (socket, channel, DIMM, rank, lane...) of every vendor, and writes the violation counts and rates
+# as a CSV file and a short JSON report, so a run can pass or fail a qualification
+
+# Thresholds:
+#   {"default": 6, "RxDqs-": 7, "CALaneMargin": 8, "CALaneMargin.Ca-": 9}
+#   keys are tried in the order "<margin>.<variable>", "<variable>", "<margin>", "default",
+#   margin names are RankMargin, LaneMargin and CALaneMargin
+
+# Assumption:
+#   1. A sample violates the threshold when its absolute margin is below the threshold, a margin equal to
+#      the threshold passes, like a margin on the threshold line of the graphs
+#   2. All samples of one margin store are checked at once with numpy, one location is every row with the same
+#      fields of its row name over all files
+# ----------------------------------------------
+
+import csv
+import json
+import numpy as np
+
+from DDR5_RMT_GroupBy import encodeGroups, groupStats
+
+
+# threshold of every variable without a threshold of its own, the line of the graphs is drawn at it
+DEFAULT_THRESHOLD = 6
+
+# number of locations with the highest violation rate listed in the report for each margin
+REPORT_TOP_LOCATIONS = 10
+
+
+def loadThresholds(thresholdPath):
+    """
+    loadThresholds reads the thresholds of a JSON file
+
+    Args:
+        thresholdPath (str): path of JSON file, see Thresholds above
+
+    Returns:
+        dict: contains the thresholds by key
+
+    """
+    with open(thresholdPath, "r") as file:
+        return json.load(file)
+
+
+def getThresholdList(thresholds, marginName, variableList):
+    """
+    getThresholdList finds the threshold of each variable of one margin
+
+    Args:
+        thresholds (dict): contains the thresholds by key, None uses DEFAULT_THRESHOLD for every variable
+        marginName (str): 'RankMargin', 'LaneMargin' or 'CALaneMargin'
+        variableList (list): contains all variables of the margin
+
+    Returns:
+        list: contains the threshold of each variable
+
+    """
+    if thresholds is None:
+        return [DEFAULT_THRESHOLD] * len(variableList)
+
+    thresholdList = []
+    for variable in variableList:
+        for key in [marginName + "." + variable, variable, marginName, "default"]:
+            if key in thresholds:
+                thresholdList.append(thresholds[key])
+                break
+        else:
+            thresholdList.append(DEFAULT_THRESHOLD)
+    return thresholdList
+
+
+def findViolations(marginStore, thresholdList):
+    """
+    findViolations counts the samples of each location below the threshold of each variable
+
+    Args:
+        marginStore (dict): margin store of one vendor for one margin
+        thresholdList (list): contains the threshold of each variable
+
+    Returns:
+        dict: contains the name of each location ("locations"), the number of samples of each location ("samples"),
+              the number of violations ("violations") and the violation rate ("rates") of each variable of each location,
+              one row per variable
+
+    """
+    values = marginStore["values"]
+    violated = values < np.array(thresholdList[:len(values)]).reshape(-1, 1)
+
+    # locations are numbered in sorted field order, fields a row name does not have are -1
+    rowKeys = marginStore["rowKeys"]
+    locationIndex, locationKeys = encodeGroups([rowKeys[field].astype(np.int64) + 1 for field in range(0, len(rowKeys))])
+    firstRow = np.full(len(locationKeys[0]), len(locationIndex), dtype=np.int64)
+    np.minimum.at(firstRow, locationIndex, np.arange(len(locationIndex)))
+
+    samples, violations, rates = groupStats(locationIndex, violated, len(firstRow))
+    return {"locations": [str(marginStore["labels"][row]).rstrip(":") for row in firstRow], "samples": samples,
+            "violations": violations.astype(np.int64), "rates": rates}
+
+
+def writeViolationCSV(allViolations, csvPath):
+    """
+    writeViolationCSV writes one line for every location and variable with a violation
+
+    Args:
+        allViolations (list): contains vendor ("vendor"), type of margin ("marginType"), variables ("variables"),
+                              thresholds ("thresholds") and the result of findViolations of each margin store
+        csvPath (str): path of CSV file
+
+    """
+    with open(csvPath, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Vendor", "Margin", "Location", "Variable", "Threshold", "Samples", "Violations", "Rate"])
+        for result in allViolations:
+            for locationNum, varNum in zip(*np.nonzero(result["violations"].T)):
+                writer.writerow([result["vendor"], result["marginType"], result["locations"][locationNum], result["variables"][varNum],
+                                 result["thresholds"][varNum], int(result["samples"][locationNum]), int(result["violations"][varNum, locationNum]),
+                                 round(float(result["rates"][varNum, locationNum]), 4)])
+
+
+def summarizeViolations(allViolations, maxRate=None):
+    """
+    summarizeViolations adds up the violations of each variable of each vendor and margin, and lists the
+    locations with the highest violation rate
+
+    Args:
+        allViolations (list): contains the results of each margin store, see writeViolationCSV
+        maxRate (float): highest violation rate of any variable that passes, None passes any rate
+
+    Returns:
+        dict: contains the number of samples ("samples") and violations ("violations"), the highest rate of any
+              variable ("maxRate"), if the run passed ("passed") and the totals of each margin ("margins")
+
+    """
+    summary = {"samples": 0, "violations": 0, "maxRate": 0.0, "passed": True, "margins": []}
+    for result in allViolations:
+        samples = int(result["samples"].sum())
+        violations = result["violations"].sum(axis=1)
+        rates = violations / samples if samples > 0 else np.zeros(len(violations))
+
+        # worst locations over all variables of the margin
+        locationRates = result["rates"].max(axis=0) if len(result["locations"]) > 0 else np.zeros(0)
+        worst = [locationNum for locationNum in np.argsort(-locationRates, kind='stable')[:REPORT_TOP_LOCATIONS] if locationRates[locationNum] > 0]
+
+        summary["margins"].append({"vendor": result["vendor"], "marginType": result["marginType"], "samples": samples,
+                                   "variables": {result["variables"][varNum]: {"threshold": result["thresholds"][varNum], "violations": int(violations[varNum]),
+                                                                               "rate": round(float(rates[varNum]), 6)} for varNum in range(0, len(violations))},
+                                   "worstLocations": [{"location": result["locations"][locationNum], "rate": round(float(locationRates[locationNum]), 4)}
+                                                      for locationNum in worst]})
+        summary["samples"] = summary["samples"] + samples * len(violations)
+        summary["violations"] = summary["violations"] + int(violations.sum())
+        summary["maxRate"] = max(summary["maxRate"], round(float(rates.max()), 6) if len(rates) > 0 else 0.0)
+
+    summary["passed"] = maxRate is None or summary["maxRate"] <= maxRate
+    return summary
+
+
+def writeViolationReport(summary, reportPath):
+    """
+    writeViolationReport saves the summary of the violations to JSON
+
+    Args:
+        summary (dict): summary from summarizeViolations
+        reportPath (str): path of JSON file
+
+    """
+    with open(reportPath, "w") as file:
+        json.dump(summary, file, indent=2)
@@ -0,0 +1,308 @@
+# ----------------------------------------------
+# File name: DDR5_RMT_Watch.py
+# Date: 10/18/2026
+
+# Description: Watches the vendor folders for new log files, reads only the new files, keeps running
+# statistics (accumulators) of each vendor and margin, and draws the graphs/tables again only for margins that changed
+
+# Assumption:
+#   1. Log files are only added to the folders, files that were read are not changed or removed
+#   2. A log file is finished when it has not been changed for WATCH_SETTLE_SECONDS
+#   3. CSV files stay open while watching and get the rows of new files added to them
+#   4. CPUs are added when a new file has them, margins of a CPU are graphed once every vendor has data for it
+# ----------------------------------------------
+
+import os
+import time
+import concurrent.futures
+
+from DDR5_RMT_Processing import (readData, makeGraphs, runRenderJobs, mergeMarginStores, makeLaneGroups, mergeLaneGroups, hasLanes, getSockets, getMarginTypes,
+                                 openCSVExport, closeCSVExport, BOOTSTRAP_REPLICATES, BOOTSTRAP_SEED)
+from DDR5_RMT_Cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MB, trimCache
+from DDR5_RMT_Accumulator import makeAccumulator, addToAccumulator, getAccumulatorStats
+from DDR5_RMT_Violations import getThresholdList
+from DDR5_RMT_Report import initReportWorker
+
+
+# files changed more recently than this are still being written and are read on a later scan
+WATCH_SETTLE_SECONDS = 5
+
+
+def watchData(folders, vendorNames, bootstrap, includeLine, histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, interval=60, cycles=None,
+              workers=1, cacheDir=DEFAULT_CACHE_DIR, maxCacheMB=DEFAULT_CACHE_MB, csvMode="truncate", replicates=BOOTSTRAP_REPLICATES,
+              seed=BOOTSTRAP_SEED, renderWorkers=1, chartMode="image", prefetchDepth=0, thresholds=None):
+    """
+    watchData checks the folders for new log files every interval seconds, the first check reads all files
+    like processData, later checks only read the new files and update the graphs/tables of margins that changed
+
+    Args:
+        folders (list): contains all folder paths
+        vendorNames (list): contains all vendor names
+        bootstrap (str): 'Y' if yes, 'N' if no - decides if tables include bootstrap confidence intervals
+        includeLine (str): 'Y' if yes, 'N' if no - decides if threshold line is included
+        histogram (boolean): True if graphs histogram
+        vendorTable (boolean): True if creates vendor table
+        boxPlot (boolean): True if graphs box plot
+        varTable (boolean): True if creates variable table
+        bitMarg (boolean): True if graphs bit margin (scatterplot)
+        comparator (boolean): True if graphs average bit margin (line graph)
+        interval (float): seconds between checks of the folders
+        cycles (int): number of checks before returning, None watches until stopped (Ctrl+C)
+        workers (int): number of processes reading log files, 1 reads them one after another, None uses every core
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+        maxCacheMB (float): largest size of the cache in MB
+        csvMode (str): 'truncate', 'version' or 'off', see openCSVExport
+        replicates (int): number of bootstrap replicates
+        seed (int): seed of the bootstrap random number generator
+        renderWorkers (int): number of processes rendering graphs and tables
+        chartMode (str): 'image' or 'native', see processData
+        prefetchDepth (int): number of log files read ahead of parsing, see processData
+        thresholds (dict): contains the thresholds the threshold lines are drawn at, see processData
+
+    Returns:
+        dict: watch state from openWatchState after the last check
+
+    """
+    watchState = openWatchState(folders, vendorNames)
+    csvExport = openCSVExport(csvMode)
+    pool = None
+    if workers != 1:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initReportWorker)
+
+    cycle = 0
+    try:
+        while cycles is None or cycle < cycles:
+            newFiles = scanFolders(watchState)
+            if any(newFiles):
+                changed = updateWatchState(watchState, newFiles, pool, cacheDir, csvExport, prefetchDepth)
+
+                # CSV files stay open between checks, so rows are written out after each check
+                for file in csvExport["files"].values():
+                    file.flush()
+                if cacheDir is not None:
+                    trimCache(cacheDir, maxCacheMB)
+
+                # graphs need data of every vendor
+                if all(len(seen) > 0 for seen in watchState["seen"]):
+                    renderJobs = []
+                    for marginType, cpuNum, marginName in getMarginTypes(watchState["sockets"]):
+                        if not any(changed[marginType]):
+                            continue
+                        if any(store is None or len(store["labels"]) == 0 for store in watchState["stores"][marginType]):
+                            print("Skipped", marginType + ", not every vendor has data yet")
+                            continue
+                        printRunningStats(watchState, marginType, changed[marginType])
+                        renderJobs += makeGraphs(watchState["stores"][marginType], getVariableList(watchState, marginType), vendorNames, includeLine, bootstrap, marginType,
+                                                 histogram, vendorTable, boxPlot, varTable, bitMarg, comparator, getVarNum(watchState, marginType), replicates, seed,
+                                                 changed[marginType], getLaneGroups(watchState, marginType), getAccumulators(watchState, marginType),
+                                                 chartMode, thresholdList=getThresholdList(thresholds, marginName, getVariableList(watchState, marginType)))
+                    runRenderJobs(renderJobs, renderWorkers)
+
+            cycle = cycle + 1
+            if cycles is None or cycle < cycles:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        closeCSVExport(csvExport)
+        if pool is not None:
+            pool.shutdown()
+
+    return watchState
+
+
+def openWatchState(folders, vendorNames):
+    """
+    openWatchState starts watching folders with no files read
+
+    Args:
+        folders (list): contains all folder paths
+        vendorNames (list): contains all vendor names
+
+    Returns:
+        dict: contains the folders ("folders"), vendor names ("vendors"), files read in each folder ("seen"),
+              CPU numbers found so far ("sockets"), margin store ("stores"), accumulator ("accumulators") and lanes 
+              ("lanes") of each vendor by margin, and the variable lists ("rankVarList", "caLaneVarList")
+
+    """
+    return {"folders": folders, "vendors": vendorNames, "seen": [[] for folder in folders], "sockets": [],
+            "stores": {}, "accumulators": {}, "lanes": {}, "rankVarList": None, "caLaneVarList": None}
+
+
+def scanFolders(watchState):
+    """
+    scanFolders finds the log files in each folder that were not read yet and are finished
+
+    Args:
+        watchState (dict): watch state from openWatchState
+
+    Returns:
+        list: contains the new file names of each folder, in the order os.listdir gives them
+
+    """
+    newFiles = []
+    now = time.time()
+    for i in range(0, len(watchState["folders"])):
+        seen = set(watchState["seen"][i])
+        folderFiles = []
+        for fileName in os.listdir(watchState["folders"][i]):
+            if fileName in seen:
+                continue
+            if now - os.path.getmtime(os.path.join(watchState["folders"][i], fileName)) < WATCH_SETTLE_SECONDS:
+                continue
+            folderFiles.append(fileName)
+        newFiles.append(folderFiles)
+    return newFiles
+
+
+def updateWatchState(watchState, newFiles, pool=None, cacheDir=None, csvExport=None, prefetchDepth=0):
+    """
+    updateWatchState reads the new files of each folder and adds them to the margin stores, accumulators
+    and lanes of their vendor
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        newFiles (list): contains the new file names of each folder from scanFolders
+        pool (ProcessPoolExecutor): processes that read the files in parallel, None reads them one after another
+        cacheDir (str): folder where parsed log files are cached, None to always parse the log files
+        csvExport (dict): open CSV files from openCSVExport, None to not write CSV files
+        prefetchDepth (int): number of files read ahead of parsing, 0 to not read ahead
+
+    Returns:
+        dict: contains True for each vendor whose data changed, by margin
+
+    """
+    vendorCount = len(watchState["folders"])
+    changed = {marginType: [False] * vendorCount for marginType in watchState["stores"]}
+
+    for i in range(0, vendorCount):
+        if not newFiles[i]:
+            continue
+        socketStores, rankVarList, caLaneVarList = readData(newFiles[i], watchState["folders"][i], watchState["vendors"][i], pool, cacheDir, csvExport, prefetchDepth=prefetchDepth)
+
+        # CPUs seen for the first time start with no data for every vendor
+        watchState["sockets"] = getSockets([watchState["sockets"], socketStores])
+        for marginType, cpuNum, marginName in getMarginTypes(list(socketStores)):
+            if not marginType in watchState["stores"]:
+                watchState["stores"][marginType] = [None] * vendorCount
+                watchState["accumulators"][marginType] = [None] * vendorCount
+                watchState["lanes"][marginType] = [None] * vendorCount
+                changed[marginType] = [False] * vendorCount
+            newStore = socketStores[cpuNum][marginName]
+
+            # rows of new files keep counting the files of the folder
+            newStore["fileIndex"] = newStore["fileIndex"] + len(watchState["seen"][i])
+
+            oldStore = watchState["stores"][marginType][i]
+            watchState["stores"][marginType][i] = newStore if oldStore is None else mergeMarginStores([oldStore, newStore])
+            if len(newStore["labels"]) == 0:
+                continue
+
+            if watchState["accumulators"][marginType][i] is None:
+                watchState["accumulators"][marginType][i] = makeAccumulator(len(newStore["values"]))
+            addToAccumulator(watchState["accumulators"][marginType][i], newStore["values"])
+            # only lane and CA lane margins have average bit margin graphs
+            if hasLanes(newStore):
+                watchState["lanes"][marginType][i] = mergeLaneGroups(watchState["lanes"][marginType][i], makeLaneGroups(newStore))
+            changed[marginType][i] = True
+
+        watchState["seen"][i] = watchState["seen"][i] + newFiles[i]
+        if rankVarList:
+            watchState["rankVarList"], watchState["caLaneVarList"] = rankVarList, caLaneVarList
+
+    return changed
+
+
+def printRunningStats(watchState, marginType, changedVendors):
+    """
+    printRunningStats prints the running mean and standard deviation of every variable of each changed vendor
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        marginType (str): type of margin
+        changedVendors (list): True for each vendor whose data changed
+
+    """
+    variableList = getVariableList(watchState, marginType)
+    for i in range(0, len(watchState["vendors"])):
+        accumulator = watchState["accumulators"][marginType][i]
+        if not changedVendors[i] or accumulator is None:
+            continue
+
+        means, medians, stdevs, iqrs = getAccumulatorStats(accumulator)
+        stats = [variableList[k] + " " + str(round(float(means[k]), 2)) + " (" + str(round(float(stdevs[k]), 2)) + ")"
+                 for k in range(0, min(len(variableList), len(means)))]
+        print(watchState["vendors"][i], marginType + ":", len(watchState["seen"][i]), "files,", accumulator["welford"]["count"], "rows, mean (SD):", ", ".join(stats))
+
+
+def getLaneGroups(watchState, marginType):
+    """
+    getLaneGroups gives the running lanes of each vendor of a margin, vendors with no lanes yet get empty lanes
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        marginType (str): type of margin
+
+    Returns:
+        list: contains lanes of each vendor from mergeLaneGroups
+
+    """
+    allLaneGroups = watchState["lanes"][marginType]
+    return [makeLaneGroups(watchState["stores"][marginType][i]) if allLaneGroups[i] is None else allLaneGroups[i] for i in range(0, len(allLaneGroups))]
+
+
+def getAccumulators(watchState, marginType):
+    """
+    getAccumulators gives the accumulators of each vendor of a margin
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        marginType (str): type of margin
+
+    Returns:
+        list: contains accumulator of each vendor, None if a vendor has no rows yet so the stores are counted again
+
+    """
+    allAccumulators = watchState["accumulators"][marginType]
+    if any(accumulator is None for accumulator in allAccumulators):
+        return None
+    return allAccumulators
+
+
+def getVariableList(watchState, marginType):
+    """
+    getVariableList gives the variables of a margin, like processData
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        marginType (str): type of margin
+
+    Returns:
+        list: contains all variables of margin
+
+    """
+    if "CA Lane" in marginType:
+        return watchState["caLaneVarList"]
+    return watchState["rankVarList"]
+
+
+def getVarNum(watchState, marginType):
+    """
+    getVarNum gives the number of variables to plot of a margin, like processData
+
+    Args:
+        watchState (dict): watch state from openWatchState
+        marginType (str): type of margin
+
+    Returns:
+        int: number of variables to plot, including the row name column
+
+    """
+    if "CA Lane" in marginType:
+        return len(watchState["stores"][marginType][0]["values"]) + 1
+
+    # rank margins use the variables of the lane margins of the same CPU
+    laneStores = watchState["stores"].get(marginType.replace("Rank", "Lane"))
+    if laneStores is not None and laneStores[0] is not None and len(laneStores[0]["labels"]) > 0:
+        return len(laneStores[0]["values"]) + 1
+    return len(watchState["stores"][marginType][0]["values"]) + 1
@@ -0,0 +1,121 @@
+# ----------------------------------------------
+# File name: test_DDR5_RMT_Accumulator.py
+# Date: 10/18/2026
+
+# Description: Checks the median, IQR, SD, histograms and box plots of the accumulator against numpy and matplotlib
+# on random margins, with exact counts and with neighbouring values counted together (sketch)
+
+# Usage:
+#   python -m pytest source
+
+# Assumption:
+#   1. Margins are int8 like the margin stores, added a few blocks at a time like readData adds files
+#   2. A sketch quantile is within one bin of the exact quantile, mean and SD stay exact
+# ----------------------------------------------
+
+import pytest
+import numpy as np
+
+from DDR5_RMT_Accumulator import makeAccumulator, addToAccumulator, getAccumulatorStats, getHistogram, getBoxStats, ACCUMULATOR_MAX_BINS
+
+
+def makeValues(seed, varCount=4, rowCount=5000):
+    """
+    makeValues makes random margins, one variable around 0 and the others spread over the whole int8 range
+
+    Args:
+        seed (int): seed of random numbers
+        varCount (int): number of variables
+        rowCount (int): number of rows
+
+    Returns:
+        array: contains data, one row per variable
+
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.integers(-128, 128, size=(varCount, rowCount)).astype(np.int8)
+    values[0] = np.clip(rng.normal(0, 6, rowCount).round(), -128, 127).astype(np.int8)
+    return values
+
+
+def makeTestAccumulator(values, maxBins, blockCount=3):
+    """
+    makeTestAccumulator adds the values to a new accumulator in a few blocks
+
+    Args:
+        values (array): contains data, one row per variable
+        maxBins (int): largest number of bins per variable, see makeAccumulator
+        blockCount (int): number of blocks the rows are added in
+
+    Returns:
+        dict: accumulator with every row added
+
+    """
+    accumulator = makeAccumulator(len(values), maxBins)
+    for block in np.array_split(np.arange(values.shape[1]), blockCount):
+        addToAccumulator(accumulator, values[:, block])
+    return accumulator
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_exactStats(seed):
+    values = makeValues(seed)
+    accumulator = makeTestAccumulator(values, ACCUMULATOR_MAX_BINS)
+    assert accumulator["binWidth"] == 1
+
+    mean, median, stdev, iqr = getAccumulatorStats(accumulator)
+    assert np.allclose(mean, values.mean(axis=1))
+    assert np.array_equal(median, np.median(values, axis=1))
+    assert np.allclose(stdev, np.std(values, axis=1, ddof=1))
+    q75, q25 = np.percentile(values, [75, 25], axis=1)
+    assert np.array_equal(iqr, q75 - q25)
+
+
+def test_exactHistogram():
+    values = makeValues(3)
+    accumulator = makeTestAccumulator(values, ACCUMULATOR_MAX_BINS)
+
+    for var in range(0, len(values)):
+        levels, counts, edges = getHistogram(accumulator, var)
+        low, high = int(values[var].min()), int(values[var].max())
+        assert levels.tolist() == list(range(low, high + 1))
+        assert counts.tolist() == np.bincount(values[var].astype(np.int64) - low).tolist()
+        assert edges.tolist() == list(range(low, high + 2))
+
+
+def test_exactBoxStats():
+    import matplotlib.cbook as cbook
+
+    values = makeValues(4)
+    accumulator = makeTestAccumulator(values, ACCUMULATOR_MAX_BINS)
+
+    for var in range(0, len(values)):
+        boxStats = getBoxStats(accumulator, var, "SK")
+        expected = cbook.boxplot_stats(values[var].astype(np.float64), labels=["SK"])[0]
+        for key in ["med", "q1", "q3", "iqr", "whislo", "whishi", "cilo", "cihi"]:
+            assert boxStats[key] == pytest.approx(expected[key])
+        assert sorted(boxStats["fliers"].tolist()) == sorted(expected["fliers"].tolist())
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sketchStats(seed):
+    values = makeValues(seed)
+
+    # 256 int8 values do not fit in 16 bins, so values are counted together in bins of 16
+    accumulator = makeTestAccumulator(values, 16)
+    binWidth = accumulator["binWidth"]
+    assert binWidth == 16
+    assert accumulator["counts"].shape[1] <= 16
+
+    mean, median, stdev, iqr = getAccumulatorStats(accumulator)
+    assert np.allclose(mean, values.mean(axis=1))
+    assert np.allclose(stdev, np.std(values, axis=1, ddof=1))
+    assert np.all(np.abs(median - np.median(values, axis=1)) <= binWidth)
+    q75, q25 = np.percentile(values, [75, 25], axis=1)
+    assert np.all(np.abs(iqr - (q75 - q25)) <= 2 * binWidth)
+
+    # every row is still counted, in the bin holding its value
+    for var in range(0, len(values)):
+        levels, counts, edges = getHistogram(accumulator, var)
+        assert counts.sum() == values.shape[1]
+        assert counts.tolist() == np.histogram(values[var], bins=edges - 0.5)[0].tolist()
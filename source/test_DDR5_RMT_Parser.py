@@ -0,0 +1,218 @@
+# ----------------------------------------------
+# File name: test_DDR5_RMT_Parser.py
+# Date: 10/18/2026
+
+# Description: Checks that parseLogFile gives the same rows and variable lists as the slicing parser it
+# replaced (legacyParseFile of DDR5_RMT_Benchmark.py) on small log files with the quirks of real captures
+
+# Usage:
+#   python -m pytest source
+
+# Assumption:
+#   1. Only CPU 0 and CPU 1 are compared, the legacy parser does not read other CPUs
+#   2. Margin stores of readLogFile only keep the full rows of parseLogFile, rows cut short are dropped
+#   3. Cut off captures give the same margin stores when they are parsed and when they are loaded from the cache
+# ----------------------------------------------
+
+import os
+import gzip
+import pytest
+import numpy as np
+
+from DDR5_RMT_Processing import parseLogFile, readLogFile, readData
+from DDR5_RMT_Benchmark import legacyParseFile
+
+
+RANK_HEADER = "            RxDqs-  RxDqs+  RxV-  RxV+  TxDq-  TxDq+  TxV-  TxV+\n"
+CA_HEADER = "            Ca-  Ca+  CaV-  CaV+\n"
+
+
+def makeCPULog(cpuNum, caStar=""):
+    """
+    makeCPULog makes the lines of one CPU with rank, lane and CA lane margins
+
+    Args:
+        cpuNum (int): CPU number
+        caStar (str): put after the CA lane names (e.g. '*'), '' for none
+
+    Returns:
+        list: contains lines of CPU data
+
+    """
+    tag = "N" + str(cpuNum)
+    lines = ["START_RMT_" + tag + "\n", "Rank Margin\n", RANK_HEADER]
+    lines += [tag + ".C" + str(channel) + ".D0.R" + str(rank) + ":   -2  27  30  19  0  30  19  23\n" for channel in range(0, 2) for rank in range(0, 2)]
+    lines += ["IoLevel = 1\n", "Lane Margin\n", RANK_HEADER]
+    lines += [tag + ".C0.D0.R0.L" + str(lane) + ":   " + str(lane) + "  3  -3  23  -29  -17  16  20\n" for lane in range(0, 4)]
+    lines += ["IoLevel = 1\n", "CA Lane Margin\n", CA_HEADER]
+    lines += [tag + ".C0.D0.R0.A" + str(lane) + caStar + ":   7  1  -9  " + str(lane) + "\n" for lane in range(0, 3)]
+    lines += ["IoLevel = 1\n", "STOP_RMT_" + tag + "\n"]
+    return lines
+
+
+def makeLog(caStar=""):
+    """
+    makeLog makes the lines of a log file with two CPUs between boot messages
+
+    Args:
+        caStar (str): put after the CA lane names, see makeCPULog
+
+    Returns:
+        list: contains lines of log file
+
+    """
+    return ["BIOS boot noise line\n", "Some other stuff N0 mention\n"] + makeCPULog(0, caStar) + ["\n"] + makeCPULog(1, caStar)
+
+
+def removeLines(lines, text, count=None):
+    """
+    removeLines removes the lines starting with text
+
+    Args:
+        lines (list): contains lines of log file
+        text (str): start of lines to remove
+        count (int): number of lines removed, first lines first, None for all
+
+    Returns:
+        list: contains the other lines
+
+    """
+    kept = []
+    for line in lines:
+        if line.startswith(text) and (count is None or count > 0):
+            count = None if count is None else count - 1
+            continue
+        kept.append(line)
+    return kept
+
+
+def insertLine(lines, after, line):
+    """
+    insertLine puts a line after the first line starting with after
+
+    Args:
+        lines (list): contains lines of log file
+        after (str): start of line to insert after
+        line (str): line to insert
+
+    Returns:
+        list: contains the lines with the new line
+
+    """
+    pos = [lineNum for lineNum in range(0, len(lines)) if lines[lineNum].startswith(after)][0] + 1
+    return lines[:pos] + [line] + lines[pos:]
+
+
+def cutAfter(lines, text):
+    """
+    cutAfter cuts a log file off right after the first time text is in it, like a capture stopped mid-record
+
+    Args:
+        lines (list): contains lines of log file
+        text (str): last text kept
+
+    Returns:
+        str: cut off log file
+
+    """
+    data = "".join(lines)
+    return data[:data.find(text) + len(text)]
+
+
+LOG_CASES = {
+    "complete": "".join(makeLog()),
+    "no IoLevel after lanes": "".join(removeLines(makeLog(), "IoLevel", 2)),
+    "no IoLevel at all": "".join(removeLines(makeLog(), "IoLevel")),
+    "starred CA rows": "".join(makeLog("*")),
+    "starred CA rows without IoLevel": "".join(removeLines(makeLog("*"), "IoLevel")),
+    "CPU 1 starts inside CPU 0": "".join(insertLine(makeLog(), "N0.C0.D0.R0.L1", "START_RMT_N1\n")),
+    "CPU 0 stops twice": "".join(insertLine(makeLog(), "N0.C0.D0.R0.L1", "STOP_RMT_N0\n")),
+    "markers on one line": "".join(makeLog()).replace("STOP_RMT_N0\n\nSTART_RMT_N1\n", "STOP_RMT_N0 START_RMT_N1\n"),
+    "repeated section header": "".join(insertLine(makeLog(), "N0.C0.D0.R0.L2", "Lane Margin\n")),
+    "rank header in CA lanes": "".join(insertLine(makeLog(), "N0.C0.D0.R0.A0", "Rank Margin\n")),
+    "cut mid-row": cutAfter(makeLog(), "N1.C0.D0.R0.L2:   2  3"),
+    "cut after row tag": cutAfter(makeLog(), "IoLevel = 1\nLane Margin\n" + RANK_HEADER + "N1"),
+    "cut mid-variables": cutAfter(makeLog(), "START_RMT_N1\nRank Margin\n            RxDqs-"),
+    "cut after variables": cutAfter(makeLog(), "START_RMT_N1\nRank Margin\n" + RANK_HEADER + "N1"),
+    "cut mid-IoLevel": cutAfter(makeLog(), "N1.C0.D0.R0.L3:   3  3  -3  23  -29  -17  16  20\nIoLevel"),
+    "cut in CA lanes": cutAfter(makeLog(), "N1.C0.D0.R0.A1:   7"),
+    "cut in header": cutAfter(makeLog(), "N1.C0.D0.R0.L3:   3  3  -3  23  -29  -17  16  20\nIoLevel = 1\nLane Marg"),
+}
+
+# captures stopped mid-record, read together as one folder
+CUT_CASES = [caseName for caseName in LOG_CASES if caseName.startswith("cut")]
+
+
+@pytest.mark.parametrize("caseName", list(LOG_CASES))
+def test_parseLogFileMatchesLegacy(tmp_path, caseName):
+    logPath = tmp_path / "log.txt"
+    logPath.write_text(LOG_CASES[caseName])
+
+    legacy = legacyParseFile(str(logPath))
+    parsed = parseLogFile(str(logPath))
+    assert {cpuNum: parsed[cpuNum] for cpuNum in parsed if cpuNum in ("0", "1")} == legacy
+
+    # prefetched and gzip compressed files go through the other readers
+    assert parseLogFile(str(logPath), logPath.read_bytes()) == parsed
+    gzipPath = tmp_path / "log.txt.gz"
+    gzipPath.write_bytes(gzip.compress(logPath.read_bytes()))
+    assert parseLogFile(str(gzipPath)) == parsed
+
+
+@pytest.mark.parametrize("caseName", list(LOG_CASES))
+def test_readLogFileStores(tmp_path, caseName):
+    logPath = tmp_path / "log.txt"
+    logPath.write_text(LOG_CASES[caseName])
+
+    parsed = parseLogFile(str(logPath))
+    fileData = readLogFile(str(logPath), 0, None, False)
+    assert sorted(fileData) == sorted(parsed)
+    for cpuNum in fileData:
+        for marginType in ["RankMargin", "LaneMargin", "CALaneMargin"]:
+            store = fileData[cpuNum][marginType]
+            assert store["values"].shape[1] == len(store["labels"]) == store["rowKeys"].shape[1] == len(store["fileIndex"])
+            assert set(store["labels"].tolist()) <= set(row[0] for row in parsed[cpuNum][marginType])
+
+
+def test_readLogFileCutRow(tmp_path):
+    logPath = tmp_path / "log.txt"
+    logPath.write_text(LOG_CASES["cut mid-row"])
+
+    fileData = readLogFile(str(logPath), 0, None, False)
+    assert fileData["1"]["LaneMargin"]["labels"].tolist() == ["N1.C0.D0.R0.L0:", "N1.C0.D0.R0.L1:"]
+    assert fileData["1"]["LaneMargin"]["values"][:, 1].tolist() == [1, 3, 3, 23, 29, 17, 16, 20]
+
+
+def test_readDataCutCache(tmp_path):
+    folderPath = tmp_path / "logs"
+    folderPath.mkdir()
+    for caseNum in range(0, len(CUT_CASES)):
+        (folderPath / ("log" + str(caseNum).zfill(2) + ".txt")).write_text(LOG_CASES[CUT_CASES[caseNum]])
+    folder = sorted(os.listdir(folderPath))
+    cacheDir = str(tmp_path / "cache")
+
+    # first read parses the files and caches them, second read loads them from the cache
+    parsed = readData(folder, str(folderPath), "SK", cacheDir=cacheDir)
+    assert len(os.listdir(cacheDir)) == len(folder)
+    cached = readData(folder, str(folderPath), "SK", cacheDir=cacheDir)
+
+    assert parsed[1:] == cached[1:]
+    assert sorted(parsed[0]) == sorted(cached[0]) == ["0", "1"]
+    for cpuNum in parsed[0]:
+        for marginType in ["RankMargin", "LaneMargin", "CALaneMargin"]:
+            for key in ["labels", "rowKeys", "values", "fileIndex"]:
+                assert np.array_equal(parsed[0][cpuNum][marginType][key], cached[0][cpuNum][marginType][key])
+    assert parsed[0]["1"]["LaneMargin"]["values"].shape[1] > 0
+
+
+def test_parseLogFileRows(tmp_path):
+    logPath = tmp_path / "log.txt"
+    logPath.write_text(LOG_CASES["complete"])
+
+    parsed = parseLogFile(str(logPath))
+    assert sorted(parsed) == ["0", "1"]
+    assert parsed["1"]["RankVarList"] == ["RxDqs-", "RxDqs+", "RxV-", "RxV+", "TxDq-", "TxDq+", "TxV-", "TxV+"]
+    assert parsed["1"]["CALaneVarList"] == ["Ca-", "Ca+", "CaV-", "CaV+"]
+    assert [row[0] for row in parsed["0"]["RankMargin"]] == ["N0.C0.D0.R0:", "N0.C0.D0.R1:", "N0.C1.D0.R0:", "N0.C1.D0.R1:"]
+    assert parsed["0"]["LaneMargin"][3] == ["N0.C0.D0.R0.L3:", "3", "3", "-3", "23", "-29", "-17", "16", "20"]
+    assert len(parsed["0"]["CALaneMargin"]) == 3